@@ -1,5 +1,9 @@
 from .note import Note
 from .rest import Rest
+from .frozen_note import FrozenNote
+from .frozen_rest import FrozenRest
 from .note_list import NoteList
+from .ordered_note_list import OrderedNoteList
 from .chord import Chord
-from .scale import Scale
\ No newline at end of file
+from .scale import Scale
+from .sequence import Sequence
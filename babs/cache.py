@@ -0,0 +1,199 @@
+from __future__ import division
+
+from collections import OrderedDict
+
+from babs.note import Note
+
+
+class LRUCache(object):
+    """
+    Mapping with a bounded size that evicts the least recently used items
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        :param maxsize: max number of items in cache, None for unbounded cache
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be greater than 0.')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        :param key: key of the item
+        :param default: value returned if key is not in cache
+        :return: cached item or default
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._items.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def put(self, key, value):
+        """
+        Add an item to cache, evicting the least recently used item if cache is full
+        :param key: key of the item
+        :param value: item
+        :return: None
+        """
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+        if self.maxsize is not None and len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def get_or_create(self, key, factory):
+        """
+        :param key: key of the item
+        :param factory: callable without arguments used to create the item if key is not in cache
+        :return: cached or created item
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            value = factory()
+            self.put(key, value)
+
+            return value
+
+        self._items.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def clear(self):
+        """
+        Remove all items and reset statistics
+        :return: None
+        """
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        :return: dict with hits, misses, size and maxsize
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._items), 'maxsize': self.maxsize}
+
+
+class SharedNote(Note):
+    """
+    Note shared by a NoteCache, it can't be changed. Copies (e.g transposed notes) are mutable notes
+    """
+
+    def __init__(self, freq=None, name=None, octave=4, alt=None, duration=4/4):
+        super().__init__(freq=freq, name=name, octave=octave, alt=alt, duration=duration)
+        object.__setattr__(self, '_shared', True)
+
+    def __setattr__(self, key, value):
+        if '_shared' in self.__dict__:
+            raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+        object.__setattr__(self, key, value)
+
+    def __delattr__(self, key):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __copy__(self):
+        return Note._from_values(self._freq, self._name, self._octave, self._alt, self._pitch, self.duration)
+
+    @classmethod
+    def _from_values(cls, freq, name, octave, alt, pitch, duration):
+        return Note._from_values(freq, name, octave, alt, pitch, duration)
+
+
+class NoteCache(LRUCache):
+    """
+    Cache of shared Note instances, one for every distinct (freq, name, octave, alt, duration) and tuning
+    (A_FREQUENCY). Notes returned by the cache are shared, by default they are SharedNote that can't be changed
+    """
+
+    def __init__(self, maxsize=1024, note_class=SharedNote):
+        """
+        :param maxsize: max number of notes in cache, None for unbounded cache
+        :param note_class: class used to create notes
+        """
+        super().__init__(maxsize=maxsize)
+        self.note_class = note_class
+
+    def get_note(self, freq=None, name=None, octave=4, alt=None, duration=4/4):
+        """
+        :param freq: frequency
+        :param name: name of the note
+        :param octave: note's position on a standard 88-key piano keyboard
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :param duration: relative duration of the note
+        :return: shared Note, SharedNote by default
+        """
+        # notes of other classes (e.g FrozenNote) are built from Note
+        tuning = self.note_class if issubclass(self.note_class, Note) else Note
+
+        return self.get_or_create(
+            (freq, name, octave, alt, duration, tuning.A_FREQUENCY, tuning.HALF_STEP_INTERVAL),
+            lambda: self.note_class(freq=freq, name=name, octave=octave, alt=alt, duration=duration)
+        )
+
+
+class NoteListCache(LRUCache):
+    """
+    Cache of note lists created from a root (e.g Chord.create_from_root), one for every distinct root, type and options.
+    Cached note lists are returned as copies, or shared when requested, so shared note lists must not be changed
+    """
+
+    @staticmethod
+    def get_key(note_list_class, root, note_list_type, *options):
+        """
+        :param note_list_class: class of the note list
+        :param root: root note
+        :param note_list_type: a list of notes distance from root note
+        :param options: other arguments used to create the note list (e.g octave, alt)
+        :return: key of the note list, notes other than root are created by name so the tuning (A_FREQUENCY) is part of it
+        """
+        return (
+            note_list_class, root.freq, root.name, root.octave, root.alt, root.duration, tuple(note_list_type),
+            Note.A_FREQUENCY, Note.HALF_STEP_INTERVAL
+        ) + options
+
+    def get_note_list(self, key, factory, shared=False):
+        """
+        :param key: key of the note list
+        :param factory: callable without arguments used to create the note list if key is not in cache
+        :param shared: return the cached note list instead of a copy
+        :return: note list
+        """
+        note_list = self.get_or_create(key, factory)
+
+        return note_list if shared else note_list.copy()
+
+    def warm(self, note_list_class, root_octaves=(4,), root_alt=None, **kwargs):
+        """
+        Create note lists of all types defined in class (e.g Chord.MAJOR_TYPE) for all 12 roots
+        :param note_list_class: class with create_from_root (e.g Chord, Scale)
+        :param root_octaves: octaves of root notes
+        :param root_alt: alteration of root notes
+        :param kwargs: other arguments of create_from_root (e.g octave, alt)
+        :return: None
+        """
+        for root_octave in root_octaves:
+            for idx in range(len(Note.NOTES)):
+                root = Note(name=Note.get_note_name_by_index(idx, alt=root_alt), octave=root_octave, alt=root_alt)
+                for note_list_type in note_list_class.get_types().values():
+                    note_list_class.create_from_root(root, note_list_type, memo=self, shared=True, **kwargs)
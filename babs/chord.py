@@ -1,9 +1,15 @@
-from babs import Note, NoteList
+from collections import namedtuple
+
+from babs import Note, NoteList, OrderedNoteList, instrumentation
+from babs.pitch_class_set import PitchClassSet
 
 from babs.exceptions import ChordException
 
 
-class Chord(NoteList):
+ChordIdentity = namedtuple('ChordIdentity', ['root', 'chord_type', 'inversion'])
+
+
+class Chord(OrderedNoteList):
     """
     Any harmonic set of pitches consisting of two or more notes
     """
@@ -29,6 +35,8 @@ class Chord(NoteList):
     SUS2_SEVEN_TYPE = [2, 7, 10]
     SUS2_MAJOR_SEVEN_TYPE = [2, 7, 11]
 
+    _identification_table = None
+
     def __init__(self, *notes, **kwargs):
         """
         :param notes: list of notes
@@ -38,10 +46,6 @@ class Chord(NoteList):
         super().__init__(*notes, strict=kwargs.pop('strict', True), invalid_exception=ChordException)
         self._order()
 
-    def _order(self):
-        if self.is_valid():
-            self._notes.sort(key=lambda note: note.freq, reverse=False)
-
     def is_valid(self):
         """
         Check if chord is valid
@@ -64,7 +68,6 @@ class Chord(NoteList):
         :return: None
         """
         super().add_note(note=note, strict=strict)
-        self._order()
 
     def remove_note(self, note=None, freq=None, name=None, octave=None, strict=True):
         """
@@ -77,26 +80,222 @@ class Chord(NoteList):
         :return: None
         """
         super().remove_note(note=note, freq=freq, name=name, octave=octave, strict=strict)
-        self._order()
+
+    def get_root_index(self):
+        """
+        :return: index of the root note, root of the first identity found or index of the lowest note if chord is not a known type
+        """
+        bass = self._notes[0].get_note_index()
+        identities = self.get_identification_table().get((self.pitch_class_set.mask, bass))
+
+        return identities[0][0] if identities else bass
+
+    def voicings(self, low=48, high=84, voices=None, max_span=None, min_spacing=1, root_position=False, doubling=None, alt=None, as_pitches=False):
+        """
+        Lazily generate voicings of the chord (inversions, open and close positions, drop voicings, octave spreads)
+        in ascending order of pitches, every pitch class of the chord is used at least once
+        :param low: lowest pitch (MIDI convention, C4 = 60)
+        :param high: highest pitch
+        :param voices: number of notes, default number of pitch classes of the chord
+        :param max_span: max distance in half steps between lowest and highest note, None for no limit
+        :param min_spacing: min distance in half steps between adjacent notes
+        :param root_position: if True the root is the lowest note
+        :param doubling: pitch classes that could be doubled when voices are more than pitch classes, 'root' for root only. None for all
+        :param alt: note alteration 'sharp' or 'flat' used for note names
+        :param as_pitches: generate tuples of pitches instead of chords
+        :return: generator of Chord or of tuple of pitches
+        """
+        root = self.get_root_index()
+        pitch_class_set = self.pitch_class_set
+
+        if doubling == 'root':
+            doubling = PitchClassSet(root)
+        elif doubling is not None:
+            doubling = PitchClassSet(*doubling)
+
+        generator = self.generate_voicings(
+            pitch_class_set,
+            low=low,
+            high=high,
+            voices=len(pitch_class_set) if voices is None else voices,
+            max_span=max_span,
+            min_spacing=min_spacing,
+            bass=root if root_position else None,
+            doubling=doubling
+        )
+
+        if as_pitches:
+            return generator
+
+        duration = max(n.duration for n in self._notes)
+
+        return (
+            type(self)(*[Note.from_pitch(p, alt=alt, duration=duration) for p in pitches], strict=False)
+            for pitches in generator
+        )
+
+    @staticmethod
+    def generate_voicings(pitch_class_set, low, high, voices, max_span=None, min_spacing=1, bass=None, doubling=None):
+        """
+        Lazily generate voicings of a set of pitch classes, branches that can't satisfy the constraints are pruned
+        :param pitch_class_set: PitchClassSet of the chord
+        :param low: lowest pitch
+        :param high: highest pitch
+        :param voices: number of notes
+        :param max_span: max distance in half steps between lowest and highest note, None for no limit
+        :param min_spacing: min distance in half steps between adjacent notes, at least 1
+        :param bass: pitch class of the lowest note, None for any
+        :param doubling: PitchClassSet of pitch classes that could be doubled, None for all
+        :return: generator of tuples of ascending pitches
+        """
+        size = PitchClassSet.SIZE
+        pitches = [p for p in range(low, high + 1) if p % size in pitch_class_set]
+        min_spacing = max(min_spacing, 1)
+        doubling_mask = PitchClassSet.FULL_MASK if doubling is None else doubling.mask
+        chosen = []
+
+        def build(start, missing):
+            if len(chosen) == voices:
+                if missing == 0:
+                    yield tuple(chosen)
+                return
+
+            slots = voices - len(chosen) - 1
+            for i in range(start, len(pitches)):
+                pitch = pitches[i]
+                if len(chosen) > 0:
+                    if max_span is not None and pitch - chosen[0] > max_span:
+                        return
+                    if pitch - chosen[-1] < min_spacing:
+                        continue
+                elif bass is not None and pitch % size != bass % size:
+                    continue
+
+                bit = 1 << (pitch % size)
+                if not missing & bit and not doubling_mask & bit:
+                    continue
+
+                left = missing & ~bit
+                if bin(left).count('1') > slots:
+                    continue
+
+                chosen.append(pitch)
+                for voicing in build(i + 1, left):
+                    yield voicing
+                chosen.pop()
+
+        return build(0, pitch_class_set.mask)
+
+    def identify(self, alt=None):
+        """
+        Find root, type and inversion of the chord
+        :param alt: note alteration 'sharp' or 'flat' used for root name
+        :return: list of ChordIdentity, root position chords first. empty list if chord is not a known type
+        """
+        if not self.is_valid():
+            return []
+
+        return self._identify(self.pitch_class_set.mask, self._notes[0].get_note_index(), alt=alt)
+
+    @classmethod
+    def identify_many(cls, chords, alt=None):
+        """
+        :param chords: iterable of Chord or of list of notes
+        :param alt: note alteration 'sharp' or 'flat' used for root name
+        :return: list with the result of identify for every chord
+        """
+        return [cls.identify_notes(c.notes if isinstance(c, NoteList) else c, alt=alt) for c in chords]
+
+    @classmethod
+    def identify_notes(cls, notes, alt=None):
+        """
+        :param notes: list of notes, the lowest note is the bass
+        :param alt: note alteration 'sharp' or 'flat' used for root name
+        :return: list of ChordIdentity, root position chords first. empty list if notes are not a known chord type
+        """
+        notes = list(notes)
+        if len(notes) < 1:
+            return []
+
+        bass = min(notes, key=lambda note: note.freq)
+
+        return cls._identify(PitchClassSet.from_notes(notes).mask, bass.get_note_index(), alt=alt)
+
+    @classmethod
+    def _identify(cls, mask, bass, alt=None):
+        return [
+            ChordIdentity(Note.get_note_name_by_index(root, alt=alt), chord_type, inversion)
+            for root, chord_type, inversion in cls.get_identification_table().get((mask, bass), [])
+        ]
 
     @classmethod
-    def create_from_root(cls, root, chord_type=None, octave=NoteList.OCTAVE_TYPE_ROOT, alt=Note.SHARP, strict=True):
+    def get_identification_table(cls):
+        """
+        :return: dict (pitch class bitmask, bass note index) => list of (root index, chord type name, inversion),
+            for every root and inversion of every chord type defined in class
+        """
+        if cls.__dict__.get('_identification_table') is None:
+            notes = len(Note.NOTES)
+            table = {}
+            for chord_type, distances in cls.get_types().items():
+                intervals = sorted(set(d % notes for d in [0] + distances))
+                pitch_class_set = PitchClassSet(*intervals)
+                for root in range(notes):
+                    mask = pitch_class_set.transpose(root).mask
+                    for inversion, interval in enumerate(intervals):
+                        table.setdefault((mask, (root + interval) % notes), []).append((root, chord_type, inversion))
+
+            for identities in table.values():
+                identities.sort(key=lambda identity: identity[2])
+
+            cls._identification_table = table
+
+        return cls._identification_table
+
+    def compatible_scales(self, alt=None, matrix=None):
+        """
+        :param alt: note alteration 'sharp' or 'flat' used for root names
+        :param matrix: CompatibilityMatrix, default is the matrix of all Chord and Scale types
+        :return: tuple of ScaleMatch(root, scale_type) of scales that contain all notes of the chord
+        """
+        if matrix is None:
+            from babs.compatibility import CompatibilityMatrix
+
+            matrix = CompatibilityMatrix.get_default()
+
+        return matrix.compatible_scales(self.pitch_class_set, alt=alt)
+
+    @classmethod
+    @instrumentation.timed('chord.create_from_root')
+    def create_from_root(cls, root, chord_type=None, octave=NoteList.OCTAVE_TYPE_ROOT, alt=Note.SHARP, strict=True, cache=None, memo=None, shared=False):
         """
         :param root: root note
         :param chord_type: a list of notes distance from root note
         :param octave: octave of notes in chord
         :param alt: note alteration 'sharp' or 'flat'
+        :param cache: NoteCache used to get shared notes instead of creating new ones
+        :param memo: NoteListCache used to reuse chords already created, ignored if octave is callable or cache is given
+        :param shared: return the chord cached in memo instead of a copy, it must not be changed
         :type root: Note
         :type chord_type: list
         :type octave: Union[int, string, callable]
         :type alt: string
+        :type cache: NoteCache
+        :type memo: NoteListCache
         :return: Chord
         """
 
         if chord_type is None:
             chord_type = cls.MAJOR_TYPE
-        
-        notes = NoteList.get_notes_from_root(root=root, note_list_type=chord_type, octave=octave, alt=alt)
+
+        if memo is not None and cache is None and not callable(octave):
+            return memo.get_note_list(
+                memo.get_key(cls, root, chord_type, octave, alt, strict),
+                lambda: cls.create_from_root(root=root, chord_type=chord_type, octave=octave, alt=alt, strict=strict).copy(),
+                shared=shared
+            )
+
+        notes = NoteList.get_notes_from_root(root=root, note_list_type=chord_type, octave=octave, alt=alt, cache=cache)
 
         return cls(
             *notes,
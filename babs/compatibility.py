@@ -0,0 +1,111 @@
+from collections import namedtuple
+
+from babs import Note, Chord, Scale
+from babs.pitch_class_set import PitchClassSet
+
+
+ChordMatch = namedtuple('ChordMatch', ['root', 'chord_type'])
+ScaleMatch = namedtuple('ScaleMatch', ['root', 'scale_type'])
+
+
+class CompatibilityMatrix(object):
+    """
+    Precomputed compatibility between scales and chords of every root.
+    A chord is compatible with a scale if all its pitch classes are in the scale
+    """
+
+    _default = None
+
+    def __init__(self, scale_types=None, chord_types=None):
+        """
+        :param scale_types: dict scale type name => list of notes distance from root, default Scale.get_types()
+        :param chord_types: dict chord type name => list of notes distance from root, default Chord.get_types()
+        """
+        self.scale_types = Scale.get_types() if scale_types is None else scale_types
+        self.chord_types = Chord.get_types() if chord_types is None else chord_types
+
+        self._scales = self._get_masks(self.scale_types)
+        self._chords = self._get_masks(self.chord_types)
+
+        self._chords_by_scale = {}
+        self._scales_by_chord = {}
+        self._matches = {}
+
+        for scale_mask in set(mask for mask, root, scale_type in self._scales):
+            self._get_chords(scale_mask)
+
+        for chord_mask in set(mask for mask, root, chord_type in self._chords):
+            self._get_scales(chord_mask)
+
+    @staticmethod
+    def _get_masks(types):
+        """
+        :return: list of (mask, root, type name) for every root of every type
+        """
+        masks = []
+        for name, distances in types.items():
+            pitch_class_set = PitchClassSet(0, *distances)
+            for root in range(PitchClassSet.SIZE):
+                masks.append((pitch_class_set.transpose(root).mask, root, name))
+
+        return masks
+
+    def _get_chords(self, scale_mask):
+        chords = self._chords_by_scale.get(scale_mask)
+        if chords is None:
+            chords = tuple((root, chord_type) for mask, root, chord_type in self._chords if mask & ~scale_mask == 0)
+            self._chords_by_scale[scale_mask] = chords
+
+        return chords
+
+    def _get_scales(self, chord_mask):
+        scales = self._scales_by_chord.get(chord_mask)
+        if scales is None:
+            scales = tuple((root, scale_type) for mask, root, scale_type in self._scales if chord_mask & ~mask == 0)
+            self._scales_by_chord[chord_mask] = scales
+
+        return scales
+
+    def compatible_chords(self, pitch_class_set, alt=None):
+        """
+        :param pitch_class_set: PitchClassSet of the scale
+        :param alt: note alteration 'sharp' or 'flat' used for root names
+        :return: tuple of ChordMatch(root, chord_type) of chords that fit in the scale
+        """
+        key = ('chords', pitch_class_set.mask, alt)
+        matches = self._matches.get(key)
+        if matches is None:
+            matches = tuple(
+                ChordMatch(Note.get_note_name_by_index(root, alt=alt), chord_type)
+                for root, chord_type in self._get_chords(pitch_class_set.mask)
+            )
+            self._matches[key] = matches
+
+        return matches
+
+    def compatible_scales(self, pitch_class_set, alt=None):
+        """
+        :param pitch_class_set: PitchClassSet of the chord
+        :param alt: note alteration 'sharp' or 'flat' used for root names
+        :return: tuple of ScaleMatch(root, scale_type) of scales that contain the chord
+        """
+        key = ('scales', pitch_class_set.mask, alt)
+        matches = self._matches.get(key)
+        if matches is None:
+            matches = tuple(
+                ScaleMatch(Note.get_note_name_by_index(root, alt=alt), scale_type)
+                for root, scale_type in self._get_scales(pitch_class_set.mask)
+            )
+            self._matches[key] = matches
+
+        return matches
+
+    @classmethod
+    def get_default(cls):
+        """
+        :return: shared CompatibilityMatrix of all Scale and Chord types
+        """
+        if cls._default is None:
+            cls._default = cls()
+
+        return cls._default
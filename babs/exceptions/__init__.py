@@ -1,4 +1,6 @@
 from .note_exception import NoteException
 from .note_list_exception import NoteListException
 from .chord_exception import ChordException
-from .scale_exception import ScaleException
\ No newline at end of file
+from .scale_exception import ScaleException
+from .midi_exception import MidiException
+from .tuning_exception import TuningException
\ No newline at end of file
@@ -0,0 +1,2 @@
+class MidiException(Exception):
+    pass
@@ -0,0 +1,2 @@
+class TuningException(Exception):
+    pass
@@ -0,0 +1,105 @@
+from __future__ import division
+
+from babs.note import Note
+
+
+class FrozenNote(object):
+    """
+    Immutable musical note: the pitch and the duration of a sound
+    """
+
+    __slots__ = ('_freq', '_name', '_octave', '_alt', '_pitch', '_duration')
+
+    def __init__(self, freq=None, name=None, octave=4, alt=None, duration=4/4):
+        """
+        :param freq: frequency
+        :param name: name of the note
+        :param octave: note's position on a standard 88-key piano keyboard
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :param duration: relative duration of the note
+        """
+        note = Note(freq=freq, name=name, octave=octave, alt=alt, duration=duration)
+        self._set_values(note.freq, note.name, note.octave, note.alt, note.pitch, note.duration)
+
+    def _set_values(self, freq, name, octave, alt, pitch, duration):
+        object.__setattr__(self, '_freq', freq)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_octave', octave)
+        object.__setattr__(self, '_alt', alt)
+        object.__setattr__(self, '_pitch', pitch)
+        object.__setattr__(self, '_duration', duration)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __eq__(self, other):
+        return self._freq == other.freq and self._duration == other.duration
+
+    def __ne__(self, other):
+        return self._freq != other.freq or self._duration != other.duration
+
+    def __hash__(self):
+        return hash((self._freq, self._duration))
+
+    def __str__(self):
+        return "{}{}".format(self._name, self._octave)
+
+    def __repr__(self):
+        return "FrozenNote(freq={}, alt='{}', duration={})".format(self._freq, self._alt, self._duration)
+
+    def __reduce__(self):
+        return self._from_values, (self._freq, self._name, self._octave, self._alt, self._pitch, self._duration)
+
+    @property
+    def freq(self):
+        return self._freq
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def octave(self):
+        return self._octave
+
+    @property
+    def alt(self):
+        return self._alt
+
+    @property
+    def pitch(self):
+        return self._pitch
+
+    @property
+    def duration(self):
+        return self._duration
+
+    def get_note_index(self):
+        """
+        :return: position of the note in Note.NOTES
+        """
+        return Note.NOTE_INDEXES[self._name]
+
+    def to_note(self):
+        """
+        :return: mutable Note with the same values
+        """
+        return Note._from_values(self._freq, self._name, self._octave, self._alt, self._pitch, self._duration)
+
+    @classmethod
+    def from_note(cls, note):
+        """
+        :param note: Note
+        :return: FrozenNote with the same values of note
+        """
+        return cls._from_values(note.freq, note.name, note.octave, note.alt, note.pitch, note.duration)
+
+    @classmethod
+    def _from_values(cls, freq, name, octave, alt, pitch, duration):
+        note = cls.__new__(cls)
+        note._set_values(freq, name, octave, alt, pitch, duration)
+
+        return note
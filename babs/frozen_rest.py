@@ -0,0 +1,68 @@
+from __future__ import division
+
+from babs.rest import Rest
+
+
+class FrozenRest(object):
+    """
+    Immutable interval of silence
+    """
+
+    __slots__ = ('_duration',)
+
+    def __init__(self, duration=4/4):
+        """
+        :param duration: relative duration of the rest
+        """
+        object.__setattr__(self, '_duration', duration)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __delattr__(self, key):
+        raise AttributeError('{} is immutable.'.format(type(self).__name__))
+
+    def __eq__(self, other):
+        return self._duration == other.duration
+
+    def __ne__(self, other):
+        return self._duration != other.duration
+
+    def __lt__(self, other):
+        return self._duration < other.duration
+
+    def __le__(self, other):
+        return self._duration <= other.duration
+
+    def __gt__(self, other):
+        return self._duration > other.duration
+
+    def __ge__(self, other):
+        return self._duration >= other.duration
+
+    def __hash__(self):
+        return hash(self._duration)
+
+    def __repr__(self):
+        return "FrozenRest(duration={})".format(self._duration)
+
+    def __reduce__(self):
+        return type(self), (self._duration,)
+
+    @property
+    def duration(self):
+        return self._duration
+
+    def to_rest(self):
+        """
+        :return: mutable Rest with the same duration
+        """
+        return Rest(duration=self._duration)
+
+    @classmethod
+    def from_rest(cls, rest):
+        """
+        :param rest: Rest
+        :return: FrozenRest with the same duration of rest
+        """
+        return cls(duration=rest.duration)
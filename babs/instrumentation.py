@@ -0,0 +1,289 @@
+from __future__ import division
+
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+
+# True when counters and timers are recorded, changed by enable, disable and capture.
+# When disabled instrumented code only checks this flag
+ENABLED = False
+
+_lock = threading.Lock()
+_local = threading.local()
+_exporters = []
+_enabled_globally = False
+_active_captures = 0
+
+
+class Stats(object):
+    """
+    Counters and timers recorded while instrumentation is enabled
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.timers = {}
+
+    def __repr__(self):
+        return 'Stats(counters={}, timers={})'.format(self.counters, self.timers)
+
+    def increment(self, name, value=1):
+        """
+        :param name: name of the counter
+        :param value: value added to the counter
+        :return: None
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_time(self, name, seconds):
+        """
+        :param name: name of the timer
+        :param seconds: duration of a call
+        :return: None
+        """
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+    def merge(self, other):
+        """
+        :param other: Stats added to this one
+        :return: None
+        """
+        for name, value in other.counters.items():
+            self.increment(name, value)
+
+        for name, (calls, total, longest) in other.timers.items():
+            timer = self.timers.setdefault(name, [0, 0, 0])
+            timer[0] += calls
+            timer[1] += total
+            timer[2] = max(timer[2], longest)
+
+    def reset(self):
+        """
+        :return: None
+        """
+        self.counters = {}
+        self.timers = {}
+
+    def as_dict(self):
+        """
+        :return: dict with counters (name => value) and timers (name => dict with calls, total and max seconds)
+        """
+        return {
+            'counters': dict(self.counters),
+            'timers': {
+                name: {'calls': calls, 'total': total, 'max': longest}
+                for name, (calls, total, longest) in self.timers.items()
+            }
+        }
+
+    def report(self):
+        """
+        :return: text table of timers from the longest total time and of counters
+        """
+        lines = ['{:<40} {:>10} {:>14} {:>14}'.format('timer', 'calls', 'total ms', 'max ms')]
+        for name, (calls, total, longest) in sorted(self.timers.items(), key=lambda item: -item[1][1]):
+            lines.append('{:<40} {:>10} {:>14.3f} {:>14.3f}'.format(name, calls, total * 1000, longest * 1000))
+
+        lines.append('{:<40} {:>10}'.format('counter', 'value'))
+        for name, value in sorted(self.counters.items()):
+            lines.append('{:<40} {:>10}'.format(name, value))
+
+        return '\n'.join(lines)
+
+
+_totals = Stats()
+
+
+def _update_enabled():
+    global ENABLED
+
+    ENABLED = _enabled_globally or _active_captures > 0
+
+
+def enable():
+    """
+    Start recording counters and timers
+    :return: None
+    """
+    global _enabled_globally
+
+    with _lock:
+        _enabled_globally = True
+        _update_enabled()
+
+
+def disable():
+    """
+    Stop recording counters and timers outside of captures, recorded stats are kept
+    :return: None
+    """
+    global _enabled_globally
+
+    with _lock:
+        _enabled_globally = False
+        _update_enabled()
+
+
+def is_enabled():
+    """
+    :return: bool
+    """
+    return ENABLED
+
+
+def get_stats():
+    """
+    :return: copy of the Stats recorded in every thread since the last reset
+    """
+    stats = Stats()
+    with _lock:
+        stats.merge(_totals)
+
+    return stats
+
+
+def reset():
+    """
+    Forget the stats recorded in every thread
+    :return: None
+    """
+    with _lock:
+        _totals.reset()
+
+
+def _get_captures():
+    captures = getattr(_local, 'captures', None)
+    if captures is None:
+        captures = _local.captures = []
+
+    return captures
+
+
+def increment(name, value=1):
+    """
+    Add value to a counter of the global stats and of the captures of the current thread, if enabled
+    :param name: name of the counter (e.g 'note.create')
+    :param value: value added
+    :return: None
+    """
+    if not ENABLED:
+        return
+
+    with _lock:
+        _totals.increment(name, value)
+
+    for stats in _get_captures():
+        stats.increment(name, value)
+
+
+def add_time(name, seconds):
+    """
+    Record a call of a timer in the global stats and in the captures of the current thread, if enabled
+    :param name: name of the timer (e.g 'chord.create_from_root')
+    :param seconds: duration of the call
+    :return: None
+    """
+    if not ENABLED:
+        return
+
+    with _lock:
+        _totals.add_time(name, seconds)
+
+    for stats in _get_captures():
+        stats.add_time(name, seconds)
+
+
+@contextmanager
+def timer(name):
+    """
+    Time the block with a timer, if enabled
+    :param name: name of the timer
+    :return: context manager
+    """
+    if not ENABLED:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time(name, time.perf_counter() - start)
+
+
+def timed(name):
+    """
+    Decorator that times every call of the function, if enabled.
+    When disabled the only cost is the check of ENABLED
+    :param name: name of the timer
+    :return: decorator
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add_time(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def add_exporter(exporter):
+    """
+    :param exporter: callable that receives the Stats of every capture when it ends (e.g to send them to a metrics system)
+    :return: None
+    """
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter):
+    """
+    :param exporter: callable added with add_exporter
+    :return: None
+    """
+    _exporters.remove(exporter)
+
+
+@contextmanager
+def capture(export=True):
+    """
+    Record the stats of the block in the current thread (e.g of a request), instrumentation is enabled in the block.
+    Captures can be nested, stats are recorded in every active capture
+    :param export: call exporters with the stats when the block ends
+    :return: context manager that gives the Stats of the block
+    """
+    global _active_captures
+
+    stats = Stats()
+    captures = _get_captures()
+    captures.append(stats)
+    with _lock:
+        _active_captures += 1
+        _update_enabled()
+
+    try:
+        yield stats
+    finally:
+        captures.remove(stats)
+        with _lock:
+            _active_captures -= 1
+            _update_enabled()
+
+        if export:
+            for exporter in list(_exporters):
+                exporter(stats)
@@ -0,0 +1,127 @@
+from __future__ import division
+
+from collections import namedtuple
+
+import numpy as np
+
+from babs import Note, NoteList, Scale
+from babs.pitch_class_set import PitchClassSet
+
+
+KeyEstimate = namedtuple('KeyEstimate', ['root', 'scale_type', 'score'])
+
+
+class KeyDetector(object):
+    """
+    Streaming key detection.
+    Keep a duration weighted pitch class histogram of the notes received so far, with an optional exponential decay,
+    and score every key by correlation between the histogram and the key profile
+    """
+
+    TONIC_WEIGHT = 2
+
+    def __init__(self, half_life=None, scale_types=None, alt=None):
+        """
+        :param half_life: relative duration after which the weight of a note is halved, None for no decay
+        :param scale_types: dict scale type name => list of notes distance from root, default major and minor
+        :param alt: note alteration 'sharp' or 'flat' used for root names
+        """
+        if half_life is not None and half_life <= 0:
+            raise ValueError('half_life must be greater than 0.')
+
+        if scale_types is None:
+            scale_types = {'MAJOR_TYPE': Scale.MAJOR_TYPE, 'MINOR_TYPE': Scale.MINOR_TYPE}
+
+        self.half_life = half_life
+        self.alt = alt
+        self.keys = []
+
+        profiles = []
+        for scale_type, distances in scale_types.items():
+            for root in range(PitchClassSet.SIZE):
+                profile = np.zeros(PitchClassSet.SIZE)
+                profile[list(PitchClassSet(0, *distances).transpose(root))] = 1
+                profile[root] = self.TONIC_WEIGHT
+                profiles.append(profile)
+                self.keys.append((Note.get_note_name_by_index(root, alt=alt), scale_type))
+
+        profiles = np.array(profiles)
+        profiles -= profiles.mean(axis=1, keepdims=True)
+        self._profiles = profiles / np.linalg.norm(profiles, axis=1, keepdims=True)
+
+        self._decay = None if half_life is None else 0.5 ** (1 / half_life)
+        self._histogram = np.zeros(PitchClassSet.SIZE)
+
+    @property
+    def histogram(self):
+        """
+        :return: copy of the current pitch class histogram
+        """
+        return self._histogram.copy()
+
+    def reset(self):
+        """
+        Forget all notes received
+        :return: None
+        """
+        self._histogram[:] = 0
+
+    def update(self, event):
+        """
+        :param event: Note, Rest or NoteList (e.g Chord). notes of a NoteList sound together
+        :return: None
+        """
+        if isinstance(event, NoteList):
+            notes = event.notes
+            duration = max(n.duration for n in notes) if len(notes) > 0 else 0
+        elif hasattr(event, 'get_note_index'):
+            notes = [event]
+            duration = event.duration
+        else:
+            notes = []
+            duration = event.duration
+
+        if self._decay is not None and duration > 0:
+            self._histogram *= self._decay ** duration
+
+        for n in notes:
+            self._histogram[n.get_note_index()] += n.duration
+
+    def feed(self, events):
+        """
+        :param events: iterable of Note, Rest or NoteList
+        :return: generator of the estimated key after every event
+        """
+        for event in events:
+            self.update(event)
+            yield self.key()
+
+    def scores(self):
+        """
+        :return: array with the correlation between the histogram and every key in self.keys
+        """
+        centered = self._histogram - self._histogram.mean()
+        norm = np.linalg.norm(centered)
+        if norm == 0:
+            return np.zeros(len(self.keys))
+
+        return self._profiles.dot(centered) / norm
+
+    def ranking(self, limit=None):
+        """
+        :param limit: max number of keys returned, None for all keys
+        :return: list of KeyEstimate from the most to the least probable
+        """
+        scores = self.scores()
+        order = np.argsort(-scores, kind='stable')[:limit]
+
+        return [KeyEstimate(self.keys[i][0], self.keys[i][1], float(scores[i])) for i in order]
+
+    def key(self):
+        """
+        :return: most probable KeyEstimate or None if no note has been received
+        """
+        if not self._histogram.any():
+            return None
+
+        return self.ranking(limit=1)[0]
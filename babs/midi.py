@@ -0,0 +1,411 @@
+from __future__ import division
+
+import struct
+from array import array
+from collections import namedtuple
+
+import numpy as np
+
+from babs import Note, Rest, Chord, NoteList
+from babs.note_array import NoteArray
+from babs.exceptions import MidiException
+
+
+MidiNotes = namedtuple('MidiNotes', ['ticks_per_beat', 'tempo', 'track', 'channel', 'pitch', 'velocity', 'onset', 'length'])
+
+DEFAULT_TEMPO = 120
+DEFAULT_TICKS_PER_BEAT = 480
+
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+META = 0xFF
+META_TEMPO = 0x51
+META_END_OF_TRACK = 0x2F
+SYSEX = (0xF0, 0xF7)
+
+_DATA_LENGTHS = {0x80: 2, 0x90: 2, 0xA0: 2, 0xB0: 2, 0xC0: 1, 0xD0: 1, 0xE0: 2}
+_COLUMNS = ('tick', 'on', 'key', 'velocity')
+
+
+def _read_varlen(data, position):
+    value = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value = (value << 7) | (byte & 0x7F)
+        if byte < 0x80:
+            return value, position
+
+
+def _write_varlen(value, out):
+    buffer = [value & 0x7F]
+    value >>= 7
+    while value > 0:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    out.extend(reversed(buffer))
+
+
+def _decode_track(data, position, end, track, columns):
+    """
+    Append note on/off events of a track to columns
+    :return: tempo in microseconds per beat of the first tempo event, None if not found
+    """
+    tick = 0
+    status = 0
+    tempo = None
+    tick_column, on_column, key_column, velocity_column = columns
+
+    while position < end:
+        delta, position = _read_varlen(data, position)
+        tick += delta
+        byte = data[position]
+
+        if byte == META:
+            meta_type = data[position + 1]
+            length, position = _read_varlen(data, position + 2)
+            if meta_type == META_TEMPO and tempo is None and length == 3:
+                tempo = (data[position] << 16) | (data[position + 1] << 8) | data[position + 2]
+            elif meta_type == META_END_OF_TRACK:
+                break
+
+            position += length
+            continue
+
+        if byte in SYSEX:
+            length, position = _read_varlen(data, position + 1)
+            position += length
+            continue
+
+        if byte & 0x80:
+            status = byte
+            position += 1
+        elif status == 0:
+            raise MidiException('Invalid running status.')
+
+        kind = status & 0xF0
+        if kind == NOTE_ON or kind == NOTE_OFF:
+            velocity = data[position + 1]
+            tick_column.append(tick)
+            on_column.append(1 if kind == NOTE_ON and velocity > 0 else 0)
+            key_column.append(((track << 4) | (status & 0x0F)) << 7 | data[position])
+            velocity_column.append(velocity)
+
+        position += _DATA_LENGTHS[kind]
+
+    return tempo
+
+
+def _pair(tick, on, key, velocity):
+    """
+    Match every note on with the first following note off of the same track, channel and pitch that is not matched yet.
+    Note offs without a note on before them are ignored, note ons without a note off are dropped
+    :return: key, velocity, onset, length arrays of matched notes
+    """
+    size = len(tick)
+    ons = np.flatnonzero(on == 1)
+    offs = np.flatnonzero(on == 0)
+    if len(ons) == 0 or len(offs) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, empty
+
+    # positions follow the order of events in the track, so within a key they are ordered by tick
+    on_codes = key[ons] * size + ons
+    off_codes = key[offs] * size + offs
+    ons = ons[np.argsort(on_codes, kind='stable')]
+    on_codes = key[ons] * size + ons
+    order = np.argsort(off_codes, kind='stable')
+    offs = offs[order]
+    off_codes = off_codes[order]
+
+    # first note off after every note on, then the next one not matched by a previous note on of the same key:
+    # match[i] = max(first[j] + i - j) for j <= i in the same key, a running max shifted by rank
+    first = np.searchsorted(off_codes, on_codes)
+    on_keys = key[ons]
+    starts = np.flatnonzero(np.r_[True, on_keys[1:] != on_keys[:-1]])
+    rank = np.arange(len(ons)) - np.repeat(starts, np.diff(np.r_[starts, len(ons)]))
+    group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(ons)]))
+    offset = group * (len(offs) + len(ons) + 1)
+    match = np.maximum.accumulate(first - rank + offset) - offset + rank
+
+    matched = match < len(offs)
+    matched[matched] = key[offs[match[matched]]] == on_keys[matched]
+
+    ons = ons[matched]
+    offs = offs[match[matched]]
+
+    return key[ons], velocity[ons], tick[ons], tick[offs] - tick[ons]
+
+
+def decode(data):
+    """
+    Decode a Standard MIDI File into columnar arrays, no object is created per event
+    :param data: bytes of the file
+    :return: MidiNotes with notes sorted by onset and pitch, onset and length in ticks
+    """
+    data = bytes(data)
+    if len(data) < 14 or data[:4] != b'MThd':
+        raise MidiException('Invalid MIDI file.')
+
+    header_length, midi_format, track_count, division = struct.unpack_from('>IHHH', data, 4)
+    if division & 0x8000:
+        raise MidiException('SMPTE time division is not supported.')
+
+    columns = tuple(array('q') for c in _COLUMNS)
+    tempo = None
+    position = 8 + header_length
+
+    for track in range(track_count):
+        if data[position:position + 4] != b'MTrk':
+            raise MidiException('Invalid MIDI track.')
+
+        length, = struct.unpack_from('>I', data, position + 4)
+        position += 8
+        try:
+            track_tempo = _decode_track(data, position, min(position + length, len(data)), track, columns)
+        except (IndexError, KeyError):
+            raise MidiException('Invalid MIDI track.')
+
+        if tempo is None:
+            tempo = track_tempo
+
+        position += length
+
+    tick, on, key, velocity = (np.frombuffer(column, dtype=np.int64) if len(column) > 0 else np.zeros(0, dtype=np.int64) for column in columns)
+    key, velocity, onset, length = _pair(tick, on, key, velocity)
+    order = np.lexsort((key & 0x7F, onset))
+
+    return MidiNotes(
+        ticks_per_beat=division,
+        tempo=DEFAULT_TEMPO if tempo is None else 60000000 / tempo,
+        track=(key >> 11)[order],
+        channel=((key >> 7) & 0x0F)[order],
+        pitch=(key & 0x7F)[order],
+        velocity=velocity[order],
+        onset=onset[order],
+        length=length[order]
+    )
+
+
+def _check_range(name, values, high):
+    """
+    :param name: name of the values (e.g 'pitch')
+    :param values: int or array of ints
+    :param high: max value
+    :return: None
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if values.size > 0 and (values.min() < 0 or values.max() > high):
+        raise MidiException('Invalid MIDI {}, it must be between 0 and {}.'.format(name, high))
+
+
+def _check_notes(notes):
+    """
+    :param notes: MidiNotes
+    :return: notes, if channels are between 0 and 15 and pitches and velocities between 0 and 127
+    """
+    _check_range('channel', notes.channel, 15)
+    _check_range('pitch', notes.pitch, 127)
+    _check_range('velocity', notes.velocity, 127)
+
+    return notes
+
+
+def encode(notes):
+    """
+    Encode notes into a Standard MIDI File, one MIDI track for every track in notes
+    :param notes: MidiNotes
+    :return: bytes of the file
+    """
+    _check_notes(notes)
+
+    track = np.asarray(notes.track, dtype=np.int64)
+    tracks = np.unique(track) if len(track) > 0 else np.zeros(1, dtype=np.int64)
+    out = bytearray(struct.pack('>4sIHHH', b'MThd', 6, 0 if len(tracks) == 1 else 1, len(tracks), notes.ticks_per_beat))
+
+    channel = np.asarray(notes.channel, dtype=np.int64)
+    pitch = np.asarray(notes.pitch, dtype=np.int64)
+    velocity = np.asarray(notes.velocity, dtype=np.int64)
+    onset = np.asarray(notes.onset, dtype=np.int64)
+    end = onset + np.asarray(notes.length, dtype=np.int64)
+
+    for i, t in enumerate(tracks):
+        selected = track == t
+        size = int(selected.sum())
+        tick = np.concatenate((onset[selected], end[selected]))
+        status = np.concatenate((np.full(size, NOTE_ON), np.full(size, NOTE_OFF))) | np.tile(channel[selected], 2)
+        data1 = np.tile(pitch[selected], 2)
+        data2 = np.concatenate((velocity[selected], np.zeros(size, dtype=np.int64)))
+
+        # at the same tick note offs come first, except the ones of notes of length 0 that follow their note on
+        zero = end[selected] == onset[selected]
+        rank = np.concatenate((np.ones(size, dtype=np.int64), np.where(zero, 2, 0)))
+        order = np.lexsort((rank, tick))
+        delta = np.diff(np.r_[0, tick[order]])
+
+        events = bytearray()
+        if i == 0:
+            events.extend(b'\x00\xff\x51\x03' + struct.pack('>I', int(round(60000000 / notes.tempo)))[1:])
+
+        for d, s, p, v in zip(delta.tolist(), status[order].tolist(), data1[order].tolist(), data2[order].tolist()):
+            _write_varlen(d, events)
+            events.append(s)
+            events.append(p)
+            events.append(v)
+
+        events.extend(b'\x00\xff\x2f\x00')
+        out.extend(struct.pack('>4sI', b'MTrk', len(events)))
+        out.extend(events)
+
+    return bytes(out)
+
+
+def read_notes(path):
+    """
+    :param path: path of the MIDI file
+    :return: MidiNotes
+    """
+    with open(path, 'rb') as f:
+        return decode(f.read())
+
+
+def write_notes(path, notes):
+    """
+    :param path: path of the MIDI file
+    :param notes: MidiNotes
+    :return: None
+    """
+    with open(path, 'wb') as f:
+        f.write(encode(notes))
+
+
+def to_note_array(notes, alt=None):
+    """
+    :param notes: MidiNotes
+    :param alt: note alteration 'sharp' or 'flat' used for names
+    :return: tuple (NoteArray, onsets) with durations and onsets relative (4/4 is a whole note)
+    """
+    whole = 4 * notes.ticks_per_beat
+    size = len(notes.pitch)
+
+    return NoteArray(
+        pitch=notes.pitch,
+        duration=notes.length / whole,
+        alt=np.full(size, NoteArray.ALTS.index(alt) if alt in NoteArray.ALTS else 0)
+    ), notes.onset / whole
+
+
+def to_events(notes, alt=None):
+    """
+    Convert notes into a sequence of events.
+    Notes starting together become a Chord, gaps become Rest and
+    notes still sounding when the next event starts are shortened
+    :param notes: MidiNotes
+    :param alt: note alteration 'sharp' or 'flat' used for names
+    :return: list of Note, Rest and Chord
+    """
+    whole = 4 * notes.ticks_per_beat
+    onsets, starts = np.unique(notes.onset, return_index=True)
+    bounds = np.r_[starts, len(notes.onset)].tolist()
+    onsets = onsets.tolist()
+    pitch = notes.pitch.tolist()
+    length = notes.length.tolist()
+
+    events = []
+    cursor = 0
+    for i, onset in enumerate(onsets):
+        if onset > cursor:
+            events.append(Rest(duration=(onset - cursor) / whole))
+
+        ticks = length[bounds[i]:bounds[i + 1]]
+        if i + 1 < len(onsets):
+            ticks = [min(t, onsets[i + 1] - onset) for t in ticks]
+
+        group = [Note.from_pitch(p, alt=alt, duration=t / whole) for p, t in zip(pitch[bounds[i]:bounds[i + 1]], ticks)]
+
+        events.append(group[0] if len(group) == 1 else Chord(*group, strict=False))
+        cursor = onset + max(ticks)
+
+    return events
+
+
+def from_events(events, ticks_per_beat=DEFAULT_TICKS_PER_BEAT, tempo=DEFAULT_TEMPO, velocity=64, channel=0):
+    """
+    :param events: Note, Rest, NoteList or iterable of them. Notes of a Chord sound together, notes of any other NoteList one after another
+    :param ticks_per_beat: number of ticks of a quarter note
+    :param tempo: number of quarter notes per minute
+    :param velocity: velocity of notes
+    :param channel: MIDI channel of notes
+    :return: MidiNotes
+    """
+    _check_range('channel', channel, 15)
+    _check_range('velocity', velocity, 127)
+
+    whole = 4 * ticks_per_beat
+    pitch, onset, length = [], [], []
+    cursor = 0
+
+    if isinstance(events, Chord) or not (isinstance(events, NoteList) or hasattr(events, '__iter__')):
+        events = [events]
+    elif isinstance(events, NoteList):
+        events = events.notes
+
+    for event in events:
+        if isinstance(event, Chord):
+            group = event.notes
+        elif isinstance(event, NoteList):
+            for n in event.notes:
+                pitch.append(n.pitch)
+                onset.append(cursor)
+                length.append(int(round(n.duration * whole)))
+                cursor += length[-1]
+            continue
+        elif hasattr(event, 'freq'):
+            group = [event]
+        else:
+            cursor += int(round(event.duration * whole))
+            continue
+
+        ticks = [int(round(n.duration * whole)) for n in group]
+        for n, t in zip(group, ticks):
+            pitch.append(n.pitch)
+            onset.append(cursor)
+            length.append(t)
+
+        cursor += max(ticks or [0])
+
+    size = len(pitch)
+
+    return _check_notes(MidiNotes(
+        ticks_per_beat=ticks_per_beat,
+        tempo=tempo,
+        track=np.zeros(size, dtype=np.int64),
+        channel=np.full(size, channel, dtype=np.int64),
+        pitch=np.array(pitch, dtype=np.int64),
+        velocity=np.full(size, velocity, dtype=np.int64),
+        onset=np.array(onset, dtype=np.int64),
+        length=np.array(length, dtype=np.int64)
+    ))
+
+
+def read(path, alt=None):
+    """
+    :param path: path of the MIDI file
+    :param alt: note alteration 'sharp' or 'flat' used for names
+    :return: list of Note, Rest and Chord
+    """
+    return to_events(read_notes(path), alt=alt)
+
+
+def write(path, events, ticks_per_beat=DEFAULT_TICKS_PER_BEAT, tempo=DEFAULT_TEMPO, velocity=64, channel=0):
+    """
+    :param path: path of the MIDI file
+    :param events: Note, Rest, NoteList or iterable of them
+    :param ticks_per_beat: number of ticks of a quarter note
+    :param tempo: number of quarter notes per minute
+    :param velocity: velocity of notes
+    :param channel: MIDI channel of notes
+    :return: None
+    """
+    write_notes(path, from_events(events, ticks_per_beat=ticks_per_beat, tempo=tempo, velocity=velocity, channel=channel))
@@ -1,8 +1,29 @@
 from __future__ import division
 
 import math
+import numbers
+import re
+from collections import namedtuple
 
+from babs import instrumentation
 from babs.exceptions import NoteException
+from babs.pitch_table import PitchTable
+
+
+Quantization = namedtuple('Quantization', ['pitch', 'index', 'octave', 'cents', 'names', 'valid'])
+
+
+def _get_note_indexes(notes):
+    """
+    :param notes: list of note names, alternative names are separated by /
+    :return: dict that maps every name to its position in notes
+    """
+    indexes = {}
+    for idx, names in enumerate(notes):
+        for name in names.split('/'):
+            indexes[name] = idx
+
+    return indexes
 
 
 class Note(object):
@@ -13,10 +34,18 @@ class Note(object):
     A_FREQUENCY = 440
     A_DEFAULT_OCTAVE = 4
     NOTES = ['C', 'C#/Db', 'D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B']
+    NOTE_NAMES = [tuple(names.split('/')) for names in NOTES]
+    NOTE_INDEXES = _get_note_indexes(NOTES)
     HALF_STEP_INTERVAL = 2 ** (1 / 12)
     FLAT = 'flat'
     SHARP = 'sharp'
 
+    PARSE_PATTERN = re.compile(r'^\s*([A-G][#b]?)(-?\d+)?\s*$')
+
+    _cache = None
+    _pitch_table = None
+    _pitch_table_key = None
+
     def __init__(self, freq=None, name=None, octave=4, alt=None, duration=4/4):
         """
         :param freq: frequency
@@ -29,6 +58,7 @@ class Note(object):
         self._name = name
         self._octave = octave
         self._alt = alt
+        self._pitch = None
         self.duration = duration
 
         if self._freq is None and self._name is None:
@@ -43,6 +73,9 @@ class Note(object):
             self._set_name_and_octave()
 
         self._freq = round(self._freq, 2)
+
+        if instrumentation.ENABLED:
+            instrumentation.increment('note.create')
     
     def __eq__(self, other):
         return self._freq == other.freq and self.duration == other.duration
@@ -51,7 +84,7 @@ class Note(object):
         return self._freq != other.freq or self.duration != other.duration
 
     def __hash__(self):
-        return hash(self._freq)
+        return hash((self._freq, self.duration))
 
     def __str__(self):
         return "{}{}".format(self._name, self._octave)
@@ -68,6 +101,13 @@ class Note(object):
         self._freq = freq
         self._set_name_and_octave()
 
+    @property
+    def pitch(self):
+        """
+        :return: nearest pitch number using MIDI convention (A4 = 69)
+        """
+        return self._pitch
+
     @property
     def name(self):
         return self._name
@@ -96,6 +136,11 @@ class Note(object):
         if alt is not None:
             self._alt = alt
         if half_step is True:
+            table = self.get_pitch_table()
+            if isinstance(value, numbers.Integral) and table.get_freq(self._pitch) == self._freq:
+                self._set_pitch(self._pitch + int(value), table)
+                return
+
             self._freq = round(self._freq * (self.HALF_STEP_INTERVAL ** value), 2)
         elif octave is True:
             self._freq = round(self._freq * (2 ** value), 2)
@@ -104,51 +149,239 @@ class Note(object):
 
         self._set_name_and_octave()
 
+    def transposed(self, semitones, alt=None):
+        """
+        :param semitones: number of half steps, could be negative
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb), default note's alteration
+        :return: new note moved by semitones, without rounding error if the note is on the pitch table
+        """
+        if alt is None:
+            alt = self._alt
+
+        table = self.get_pitch_table()
+        if isinstance(semitones, numbers.Integral):
+            semitones = int(semitones)
+            pitch = self._pitch + semitones
+            freq = table.get_freq(pitch)
+        else:
+            freq = None
+
+        if freq is None or table.get_freq(self._pitch) != self._freq:
+            note = self._from_values(self._freq, self._name, self._octave, alt, self._pitch, self.duration)
+            note.pitch_shift(semitones, half_step=True)
+
+            return note
+
+        return self._from_values(freq, self.get_note_name_by_index(pitch, alt), pitch // len(self.NOTES) - 1, alt, pitch, self.duration)
+
+    def retuned(self, tuning):
+        """
+        :param tuning: Tuning
+        :return: new note with the same pitch, name and octave and the frequency of the pitch in tuning
+        """
+        return tuning.retune_note(self)
+
     def get_note_index(self):
         """
         :return: position of the note in self.NOTES or False if not found
         """
-        idx = 0
-        for note in self.NOTES:
-            names = note.split('/')
-            for name in names:
-                if self._name == name:
-                    return idx
-            idx += 1
-
-        return False
+        try:
+            return self.NOTE_INDEXES.get(self._name, False)
+        except TypeError:
+            return False
 
     def _set_name_and_octave(self):
         """
         calculate and set _name and _octave based on freq and alt
         """
-        distance = int(round(len(self.NOTES) * (math.log(float(self._freq), 2) - math.log(self.A_FREQUENCY, 2))))
-
-        idx = self.NOTES.index('A') + distance
-        octave = int(self.A_DEFAULT_OCTAVE + (idx / len(self.NOTES)))
-        idx = idx % len(self.NOTES)
+        pitch = self.get_pitch_table().get_pitch(self._freq)
+        if pitch is None:
+            distance = int(round(len(self.NOTES) * (math.log(float(self._freq), 2) - math.log(self.A_FREQUENCY, 2))))
+            pitch = PitchTable.A_PITCH + distance
 
-        self._name = self.get_note_name_by_index(idx, self._alt)
-        self._octave = octave
+        self._pitch = pitch
+        self._name = self.get_note_name_by_index(pitch, self._alt)
+        self._octave = pitch // len(self.NOTES) - 1
 
     def _set_freq(self):
         """
         calculate and set freq based on name and octave
         """
-        note_distance = self.get_note_index() - self.NOTES.index('A')
-        oct_distance = self._octave - 4
-        distance = note_distance + (len(self.NOTES) * oct_distance)
+        pitch = self.get_note_index() + len(self.NOTES) * (self._octave + 1)
+        self._pitch = int(round(pitch))
+
+        # the table is used only for integral pitches, octave could be a float
+        freq = self.get_pitch_table().get_freq(self._pitch) if pitch == self._pitch else None
+        if freq is None:
+            freq = self.A_FREQUENCY * (self.HALF_STEP_INTERVAL ** (pitch - PitchTable.A_PITCH))
+
+        self._freq = freq
+
+    def _set_pitch(self, pitch, table=None):
+        """
+        set pitch, freq, name and octave from a pitch number
+        :param pitch: pitch number
+        :param table: PitchTable used to get the freq
+        """
+        if table is None:
+            table = self.get_pitch_table()
+
+        freq = table.get_freq(pitch)
+        if freq is None:
+            freq = round(self.A_FREQUENCY * (self.HALF_STEP_INTERVAL ** (pitch - PitchTable.A_PITCH)), 2)
 
-        self._freq = self.A_FREQUENCY * (self.HALF_STEP_INTERVAL ** distance)
+        self._pitch = pitch
+        self._freq = freq
+        self._name = self.get_note_name_by_index(pitch, self._alt)
+        self._octave = pitch // len(self.NOTES) - 1
 
     @classmethod
-    def get_note_name_by_index(cls, idx, alt=None):
-        while idx >= len(cls.NOTES):
-            idx = idx - len(cls.NOTES)
+    def _from_values(cls, freq, name, octave, alt, pitch, duration):
+        """
+        create a note from already computed values, without any validation
+        """
+        note = cls.__new__(cls)
+        note._freq = freq
+        note._name = name
+        note._octave = octave
+        note._alt = alt
+        note._pitch = pitch
+        note.duration = duration
+
+        if instrumentation.ENABLED:
+            instrumentation.increment('note.create')
+
+        return note
+
+    @classmethod
+    def get_pitch_table(cls):
+        """
+        :return: PitchTable based on the current A_FREQUENCY, rebuilt when A_FREQUENCY changes
+        """
+        key = (cls.A_FREQUENCY, cls.HALF_STEP_INTERVAL)
+        if cls._pitch_table_key != key:
+            cls._pitch_table = PitchTable.equal_temperament(a_frequency=cls.A_FREQUENCY, half_step_interval=cls.HALF_STEP_INTERVAL)
+            cls._pitch_table_key = key
+
+        return cls._pitch_table
+
+    @classmethod
+    def from_pitch(cls, pitch, alt=None, duration=4/4):
+        """
+        :param pitch: pitch number using MIDI convention (A4 = 69)
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :param duration: relative duration of the note
+        :return: Note
+        """
+        table = cls.get_pitch_table()
+        freq = table.get_freq(pitch)
+        if freq is None:
+            return cls(name=cls.get_note_name_by_index(pitch, alt=alt), octave=pitch // len(cls.NOTES) - 1, alt=alt, duration=duration)
+
+        return cls(freq=freq, alt=alt, duration=duration)
 
-        names = cls.NOTES[idx].split('/')
+    @classmethod
+    def get_note_name_by_index(cls, idx, alt=None):
+        names = cls.NOTE_NAMES[idx % len(cls.NOTE_NAMES)]
 
         if len(names) > 1 and alt == 'flat':
             return names[1]
 
         return names[0]
+
+    @classmethod
+    def from_freqs(cls, freqs, alt=None):
+        """
+        Quantize frequencies to the nearest notes in a single vectorized pass. Needs NumPy
+        :param freqs: array of frequencies
+        :param alt: note's alteration, could be sharp or flat. used to choose names (e.g D# or Eb)
+        :return: Quantization with arrays of pitch numbers, note indexes in NOTES, octaves,
+            cents deviation from the nearest note, names and valid (False for frequencies <= 0 or not finite).
+            invalid frequencies have 0 pitch, index, octave and cents and an empty name
+        """
+        import numpy as np
+
+        freqs = np.asarray(freqs, dtype=np.float64)
+        valid = np.isfinite(freqs) & (freqs > 0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance = len(cls.NOTES) * (np.log2(freqs) - math.log(cls.A_FREQUENCY, 2))
+
+        distance = np.where(valid, distance, 0)
+        nearest = np.rint(distance)
+
+        pitch = np.where(valid, PitchTable.A_PITCH + nearest.astype(np.int64), 0)
+        index = np.where(valid, pitch % len(cls.NOTES), 0)
+        octave = np.where(valid, pitch // len(cls.NOTES) - 1, 0)
+        cents = (distance - nearest) * 100
+
+        names = np.array([cls.get_note_name_by_index(idx, alt=alt) for idx in range(len(cls.NOTES))])
+        names = np.where(valid, names[index], '')
+
+        return Quantization(pitch, index, octave, cents, names, valid)
+
+    @classmethod
+    def interned(cls, freq=None, name=None, octave=4, alt=None, duration=4/4):
+        """
+        Return a shared note from the class NoteCache. Shared notes can't be changed, a SharedNote is returned for Note
+        :param freq: frequency
+        :param name: name of the note
+        :param octave: note's position on a standard 88-key piano keyboard
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :param duration: relative duration of the note
+        :return: Note
+        """
+        return cls.get_cache().get_note(freq=freq, name=name, octave=octave, alt=alt, duration=duration)
+
+    @classmethod
+    def get_cache(cls):
+        """
+        :return: NoteCache used by interned
+        """
+        if cls.__dict__.get('_cache') is None:
+            from babs.cache import NoteCache
+
+            cls._cache = NoteCache() if cls is Note else NoteCache(note_class=cls)
+
+        return cls._cache
+
+    @classmethod
+    def parse(cls, text, alt=None, duration=4/4):
+        """
+        :param text: name of the note followed by the octave (e.g. C#4, Bb3, A). default octave is A_DEFAULT_OCTAVE
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :param duration: relative duration of the note
+        :return: Note
+        """
+        match = cls.PARSE_PATTERN.match(text) if isinstance(text, str) else None
+        if match is None or match.group(1) not in cls.NOTE_INDEXES:
+            raise NoteException('Invalid note.')
+
+        octave = match.group(2)
+
+        return cls(name=match.group(1), octave=cls.A_DEFAULT_OCTAVE if octave is None else int(octave), alt=alt, duration=duration)
+
+    @classmethod
+    def parse_many(cls, texts, alt=None, duration=4/4):
+        """
+        :param texts: list of notes as text (see parse) or a single string with notes separated by whitespaces
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :param duration: relative duration of the notes
+        :return: list of Note
+        """
+        if isinstance(texts, str):
+            texts = texts.split()
+
+        parsed = {}
+        notes = []
+        for text in texts:
+            args = parsed.get(text)
+            if args is None:
+                note = cls.parse(text, alt=alt, duration=duration)
+                parsed[text] = (note.name, note.octave)
+            else:
+                note = cls(name=args[0], octave=args[1], alt=alt, duration=duration)
+
+            notes.append(note)
+
+        return notes
@@ -0,0 +1,302 @@
+from __future__ import division
+
+import numpy as np
+
+from babs.note import Note
+from babs.pitch_table import PitchTable
+
+
+class NoteArray(object):
+    """
+    Columnar array of notes backed by NumPy arrays
+    """
+
+    ALTS = [None, Note.SHARP, Note.FLAT]
+
+    def __init__(self, freq=None, pitch=None, duration=None, alt=None, flat=None):
+        """
+        :param freq: frequencies of notes, calculated from pitch if None
+        :param pitch: pitch numbers of notes (A4 = 69), calculated from freq if None
+        :param duration: relative durations of notes, default 4/4
+        :param alt: alteration codes of notes, index of the alteration in NoteArray.ALTS
+        :param flat: True if note's name is flat (e.g Eb instead of D#), default True where alt is flat
+        """
+        if freq is None and pitch is None:
+            raise ValueError("Can't create a NoteArray without freq or pitch.")
+
+        if pitch is None:
+            freq = np.asarray(freq, dtype=np.float64)
+            pitch = self.get_pitches(freq)
+        else:
+            pitch = np.asarray(pitch, dtype=np.int64)
+            freq = self.get_freqs(pitch) if freq is None else np.asarray(freq, dtype=np.float64)
+
+        size = len(pitch)
+
+        self._freq = freq
+        self._pitch = pitch
+        self._duration = np.full(size, 4/4) if duration is None else np.asarray(duration, dtype=np.float64)
+        self._alt = np.zeros(size, dtype=np.int8) if alt is None else np.asarray(alt, dtype=np.int8)
+        self._flat = self._alt == self.ALTS.index(Note.FLAT) if flat is None else np.asarray(flat, dtype=bool)
+
+        for column in (self._freq, self._duration, self._alt, self._flat):
+            if column.shape != pitch.shape:
+                raise ValueError('All columns must have the same length.')
+
+    def __len__(self):
+        return len(self._pitch)
+
+    def __iter__(self):
+        return iter(self.to_notes())
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self._create_note(
+                float(self._freq[key]),
+                int(self._pitch[key]),
+                int(self._alt[key]),
+                bool(self._flat[key]),
+                float(self._duration[key])
+            )
+
+        return type(self)(
+            freq=self._freq[key],
+            pitch=self._pitch[key],
+            duration=self._duration[key],
+            alt=self._alt[key],
+            flat=self._flat[key]
+        )
+
+    def __repr__(self):
+        return 'NoteArray({})'.format(', '.join(self.names))
+
+    @property
+    def freq(self):
+        return self._freq
+
+    @property
+    def pitch(self):
+        return self._pitch
+
+    @property
+    def duration(self):
+        return self._duration
+
+    @property
+    def alt(self):
+        return self._alt
+
+    @property
+    def flat(self):
+        return self._flat
+
+    @property
+    def octave(self):
+        return self._pitch // len(Note.NOTES) - 1
+
+    @property
+    def pitch_class(self):
+        return self._pitch % len(Note.NOTES)
+
+    @property
+    def names(self):
+        """
+        :return: list of note's names
+        """
+        return [
+            self._get_name(pitch_class, flat)
+            for pitch_class, flat in zip(self.pitch_class.tolist(), self._flat.tolist())
+        ]
+
+    def copy(self):
+        """
+        :return: NoteArray with a copy of all columns
+        """
+        return type(self)(
+            freq=self._freq.copy(),
+            pitch=self._pitch.copy(),
+            duration=self._duration.copy(),
+            alt=self._alt.copy(),
+            flat=self._flat.copy()
+        )
+
+    def transpose(self, semitones, alt=None):
+        """
+        :param semitones: number of half steps, could be an int or an array of ints
+        :param alt: note's alteration used for the new notes, if None keep the current alterations
+        :return: transposed NoteArray
+        """
+        semitones = np.asarray(semitones, dtype=np.int64)
+        pitch = self._pitch + semitones
+
+        on_table = self._freq == self.get_freqs(self._pitch)
+        freq = np.where(
+            on_table,
+            self.get_freqs(pitch),
+            np.round(self._freq * (Note.HALF_STEP_INTERVAL ** semitones), 2)
+        )
+
+        return self._with_pitch(freq, pitch, alt)
+
+    def retune(self, tuning):
+        """
+        :param tuning: Tuning
+        :return: NoteArray with the frequency of every pitch in tuning
+        """
+        table = tuning.get_table()
+        freqs = np.asarray(table.freqs, dtype=np.float64)
+        in_table = (self._pitch >= table.min_pitch) & (self._pitch <= table.max_pitch)
+
+        freq = freqs[np.clip(self._pitch - table.min_pitch, 0, len(freqs) - 1)]
+        if not in_table.all():
+            freq[~in_table] = [tuning.get_rounded_freq(int(p)) for p in self._pitch[~in_table]]
+
+        return type(self)(
+            freq=freq,
+            pitch=self._pitch.copy(),
+            duration=self._duration.copy(),
+            alt=self._alt.copy(),
+            flat=self._flat.copy()
+        )
+
+    def pitch_shift(self, value, half_step=False, octave=False, alt=None):
+        """
+        :param value: value to add or sub from freq
+        :param half_step: if True val is based as half tone
+        :param octave: if True val is based on octave
+        :param alt: note's alteration, could be sharp or flat. used to choose name (e.g D# or Eb)
+        :return: shifted NoteArray
+        """
+        if half_step is True:
+            if np.issubdtype(np.asarray(value).dtype, np.integer):
+                return self.transpose(value, alt=alt)
+
+            freq = np.round(self._freq * (Note.HALF_STEP_INTERVAL ** np.asarray(value, dtype=np.float64)), 2)
+        elif octave is True:
+            freq = np.round(self._freq * (2 ** np.asarray(value, dtype=np.float64)), 2)
+        else:
+            freq = np.round(self._freq + np.asarray(value, dtype=np.float64), 2)
+
+        return self._with_pitch(freq, self.get_pitches(freq), alt)
+
+    def filter(self, mask):
+        """
+        :param mask: boolean array, True for notes to keep
+        :return: NoteArray
+        """
+        return self[np.asarray(mask, dtype=bool)]
+
+    def sort(self, by='freq', reverse=False):
+        """
+        :param by: column used to sort notes: freq, pitch or duration
+        :param reverse: if True sort from higher to lower
+        :return: sorted NoteArray, notes with the same value keep their order
+        """
+        keys = getattr(self, by)
+        if reverse is True:
+            keys = -keys
+
+        return self[np.argsort(keys, kind='stable')]
+
+    def to_notes(self):
+        """
+        :return: list of Note
+        """
+        return [
+            self._create_note(*values)
+            for values in zip(
+                self._freq.tolist(),
+                self._pitch.tolist(),
+                self._alt.tolist(),
+                self._flat.tolist(),
+                self._duration.tolist()
+            )
+        ]
+
+    def to_note_list(self, note_list_class, **kwargs):
+        """
+        :param note_list_class: NoteList subclass, e.g Chord or Scale
+        :param kwargs: options of the note list (e.g strict, order)
+        :return: instance of note_list_class
+        """
+        return note_list_class(*self.to_notes(), **kwargs)
+
+    def _with_pitch(self, freq, pitch, alt):
+        if alt is None:
+            alts = self._alt.copy()
+        else:
+            alts = np.full(len(pitch), self._get_alt_code(alt), dtype=np.int8)
+
+        return type(self)(freq=freq, pitch=pitch, duration=self._duration.copy(), alt=alts)
+
+    def _create_note(self, freq, pitch, alt, flat, duration):
+        return Note._from_values(
+            freq,
+            self._get_name(pitch % len(Note.NOTES), flat),
+            pitch // len(Note.NOTES) - 1,
+            self.ALTS[alt],
+            pitch,
+            duration
+        )
+
+    @staticmethod
+    def _get_name(pitch_class, flat):
+        names = Note.NOTE_NAMES[pitch_class]
+
+        return names[1] if flat and len(names) > 1 else names[0]
+
+    @classmethod
+    def _get_alt_code(cls, alt):
+        return cls.ALTS.index(alt) if alt in cls.ALTS else 0
+
+    @staticmethod
+    def get_freqs(pitch):
+        """
+        :param pitch: array of pitch numbers
+        :return: array of frequencies, rounded as Note does
+        """
+        pitch = np.asarray(pitch, dtype=np.int64)
+        table = Note.get_pitch_table()
+        freqs = np.asarray(table.freqs, dtype=np.float64)
+
+        in_table = (pitch >= table.min_pitch) & (pitch <= table.max_pitch)
+        if in_table.all():
+            return freqs[pitch - table.min_pitch]
+
+        return np.where(
+            in_table,
+            freqs[np.clip(pitch - table.min_pitch, 0, len(freqs) - 1)],
+            np.round(Note.A_FREQUENCY * (Note.HALF_STEP_INTERVAL ** (pitch - PitchTable.A_PITCH)), 2)
+        )
+
+    @staticmethod
+    def get_pitches(freq):
+        """
+        :param freq: array of frequencies
+        :return: array of the nearest pitch numbers
+        """
+        return Note.from_freqs(freq).pitch
+
+    @classmethod
+    def from_notes(cls, notes):
+        """
+        :param notes: iterable of Note
+        :return: NoteArray
+        """
+        notes = list(notes)
+
+        return cls(
+            freq=[n.freq for n in notes],
+            pitch=[n.pitch for n in notes],
+            duration=[n.duration for n in notes],
+            alt=[cls._get_alt_code(n.alt) for n in notes],
+            flat=[Note.NOTE_NAMES[n.get_note_index()].index(n.name) == 1 for n in notes]
+        )
+
+    @classmethod
+    def from_note_list(cls, note_list):
+        """
+        :param note_list: NoteList, e.g Chord or Scale
+        :return: NoteArray
+        """
+        return cls.from_notes(note_list.notes)
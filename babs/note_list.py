@@ -1,6 +1,11 @@
+import copy
+import numbers
 from abc import ABC
+from bisect import bisect_left
+from collections import OrderedDict
 
-from babs import Note
+from babs import Note, instrumentation
+from babs.pitch_class_set import PitchClassSet
 
 from babs.exceptions import NoteListException
 
@@ -9,11 +14,16 @@ class NoteList(ABC):
     OCTAVE_TYPE_ROOT = 'root'
     OCTAVE_TYPE_FROM_ROOT = 'from_root'
 
+    INDEXED_ATTRIBUTES = ('freq', 'name', 'octave')
+
     def __init__(self, *notes, **kwargs):
         """
         :param notes: list of notes
         """
         self._notes = list(notes)
+        self._pitch_class_set = None
+        self._pitch_set = None
+        self._indexes = {}
         self.strict = kwargs.pop('strict', True)
         self.invalid_exception = kwargs.pop('invalid_exception', NoteListException)
 
@@ -25,6 +35,9 @@ class NoteList(ABC):
 
     def __ne__(self, other):
         return self._notes != other.notes
+
+    def __contains__(self, note):
+        return note in self._notes
     
     def __str__(self):
         return ','.join(list(map(lambda n: str(n), self._notes)))
@@ -36,6 +49,110 @@ class NoteList(ABC):
     def notes(self):
         return self._notes
 
+    @property
+    def pitch_class_set(self):
+        """
+        :return: PitchClassSet of notes in list, cached until the list is changed by add_note or remove_note
+        """
+        if self._pitch_class_set is None:
+            self._pitch_class_set = PitchClassSet.from_notes(n for n in self._notes if isinstance(n, Note))
+
+        return self._pitch_class_set
+
+    @property
+    def pitch_set(self):
+        """
+        :return: frozenset of pitch numbers of notes in list, cached until the list is changed by add_note or remove_note
+        """
+        if self._pitch_set is None:
+            self._pitch_set = frozenset(n.pitch for n in self._notes if isinstance(n, Note))
+
+        return self._pitch_set
+
+    def _invalidate(self):
+        """
+        Clear values cached from notes
+        :return: None
+        """
+        self._pitch_class_set = None
+        self._pitch_set = None
+
+    def copy(self):
+        """
+        :return: copy of the list with copies of its notes, without validation
+        """
+        note_list = copy.copy(self)
+        note_list._notes = [
+            n._from_values(n.freq, n.name, n.octave, n.alt, n.pitch, n.duration) if isinstance(n, Note) else copy.copy(n)
+            for n in self._notes
+        ]
+        note_list._indexes = {}
+
+        return note_list
+
+    def _replace_notes(self, function):
+        """
+        Replace every note with function(note) in one pass, items that are not notes are kept
+        :param function: callable that receives a note and returns the new note
+        :return: None
+        """
+        self._notes = [function(n) if isinstance(n, Note) else n for n in self._notes]
+        self._indexes = {}
+
+    def transpose(self, semitones, alt=None):
+        """
+        Move all notes by semitones in one pass, notes are replaced by transposed notes
+        :param semitones: number of half steps, could be negative
+        :param alt: note alteration 'sharp' or 'flat' used for names, default alteration of every note
+        :return: None
+        """
+        pitch_class_set = self._pitch_class_set
+        if isinstance(semitones, numbers.Integral):
+            semitones = int(semitones)
+
+        self._replace_notes(lambda n: n.transposed(semitones, alt=alt))
+        self._invalidate()
+
+        if pitch_class_set is not None and isinstance(semitones, int):
+            self._pitch_class_set = pitch_class_set.transpose(semitones)
+
+    def transposed(self, semitones, alt=None):
+        """
+        :param semitones: number of half steps, could be negative
+        :param alt: note alteration 'sharp' or 'flat' used for names, default alteration of every note
+        :return: new list with all notes moved by semitones
+        """
+        note_list = copy.copy(self)
+        note_list.transpose(semitones, alt=alt)
+
+        return note_list
+
+    def retune(self, tuning):
+        """
+        Change the frequency of all notes to the frequency of their pitch in tuning, notes are replaced by retuned notes
+        :param tuning: Tuning
+        :return: None
+        """
+        self._replace_notes(tuning.retune_note)
+
+    def retuned(self, tuning):
+        """
+        :param tuning: Tuning
+        :return: new list with all notes retuned
+        """
+        note_list = copy.copy(self)
+        note_list.retune(tuning)
+
+        return note_list
+
+    def nearest(self, freq):
+        """
+        :param freq: frequency
+        :return: PitchMatch(pitch, freq, cents) of the nearest pitch of the notes in list, None if not found
+        """
+        return Note.get_pitch_table().nearest(freq, pitches=self.pitch_set)
+
+    @instrumentation.timed('note_list.is_valid')
     def is_valid(self):
         """
         Check if list is valid
@@ -60,8 +177,167 @@ class NoteList(ABC):
         if strict and not isinstance(note, Note):
             raise self.invalid_exception('Invalid note given.')
         
+        self._insert(note)
+        self._invalidate()
+
+    def _insert(self, note):
+        """
+        Insert a note in list
+        :param note: note to be inserted
+        :return: None
+        """
+        if len(self._indexes) > 0 and not isinstance(note, Note):
+            self._indexes = {}
+
+        position = len(self._notes)
         self._notes.append(note)
-    
+
+        for attribute, index in self._indexes.items():
+            index.setdefault(getattr(note, attribute), []).append(position)
+
+    def _get_index(self, attribute):
+        """
+        Secondary index of notes by attribute, built when needed, updated when notes are added or removed and
+        dropped when notes are reordered
+        :param attribute: one of INDEXED_ATTRIBUTES
+        :return: dict attribute value => list of positions in list, None if list has items that are not notes
+        """
+        index = self._indexes.get(attribute)
+        if index is None:
+            index = {}
+            for position, n in enumerate(self._notes):
+                if not isinstance(n, Note):
+                    return None
+
+                index.setdefault(getattr(n, attribute), []).append(position)
+
+            self._indexes[attribute] = index
+
+        return index
+
+    def _lookup(self, attribute, value):
+        """
+        :param attribute: one of INDEXED_ATTRIBUTES
+        :param value: value to find
+        :return: sorted list of positions of items with value, items are checked one by one if list has items that are not notes
+        """
+        index = self._get_index(attribute)
+        if index is None:
+            return [p for p, n in enumerate(self._notes) if getattr(n, attribute) == value]
+
+        return index.get(value, [])
+
+    def _remap_indexes(self, positions):
+        """
+        Indexes after the removal of notes, positions after the first removed one are shifted in one pass.
+        Lists of positions before it are shared with the current indexes
+        :param positions: sorted list of removed positions
+        :return: dict attribute => index
+        """
+        if len(self._indexes) == 0 or len(positions) == 0:
+            return self._indexes
+
+        first = positions[0]
+        removed = set(positions)
+
+        indexes = {}
+        for attribute, index in self._indexes.items():
+            remapped = {}
+            for value, found in index.items():
+                if found[-1] < first:
+                    remapped[value] = found
+                    continue
+
+                found = [p - bisect_left(positions, p) for p in found if p not in removed]
+                if len(found) > 0:
+                    remapped[value] = found
+
+            indexes[attribute] = remapped
+
+        return indexes
+
+    def _find(self, note=None, freq=None, name=None, octave=None, predicate=None):
+        """
+        :return: sorted list of positions of notes that match all given criteria, empty list if no criteria is given
+        """
+        criteria = [(attribute, value) for attribute, value in zip(self.INDEXED_ATTRIBUTES, (freq, name, octave)) if value is not None]
+
+        if note is not None:
+            index = self._get_index('freq') if isinstance(note, Note) else None
+            if index is not None:
+                positions = [p for p in index.get(note.freq, []) if self._notes[p] == note]
+            else:
+                positions = [p for p, n in enumerate(self._notes) if n == note]
+        elif len(criteria) > 0:
+            attribute, value = criteria.pop(0)
+            positions = self._lookup(attribute, value)
+        elif predicate is not None:
+            positions = range(len(self._notes))
+        else:
+            return []
+
+        for attribute, value in criteria:
+            matches = set(self._lookup(attribute, value))
+            positions = [p for p in positions if p in matches]
+
+        if predicate is not None:
+            positions = [p for p in positions if predicate(self._notes[p])]
+
+        return list(positions)
+
+    def select(self, note=None, freq=None, name=None, octave=None, predicate=None):
+        """
+        Find notes by note, freq, name, octave and predicate. Notes must match all given criteria
+        :param note: note to find
+        :param freq: frequency to find
+        :param name: name to find
+        :param octave: octave to find
+        :param predicate: callable that receives a note and returns True if note should be selected
+        :return: list of notes, all notes if no criteria is given
+        """
+        if note is None and freq is None and name is None and octave is None and predicate is None:
+            return list(self._notes)
+
+        return [self._notes[p] for p in self._find(note=note, freq=freq, name=name, octave=octave, predicate=predicate)]
+
+    def remove_notes(self, predicate=None, note=None, freq=None, name=None, octave=None, strict=True):
+        """
+        Remove all notes that match all given criteria
+        :param predicate: callable that receives a note and returns True if note should be removed
+        :param note: note to remove
+        :param freq: frequency to remove
+        :param name: name to remove
+        :param octave: octave to remove
+        :param strict: raise NoteListException if list will be invalid after remove
+        :return: number of notes removed
+        """
+        return self._remove_positions(
+            self._find(note=note, freq=freq, name=name, octave=octave, predicate=predicate),
+            strict=strict
+        )
+
+    def _remove_positions(self, positions, strict=True):
+        """
+        :param positions: positions of notes to remove
+        :param strict: raise invalid_exception if list will be invalid after remove
+        :return: number of notes removed
+        """
+        notes, indexes = self._notes, self._indexes
+
+        if len(positions) > 0:
+            positions = sorted(positions)
+            self._indexes = self._remap_indexes(positions)
+            removed = set(positions)
+            self._notes = [n for key, n in enumerate(self._notes) if key not in removed]
+            self._invalidate()
+
+        if strict is True and not self.is_valid():
+            self._notes, self._indexes = notes, indexes
+            self._invalidate()
+            raise self.invalid_exception('Invalid {}.'.format(type(self).__name__))
+
+        return len(positions)
+
     def remove_note(self, note=None, freq=None, name=None, octave=None, strict=True):
         """
         Remove note by note, freq, name or octave from list
@@ -73,36 +349,44 @@ class NoteList(ABC):
         :return: None
         """
 
-        notes = self._notes
-
-        indices = []
         if note is not None:
-            indices = [key for key, n in enumerate(self._notes) if n == note]
+            positions = self._find(note=note)
         elif freq is not None:
-            indices = [key for key, n in enumerate(self._notes) if n.freq == freq]
+            positions = self._find(freq=freq)
         elif name is not None:
-            indices = [key for key, n in enumerate(self._notes) if n.name == name]
-        elif octave is not None:
-            indices = [key for key, n in enumerate(self._notes) if n.octave == octave]
+            positions = self._find(name=name)
+        else:
+            positions = self._find(octave=octave)
 
-        if len(indices) > 0:
-            self._notes = [n for key, n in enumerate(self._notes) if key not in indices]
+        self._remove_positions(positions, strict=strict)
 
-        if strict is True and not self.is_valid():
-            self._notes = notes
-            raise self.invalid_exception('Invalid {}.'.format(type(self).__name__))
-    
     @classmethod
-    def get_notes_from_root(cls, root, note_list_type=None, octave=None, alt=Note.SHARP):
+    def get_types(cls):
+        """
+        :return: OrderedDict of note list types defined in class (e.g MAJOR_TYPE), name => list of notes distance from root
+        """
+        types = OrderedDict()
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if name.endswith('_TYPE') and isinstance(value, list):
+                    types[name] = value
+
+        return types
+
+    @classmethod
+    @instrumentation.timed('note_list.get_notes_from_root')
+    def get_notes_from_root(cls, root, note_list_type=None, octave=None, alt=Note.SHARP, cache=None):
         """
         :param root: root note
         :param note_list_type: a list of notes distance from root note
         :param octave: octave of notes in chord
         :param alt: note alteration 'sharp' or 'flat'
+        :param cache: NoteCache used to get shared notes instead of creating new ones
         :type root: Note
         :type note_list_type: list
         :type octave: Union[int, string, callable]
         :type alt: string
+        :type cache: NoteCache
         :return: Scale
         """
         
@@ -126,7 +410,9 @@ class NoteList(ABC):
             else:
                 return Note.A_DEFAULT_OCTAVE
 
-        notes = [Note(
+        create_note = Note if cache is None else cache.get_note
+
+        notes = [create_note(
             name=Note.get_note_name_by_index(root_idx + distance, alt=alt),
             octave=get_octave(i, root_idx + distance),
             alt=alt
@@ -0,0 +1,161 @@
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+from babs import Note, NoteList, instrumentation
+
+
+class OrderedNoteList(NoteList):
+    """
+    Abstract list of notes ordered by frequency.
+    Notes are inserted and removed with binary search and membership uses a hashed index
+    """
+
+    def __init__(self, *notes, **kwargs):
+        """
+        :param notes: list of notes
+        """
+        self._keys = None
+        self._members = None
+
+        super().__init__(*notes, **kwargs)
+
+    def __contains__(self, note):
+        if self._members is not None:
+            return self._members.get(note, 0) > 0
+
+        return note in self._notes
+
+    def copy(self):
+        note_list = super().copy()
+        if self._keys is not None:
+            note_list._keys = list(self._keys)
+            note_list._members = Counter(note_list._notes)
+
+        return note_list
+
+    def _replace_notes(self, function):
+        super()._replace_notes(function)
+
+        if self._keys is not None:
+            keys = [self._get_order_key(n) for n in self._notes]
+            if all(a <= b for a, b in zip(keys, keys[1:])):
+                self._keys = keys
+                self._members = Counter(self._notes)
+            else:
+                self._order()
+
+    def _get_order_key(self, note):
+        """
+        :param note: note in list
+        :return: value used to order the note
+        """
+        return note.freq
+
+    @instrumentation.timed('ordered_note_list.order')
+    def _order(self):
+        """
+        Sort notes and rebuild the indexes, indexes are available only if the list is valid
+        :return: None
+        """
+        if self.is_valid():
+            self._notes.sort(key=self._get_order_key)
+            self._keys = [self._get_order_key(n) for n in self._notes]
+            self._members = Counter(self._notes)
+        else:
+            self._keys = None
+            self._members = None
+
+        self._indexes = {}
+
+    def _sync_keys(self):
+        """
+        Sort notes again if they were changed in place (e.g notes[0].pitch_shift(12)) since keys were computed
+        :return: None
+        """
+        if self._keys is not None and self._keys != [self._get_order_key(n) for n in self._notes]:
+            self._order()
+            self._invalidate()
+
+    def _insert(self, note):
+        self._sync_keys()
+
+        if self._keys is None or not isinstance(note, Note):
+            self._notes.append(note)
+            self._order()
+            return
+
+        key = self._get_order_key(note)
+        idx = bisect_right(self._keys, key)
+        if idx == len(self._notes):
+            super()._insert(note)
+        else:
+            self._notes.insert(idx, note)
+            self._indexes = {}
+
+        self._keys.insert(idx, key)
+        self._members[note] += 1
+
+    def remove_note(self, note=None, freq=None, name=None, octave=None, strict=True):
+        """
+        Remove note by note, freq, name or octave from list
+        :param note: note to remove
+        :param freq: frequency to remove
+        :param name: name to remove
+        :param octave: octave to remove
+        :param strict: raise invalid_exception if note is not valid, not found or if list will be invalid after remove
+        :return: None
+        """
+        self._sync_keys()
+
+        if note is None or self._keys is None or not isinstance(note, Note):
+            super().remove_note(note=note, freq=freq, name=name, octave=octave, strict=strict)
+            return
+
+        count = self._members.get(note, 0)
+        if count == 0:
+            return
+
+        key = self._get_order_key(note)
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, start)
+
+        notes, keys = self._notes, self._keys
+        kept = [idx for idx in range(start, end) if notes[idx] != note]
+        indexes = self._remap_indexes([idx for idx in range(start, end) if notes[idx] == note])
+
+        self._notes = notes[:start] + [notes[idx] for idx in kept] + notes[end:]
+        self._keys = keys[:start] + [keys[idx] for idx in kept] + keys[end:]
+
+        if strict is True and not self.is_valid():
+            self._notes, self._keys = notes, keys
+            raise self.invalid_exception('Invalid {}.'.format(type(self).__name__))
+
+        del self._members[note]
+        self._indexes = indexes
+        self._invalidate()
+
+        if not self.is_valid():
+            self._order()
+
+    def _remove_positions(self, positions, strict=True):
+        if self._keys is None:
+            removed = super()._remove_positions(positions, strict=strict)
+            if removed > 0:
+                self._order()
+
+            return removed
+
+        notes, keys = self._notes, self._keys
+        removed = super()._remove_positions(positions, strict=strict)
+        if removed == 0:
+            return removed
+
+        if not self.is_valid():
+            self._order()
+            return removed
+
+        positions = set(positions)
+        self._keys = [key for idx, key in enumerate(keys) if idx not in positions]
+        self._members.subtract(notes[idx] for idx in positions)
+
+        return removed
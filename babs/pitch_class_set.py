@@ -0,0 +1,117 @@
+class PitchClassSet(object):
+    """
+    Immutable set of pitch classes (0 = C, 1 = C#/Db, ..., 11 = B) stored as a 12 bit mask
+    """
+
+    __slots__ = ('_mask',)
+
+    SIZE = 12
+    FULL_MASK = (1 << SIZE) - 1
+
+    def __init__(self, *pitch_classes):
+        """
+        :param pitch_classes: pitch classes, any int is reduced modulo 12
+        """
+        mask = 0
+        for pitch_class in pitch_classes:
+            mask |= 1 << (pitch_class % self.SIZE)
+
+        object.__setattr__(self, '_mask', mask)
+
+    def __setattr__(self, key, value):
+        raise AttributeError('PitchClassSet is immutable.')
+
+    def __eq__(self, other):
+        return isinstance(other, PitchClassSet) and self._mask == other.mask
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __len__(self):
+        return bin(self._mask).count('1')
+
+    def __iter__(self):
+        return (pitch_class for pitch_class in range(self.SIZE) if self._mask & (1 << pitch_class))
+
+    def __contains__(self, item):
+        """
+        :param item: pitch class or note
+        """
+        pitch_class = item if isinstance(item, int) else item.get_note_index()
+
+        return bool(self._mask & (1 << (pitch_class % self.SIZE)))
+
+    def __or__(self, other):
+        return self.from_mask(self._mask | other.mask)
+
+    def __and__(self, other):
+        return self.from_mask(self._mask & other.mask)
+
+    def __sub__(self, other):
+        return self.from_mask(self._mask & ~other.mask)
+
+    def __le__(self, other):
+        return self._mask & ~other.mask == 0
+
+    def __ge__(self, other):
+        return other.mask & ~self._mask == 0
+
+    def __repr__(self):
+        return 'PitchClassSet({})'.format(', '.join(str(pitch_class) for pitch_class in self))
+
+    def __reduce__(self):
+        return type(self).from_mask, (self._mask,)
+
+    @property
+    def mask(self):
+        return self._mask
+
+    def union(self, other):
+        return self | other
+
+    def intersection(self, other):
+        return self & other
+
+    def difference(self, other):
+        return self - other
+
+    def issubset(self, other):
+        return self <= other
+
+    def issuperset(self, other):
+        return self >= other
+
+    def transpose(self, semitones):
+        """
+        :param semitones: number of half steps, could be negative
+        :return: PitchClassSet with every pitch class moved by semitones
+        """
+        semitones %= self.SIZE
+
+        return self.from_mask(((self._mask << semitones) | (self._mask >> (self.SIZE - semitones))) & self.FULL_MASK)
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        :param mask: 12 bit mask, bit n set if pitch class n is in the set
+        :return: PitchClassSet
+        """
+        pitch_class_set = cls.__new__(cls)
+        object.__setattr__(pitch_class_set, '_mask', mask & cls.FULL_MASK)
+
+        return pitch_class_set
+
+    @classmethod
+    def from_notes(cls, notes):
+        """
+        :param notes: iterable of notes
+        :return: PitchClassSet with the pitch class of every note
+        """
+        mask = 0
+        for n in notes:
+            mask |= 1 << n.get_note_index()
+
+        return cls.from_mask(mask)
@@ -0,0 +1,302 @@
+from __future__ import division
+
+from multiprocessing import Pool
+
+import numpy as np
+
+from babs import Note, Rest
+from babs import wav
+
+
+class PitchDetector(object):
+    """
+    Streaming monophonic transcription of audio into Note and Rest events.
+    Samples are cut in overlapping frames every hop_size samples, the pitch of every frame is estimated with YIN
+    (difference function computed from an FFT autocorrelation, a batch of frames at a time) and consecutive frames
+    with the same pitch are joined in one event. Events are contiguous, silence and unvoiced frames are rests
+    """
+
+    BEATS_PER_WHOLE_NOTE = 4
+
+    def __init__(self, sample_rate=44100, tempo=120, frame_size=2048, hop_size=512, min_freq=50, max_freq=2000,
+                 threshold=0.15, silence=0.01, min_frames=3, pitches=None, alt=None, batch_size=64):
+        """
+        :param sample_rate: number of samples per second
+        :param tempo: number of quarter notes per minute, used to convert time into relative durations
+        :param frame_size: number of samples of every analysis frame
+        :param hop_size: number of samples between the start of two frames
+        :param min_freq: lowest detected frequency
+        :param max_freq: highest detected frequency
+        :param threshold: max normalized difference of a periodic frame, lower is stricter
+        :param silence: min RMS of a frame that is not a rest
+        :param min_frames: min number of frames of an event, shorter changes are joined to the previous event
+        :param pitches: pitches that could be detected (e.g Scale.pitch_set), None for all pitches
+        :param alt: note alteration 'sharp' or 'flat' used for note names
+        :param batch_size: number of frames analysed at a time
+        """
+        if not 0 < min_freq < max_freq:
+            raise ValueError('min_freq must be greater than 0 and lower than max_freq.')
+
+        if hop_size < 1 or batch_size < 1:
+            raise ValueError('hop_size and batch_size must be greater than 0.')
+
+        self.sample_rate = sample_rate
+        self.tempo = tempo
+        self.frame_size = frame_size
+        self.hop_size = hop_size
+        self.threshold = threshold
+        self.silence = silence
+        self.min_frames = min_frames
+        self.pitches = pitches
+        self.alt = alt
+
+        self._min_lag = max(int(sample_rate / max_freq), 2)
+        self._max_lag = int(np.ceil(sample_rate / min_freq))
+        if self._max_lag >= frame_size - 1:
+            raise ValueError('frame_size must be greater than sample_rate / min_freq.')
+
+        fft_size = 1
+        while fft_size < frame_size + self._max_lag:
+            fft_size *= 2
+
+        self._fft_size = fft_size
+        self._padded = np.zeros((batch_size, fft_size))
+        self._lags = np.arange(1, self._max_lag + 1)
+
+        self.reset()
+
+    def reset(self):
+        """
+        Forget samples and events received
+        :return: None
+        """
+        self._buffer = np.zeros(0)
+        self._samples = 0
+        self._frames = 0
+        self._segment = None
+        self._candidate = None
+
+    def get_duration(self, samples):
+        """
+        :param samples: number of samples
+        :return: relative duration (4/4 is a whole note)
+        """
+        return samples / self.sample_rate * self.tempo / 60 / self.BEATS_PER_WHOLE_NOTE
+
+    def estimate(self, frames):
+        """
+        :param frames: array of shape (frames, frame_size)
+        :return: array with the frequency of every frame, 0 for silent or unvoiced frames
+        """
+        frames = np.asarray(frames, dtype=np.float64)
+        freqs = np.zeros(len(frames))
+        batch_size = len(self._padded)
+
+        for start in range(0, len(frames), batch_size):
+            batch = frames[start:start + batch_size]
+            freqs[start:start + len(batch)] = self._estimate_batch(batch)
+
+        return freqs
+
+    def _estimate_batch(self, frames):
+        count, size = frames.shape
+        max_lag = self._max_lag
+
+        padded = self._padded[:count]
+        padded[:, :size] = frames
+        spectrum = np.fft.rfft(padded, axis=1)
+        correlation = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2, n=self._fft_size, axis=1)[:, 1:max_lag + 1]
+
+        energy = np.zeros((count, size + 1))
+        np.cumsum(frames ** 2, axis=1, out=energy[:, 1:])
+        difference = energy[:, size - self._lags] + energy[:, -1:] - energy[:, self._lags] - 2 * correlation
+        np.maximum(difference, 0, out=difference)
+
+        total = np.cumsum(difference, axis=1)
+        normalized = np.ones((count, max_lag + 2))
+        np.divide(difference * self._lags, total, out=normalized[:, 1:-1], where=total > 0)
+
+        lags = np.arange(self._min_lag, max_lag)
+        current = normalized[:, lags]
+        dips = (current < self.threshold) & (current <= normalized[:, lags + 1])
+        found = dips.any(axis=1)
+        lag = lags[np.argmax(dips, axis=1)]
+
+        rows = np.arange(count)
+        before, here, after = difference[rows, lag - 2], difference[rows, lag - 1], difference[rows, lag]
+        curvature = before - 2 * here + after
+        shift = np.zeros(count)
+        np.divide(before - after, 2 * curvature, out=shift, where=curvature > 0)
+
+        rms = np.sqrt(energy[:, -1] / size)
+        voiced = found & (rms >= self.silence)
+
+        return np.where(voiced, self.sample_rate / (lag + np.clip(shift, -1, 1)), 0)
+
+    def feed(self, samples):
+        """
+        :param samples: block of float samples, shape (frames,) or (frames, channels)
+        :return: list of (onset, event) of events ended so far, onset is a relative duration from the first sample
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1)
+
+        self._samples += len(samples)
+        buffer = np.concatenate((self._buffer, samples))
+        count = 0 if len(buffer) < self.frame_size else (len(buffer) - self.frame_size) // self.hop_size + 1
+
+        events = self._process(buffer, count)
+        self._buffer = buffer[count * self.hop_size:]
+
+        return events
+
+    def flush(self):
+        """
+        Analyse samples left, padded with silence, and end the last event. The detector is reset
+        :return: list of (onset, event) of events left
+        """
+        count = -(-self._samples // self.hop_size) - self._frames
+        buffer = self._buffer
+        if count > 0:
+            size = (count - 1) * self.hop_size + self.frame_size
+            buffer = np.concatenate((buffer, np.zeros(max(size - len(buffer), 0))))
+
+        events = self._process(buffer, max(count, 0))
+
+        if self._candidate is not None:
+            self._segment[2] += self._candidate[1]
+
+        if self._segment is not None:
+            events.append(self._get_event(*self._segment))
+
+        self.reset()
+
+        return events
+
+    def transcribe(self, blocks):
+        """
+        :param blocks: iterable of float samples blocks
+        :return: generator of (onset, event), onset is a relative duration from the first sample
+        """
+        self.reset()
+
+        for block in blocks:
+            for event in self.feed(block):
+                yield event
+
+        for event in self.flush():
+            yield event
+
+    def _process(self, buffer, count):
+        """
+        :param buffer: samples starting at the next frame
+        :param count: number of frames to analyse
+        :return: list of (onset, event) of events ended
+        """
+        if count == 0:
+            return []
+
+        stride = buffer.strides[0]
+        frames = np.lib.stride_tricks.as_strided(buffer, shape=(count, self.frame_size), strides=(self.hop_size * stride, stride))
+        pitches = Note.get_pitch_table().nearest_many(self.estimate(frames), pitches=self.pitches)[0]
+        events = []
+
+        for pitch in pitches.tolist():
+            self._add_frame(pitch, events)
+
+        return events
+
+    def _add_frame(self, pitch, events):
+        """
+        Join the frame to the current event or start a new one when min_frames frames have a different pitch
+        :param pitch: pitch of the frame, -1 for a rest
+        :param events: list where ended events are appended
+        :return: None
+        """
+        index = self._frames
+        self._frames += 1
+
+        if self._segment is None:
+            self._segment = [pitch, index, 1]
+            return
+
+        if self._candidate is not None and self._candidate[0] != pitch:
+            self._segment[2] += self._candidate[1]
+            self._candidate = None
+
+        if pitch == self._segment[0]:
+            self._segment[2] += 1
+            return
+
+        if self._candidate is None:
+            self._candidate = [pitch, 0]
+
+        self._candidate[1] += 1
+        if self._candidate[1] >= self.min_frames:
+            events.append(self._get_event(*self._segment))
+            self._segment = [pitch, index - self._candidate[1] + 1, self._candidate[1]]
+            self._candidate = None
+
+    def _get_position(self, frame):
+        """
+        :param frame: index of a frame
+        :return: sample where the frame starts to count, frames are centered on their hop except the first one
+        """
+        if frame == 0:
+            return 0
+
+        return min(frame * self.hop_size + (self.frame_size - self.hop_size) // 2, self._samples)
+
+    def _get_event(self, pitch, start, frames):
+        """
+        :return: (onset, event) of a segment of frames
+        """
+        onset = self._get_position(start)
+        duration = self.get_duration(self._get_position(start + frames) - onset)
+
+        if pitch < 0:
+            return self.get_duration(onset), Rest(duration=duration)
+
+        return self.get_duration(onset), Note.from_pitch(pitch, alt=self.alt, duration=duration)
+
+
+def transcribe_file(path, block_size=4096, **kwargs):
+    """
+    :param path: path of a PCM WAV file, channels are mixed down
+    :param block_size: number of frames read at a time
+    :param kwargs: options of PitchDetector, sample_rate is the one of the file
+    :return: list of (onset, event)
+    """
+    with wav.WavReader(path) as r:
+        detector = PitchDetector(sample_rate=r.sample_rate, **kwargs)
+
+        return list(detector.transcribe(r.blocks(block_size)))
+
+
+def _transcribe_job(args):
+    path, block_size, kwargs = args
+
+    return transcribe_file(path, block_size=block_size, **kwargs)
+
+
+def transcribe_many(paths, block_size=4096, processes=None, **kwargs):
+    """
+    Transcribe many files in parallel, one file per task
+    :param paths: iterable of paths of PCM WAV files
+    :param block_size: number of frames read at a time
+    :param processes: number of processes, default number of CPUs. 1 transcribes in the current process
+    :param kwargs: options of PitchDetector
+    :return: list with the events of every file
+    """
+    args = [(path, block_size, kwargs) for path in paths]
+
+    if processes == 1:
+        return [_transcribe_job(a) for a in args]
+
+    pool = Pool(processes)
+    try:
+        return pool.map(_transcribe_job, args)
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,167 @@
+from __future__ import division
+
+import math
+from bisect import bisect_left
+from collections import namedtuple
+
+
+PitchMatch = namedtuple('PitchMatch', ['pitch', 'freq', 'cents'])
+
+
+class PitchTable(object):
+    """
+    Precomputed mapping between pitch numbers and frequencies.
+    Pitch numbers follow the MIDI convention (A4 = 69, C4 = 60)
+    """
+
+    MIN_PITCH = 0
+    MAX_PITCH = 127
+    A_PITCH = 69
+
+    MAX_SORTED_INDEXES = 256
+
+    def __init__(self, freqs, min_pitch=MIN_PITCH):
+        """
+        :param freqs: frequencies of consecutive pitches, starting from min_pitch
+        :param min_pitch: pitch number of the first frequency
+        """
+        self.freqs = list(freqs)
+        self.min_pitch = min_pitch
+        self.max_pitch = min_pitch + len(self.freqs) - 1
+        self._pitches = {freq: pitch for pitch, freq in enumerate(self.freqs, min_pitch)}
+        self._sorted_indexes = {}
+
+    def __len__(self):
+        return len(self.freqs)
+
+    def __contains__(self, pitch):
+        return self.min_pitch <= pitch <= self.max_pitch
+
+    def get_freq(self, pitch):
+        """
+        :param pitch: pitch number
+        :return: frequency of the pitch or None if pitch is out of the table
+        """
+        if self.min_pitch <= pitch <= self.max_pitch:
+            return self.freqs[pitch - self.min_pitch]
+
+        return None
+
+    def get_pitch(self, freq):
+        """
+        :param freq: frequency
+        :return: pitch number if freq is exactly in the table, None otherwise
+        """
+        return self._pitches.get(freq)
+
+    def _get_sorted_index(self, pitches=None):
+        """
+        :param pitches: pitches in the index, None for all pitches in table
+        :return: tuple (sorted frequencies, pitches), cached by set of pitches
+        """
+        key = None if pitches is None else frozenset(pitches)
+        index = self._sorted_indexes.get(key)
+        if index is None:
+            items = sorted(
+                (self.freqs[pitch - self.min_pitch], pitch)
+                for pitch in (range(self.min_pitch, self.max_pitch + 1) if key is None else key)
+                if pitch is not None and pitch in self
+            )
+            index = ([freq for freq, pitch in items], [pitch for freq, pitch in items])
+
+            if len(self._sorted_indexes) >= self.MAX_SORTED_INDEXES:
+                self._sorted_indexes.clear()
+
+            self._sorted_indexes[key] = index
+
+        return index
+
+    def nearest(self, freq, pitches=None):
+        """
+        :param freq: frequency
+        :param pitches: pitches that could be found (e.g Scale.pitch_set), None for all pitches in table
+        :return: PitchMatch(pitch, freq, cents) of the nearest pitch, cents is the deviation of freq from the pitch.
+                 None if freq is not greater than 0 or there are no pitches
+        """
+        if not freq > 0:
+            return None
+
+        freqs, sorted_pitches = self._get_sorted_index(pitches)
+        if len(freqs) == 0:
+            return None
+
+        idx = bisect_left(freqs, freq)
+        if idx == len(freqs) or (idx > 0 and freq * freq < freqs[idx - 1] * freqs[idx]):
+            idx -= 1
+
+        return PitchMatch(sorted_pitches[idx], freqs[idx], 1200 * math.log(freq / freqs[idx], 2))
+
+    def k_nearest(self, freq, k, pitches=None):
+        """
+        :param freq: frequency
+        :param k: max number of pitches
+        :param pitches: pitches that could be found (e.g Scale.pitch_set), None for all pitches in table
+        :return: list of PitchMatch(pitch, freq, cents) from the nearest pitch, empty if freq is not greater than 0
+        """
+        if not freq > 0:
+            return []
+
+        freqs, sorted_pitches = self._get_sorted_index(pitches)
+        high = bisect_left(freqs, freq)
+        low = high - 1
+        matches = []
+
+        while len(matches) < k and (low >= 0 or high < len(freqs)):
+            if high == len(freqs) or (low >= 0 and freq * freq < freqs[low] * freqs[high]):
+                idx = low
+                low -= 1
+            else:
+                idx = high
+                high += 1
+
+            matches.append(PitchMatch(sorted_pitches[idx], freqs[idx], 1200 * math.log(freq / freqs[idx], 2)))
+
+        return matches
+
+    def nearest_many(self, freqs, pitches=None):
+        """
+        Find the nearest pitch of every frequency in a single vectorized pass. Needs NumPy
+        :param freqs: array of frequencies
+        :param pitches: pitches that could be found (e.g Scale.pitch_set), None for all pitches in table
+        :return: tuple of arrays (pitches, cents), pitch is -1 and cents is 0 for frequencies not greater than 0
+        """
+        import numpy as np
+
+        freqs = np.asarray(freqs, dtype=np.float64)
+        sorted_freqs, sorted_pitches = self._get_sorted_index(pitches)
+        valid = freqs > 0
+        if len(sorted_freqs) == 0:
+            return np.full(freqs.shape, -1, dtype=np.int64), np.zeros(freqs.shape)
+
+        sorted_freqs = np.asarray(sorted_freqs, dtype=np.float64)
+        idx = np.searchsorted(sorted_freqs, freqs)
+        low = np.clip(idx - 1, 0, len(sorted_freqs) - 1)
+        high = np.clip(idx, 0, len(sorted_freqs) - 1)
+        idx = np.where((idx == len(sorted_freqs)) | ((idx > 0) & (freqs * freqs < sorted_freqs[low] * sorted_freqs[high])), low, high)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cents = 1200 * np.log2(freqs / sorted_freqs[idx])
+
+        return (
+            np.where(valid, np.asarray(sorted_pitches, dtype=np.int64)[idx], -1),
+            np.where(valid, cents, 0)
+        )
+
+    @classmethod
+    def equal_temperament(cls, a_frequency=440, half_step_interval=2 ** (1 / 12), min_pitch=MIN_PITCH, max_pitch=MAX_PITCH):
+        """
+        :param a_frequency: frequency of A4
+        :param half_step_interval: ratio between two consecutive pitches
+        :param min_pitch: lowest pitch in table
+        :param max_pitch: highest pitch in table
+        :return: PitchTable
+        """
+        return cls(
+            [round(a_frequency * (half_step_interval ** (pitch - cls.A_PITCH)), 2) for pitch in range(min_pitch, max_pitch + 1)],
+            min_pitch=min_pitch
+        )
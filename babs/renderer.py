@@ -0,0 +1,257 @@
+from __future__ import division
+
+import numpy as np
+
+from babs import Chord, NoteList
+from babs.cache import LRUCache
+
+
+class Renderer(object):
+    """
+    Offline audio renderer of notes, rests and note lists to PCM NumPy buffers.
+    Notes of a Chord sound together, notes of any other NoteList and items of any other iterable are played one after another
+    """
+
+    BEATS_PER_WHOLE_NOTE = 4
+
+    # Max number of samples synthesized in one array operation, temporary float64 arrays are voices * SLICE_SIZE
+    SLICE_SIZE = 8192
+
+    def __init__(self, sample_rate=44100, tempo=120, amplitude=0.5, harmonics=None, table_size=4096, fade=0.005,
+                 cache_size=256, cache_bytes=32 * 2 ** 20):
+        """
+        :param sample_rate: number of samples per second
+        :param tempo: number of quarter notes per minute
+        :param amplitude: max amplitude of the signal, between 0 and 1
+        :param harmonics: relative amplitude of every partial of the waveform, default [1] (sine wave)
+        :param table_size: number of samples of the wavetable
+        :param fade: duration in seconds of fade in and fade out of every note
+        :param cache_size: max number of rendered notes and chords kept in cache
+        :param cache_bytes: max total size in bytes of rendered notes and chords kept in cache, longer events are not cached
+        """
+        if harmonics is None:
+            harmonics = [1]
+
+        self.sample_rate = sample_rate
+        self.tempo = tempo
+        self.amplitude = amplitude
+        self.fade = fade
+
+        phase = np.arange(table_size + 1) / table_size
+        table = np.zeros(table_size + 1)
+        for partial, partial_amplitude in enumerate(harmonics, 1):
+            table += partial_amplitude * np.sin(2 * np.pi * partial * phase)
+
+        peak = np.abs(table).max()
+        self._table = table / peak if peak > 0 else table
+        self._table_size = table_size
+        self._cache = _SampleCache(maxsize=cache_size, maxbytes=cache_bytes)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_cache'] = _SampleCache(maxsize=self._cache.maxsize, maxbytes=self._cache.maxbytes)
+
+        return state
+
+    def get_samples(self, duration):
+        """
+        :param duration: relative duration (4/4 is a whole note)
+        :return: number of samples
+        """
+        return int(round(duration * self.BEATS_PER_WHOLE_NOTE * 60 / self.tempo * self.sample_rate))
+
+    def get_length(self, events):
+        """
+        :param events: Note, Rest, NoteList or iterable of them
+        :return: number of samples of the rendered events
+        """
+        return sum(self.get_samples(self._get_duration(event)) for event in self.flatten(events))
+
+    def render(self, events):
+        """
+        :param events: Note, Rest, NoteList or iterable of them
+        :return: float32 array of samples
+        """
+        events = list(self.flatten(events))
+        output = np.zeros(sum(self.get_samples(self._get_duration(event)) for event in events), dtype=np.float32)
+
+        offset = 0
+        for event in events:
+            for count, samples in self._iter_event(event, self.get_samples(self._get_duration(event))):
+                if samples is not None:
+                    output[offset:offset + count] = samples
+
+                offset += count
+
+        return output
+
+    def stream(self, events, block_size=4096):
+        """
+        Render events block by block, events longer than cache_bytes are synthesized slice by slice
+        :param events: Note, Rest, NoteList or iterable of them
+        :param block_size: number of samples of every block
+        :return: generator of float32 arrays of block_size samples, the last block could be shorter
+        """
+        block = np.zeros(block_size, dtype=np.float32)
+        filled = 0
+
+        for event in self.flatten(events):
+            for size, samples in self._iter_event(event, self.get_samples(self._get_duration(event))):
+                done = 0
+                while done < size:
+                    count = min(block_size - filled, size - done)
+                    if samples is None:
+                        block[filled:filled + count] = 0
+                    else:
+                        block[filled:filled + count] = samples[done:done + count]
+
+                    filled += count
+                    done += count
+
+                    if filled == block_size:
+                        yield block.copy()
+                        filled = 0
+
+        if filled > 0:
+            yield block[:filled].copy()
+
+    @staticmethod
+    def flatten(events):
+        """
+        :param events: Note, Rest, NoteList or iterable of them
+        :return: generator of events played one after another, a Chord is a single event
+        """
+        if isinstance(events, Chord) or not (isinstance(events, NoteList) or hasattr(events, '__iter__')):
+            yield events
+            return
+
+        for event in (events.notes if isinstance(events, NoteList) else events):
+            if isinstance(event, NoteList) and not isinstance(event, Chord):
+                for n in event.notes:
+                    yield n
+            else:
+                yield event
+
+    @staticmethod
+    def _get_notes(event):
+        if isinstance(event, NoteList):
+            return event.notes
+
+        if hasattr(event, 'freq'):
+            return [event]
+
+        return []
+
+    def _get_duration(self, event):
+        if isinstance(event, NoteList):
+            return max([n.duration for n in event.notes] or [0])
+
+        return event.duration
+
+    def _iter_event(self, event, size):
+        """
+        :param size: number of samples of the event
+        :return: generator of (number of samples, float32 array or None for silence) slices of SLICE_SIZE samples
+        """
+        notes = self._get_notes(event)
+        if len(notes) == 0 or size == 0:
+            for start in range(0, size, self.SLICE_SIZE):
+                yield min(self.SLICE_SIZE, size - start), None
+            return
+
+        voices = tuple((n.freq, self.get_samples(n.duration)) for n in notes)
+
+        if size * np.dtype(np.float32).itemsize > self._cache.maxbytes:
+            for start in range(0, size, self.SLICE_SIZE):
+                count = min(self.SLICE_SIZE, size - start)
+                yield count, self._synthesize(voices, start, count)
+            return
+
+        samples = self._cache.get_or_create(voices + (size,), lambda: self._synthesize_all(voices, size))
+        for start in range(0, size, self.SLICE_SIZE):
+            yield min(self.SLICE_SIZE, size - start), samples[start:start + self.SLICE_SIZE]
+
+    def _synthesize_all(self, voices, size):
+        """
+        :return: float32 array of all samples of voices, synthesized in slices of SLICE_SIZE samples
+        """
+        samples = np.empty(size, dtype=np.float32)
+        for start in range(0, size, self.SLICE_SIZE):
+            count = min(self.SLICE_SIZE, size - start)
+            samples[start:start + count] = self._synthesize(voices, start, count)
+
+        return samples
+
+    def _synthesize(self, voices, start, count):
+        """
+        Additive synthesis of a slice of all voices in one array operation
+        :param voices: tuple of (freq, number of samples)
+        :param start: position of the first sample of the slice
+        :param count: number of samples of the slice
+        :return: float32 array
+        """
+        freqs = np.array([freq for freq, length in voices], dtype=np.float64)
+        lengths = np.array([length for freq, length in voices])
+
+        increment = freqs * self._table_size / self.sample_rate
+        offset = np.arange(count)
+        phase = (np.outer(increment, offset) + (increment * start % self._table_size)[:, None]) % self._table_size
+        index = phase.astype(np.int64)
+        fraction = phase - index
+        waves = self._table[index] * (1 - fraction) + self._table[index + 1] * fraction
+
+        fade = max(1, int(self.fade * self.sample_rate))
+        position = offset + start
+        remaining = lengths[:, None] - position[None, :]
+        envelope = np.clip(np.minimum(position[None, :] + 1, remaining) / fade, 0, 1)
+
+        return (self.amplitude / len(voices) * (waves * envelope).sum(axis=0)).astype(np.float32)
+
+
+class _SampleCache(LRUCache):
+    """
+    LRU cache of sample arrays bounded by number of items and by bytes
+    """
+
+    def __init__(self, maxsize=256, maxbytes=32 * 2 ** 20):
+        """
+        :param maxsize: max number of arrays in cache, None for no limit
+        :param maxbytes: max total size in bytes of arrays in cache
+        """
+        super().__init__(maxsize=maxsize)
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+
+    def put(self, key, value):
+        """
+        Add an array to cache, evicting the least recently used arrays while cache is full
+        :param key: key of the array
+        :param value: array
+        :return: None
+        """
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous.nbytes
+
+        self._items[key] = value
+        self.nbytes += value.nbytes
+
+        while len(self._items) > 0 and (self.nbytes > self.maxbytes or (self.maxsize is not None and len(self._items) > self.maxsize)):
+            self.nbytes -= self._items.popitem(last=False)[1].nbytes
+
+    def clear(self):
+        """
+        Remove all arrays and reset statistics
+        :return: None
+        """
+        super().clear()
+        self.nbytes = 0
+
+    def info(self):
+        """
+        :return: dict with hits, misses, size, maxsize, nbytes and maxbytes
+        """
+        info = super().info()
+        info.update(nbytes=self.nbytes, maxbytes=self.maxbytes)
+
+        return info
@@ -1,9 +1,11 @@
-from babs import Note, NoteList
+from collections import OrderedDict
+
+from babs import Note, NoteList, OrderedNoteList, instrumentation
 
 from babs.exceptions import ScaleException
 
 
-class Scale(NoteList):
+class Scale(OrderedNoteList):
     """
     Set of musical notes ordered by fundamental frequency or pitch
     """
@@ -37,13 +39,12 @@ class Scale(NoteList):
         self._order_type = kwargs.pop('order', self.ASCENDING_SCALE_TYPE)
 
         super().__init__(*notes, strict=kwargs.pop('strict', True), invalid_exception=ScaleException)
-        self._notes = list(set(self._notes))
+        self._notes = list(OrderedDict.fromkeys(self._notes))
 
         self._order()
 
-    def _order(self):
-        if self.is_valid():
-            self._notes.sort(key=lambda note: note.freq, reverse=False if self._order_type == self.ASCENDING_SCALE_TYPE else True)
+    def _get_order_key(self, note):
+        return note.freq if self._order_type == self.ASCENDING_SCALE_TYPE else -note.freq
 
     def add_note(self, note, strict=True):
         """
@@ -52,14 +53,13 @@ class Scale(NoteList):
         :param strict: raise ScaleException if note is not valid, not found or if chord will be invalid
         :return: None
         """
-        if note in self._notes:
+        if note in self:
             if strict is True:
                 raise ScaleException('Note {} is alredy in Scale.'.format(str(note)))
 
             return
 
         super().add_note(note=note, strict=strict)
-        self._order()
 
     def remove_note(self, note=None, freq=None, name=None, octave=None, strict=True):
         """
@@ -72,19 +72,37 @@ class Scale(NoteList):
         :return: None
         """
         super().remove_note(note=note, freq=freq, name=name, octave=octave, strict=strict)
-        self._order()
+
+    def compatible_chords(self, alt=None, matrix=None):
+        """
+        :param alt: note alteration 'sharp' or 'flat' used for root names
+        :param matrix: CompatibilityMatrix, default is the matrix of all Chord and Scale types
+        :return: tuple of ChordMatch(root, chord_type) of chords with all notes in the scale
+        """
+        if matrix is None:
+            from babs.compatibility import CompatibilityMatrix
+
+            matrix = CompatibilityMatrix.get_default()
+
+        return matrix.compatible_chords(self.pitch_class_set, alt=alt)
 
     @classmethod
-    def create_from_root(cls, root, scale_type=None, octave=NoteList.OCTAVE_TYPE_ROOT, alt=Note.SHARP, order=None, strict=True):
+    @instrumentation.timed('scale.create_from_root')
+    def create_from_root(cls, root, scale_type=None, octave=NoteList.OCTAVE_TYPE_ROOT, alt=Note.SHARP, order=None, strict=True, cache=None, memo=None, shared=False):
         """
         :param root: root note
         :param scale_type: a list of notes distance from root note
         :param octave: octave of notes in chord
         :param alt: note alteration 'sharp' or 'flat'
+        :param cache: NoteCache used to get shared notes instead of creating new ones
+        :param memo: NoteListCache used to reuse scales already created, ignored if octave is callable or cache is given
+        :param shared: return the scale cached in memo instead of a copy, it must not be changed
         :type root: Note
         :type scale_type: list
         :type octave: Union[int, string, callable]
         :type alt: string
+        :type cache: NoteCache
+        :type memo: NoteListCache
         :return: Scale
         """
         
@@ -94,7 +112,14 @@ class Scale(NoteList):
         if order is None:
             order = Scale.ASCENDING_SCALE_TYPE
 
-        notes = NoteList.get_notes_from_root(root=root, note_list_type=scale_type, octave=octave, alt=alt)
+        if memo is not None and cache is None and not callable(octave):
+            return memo.get_note_list(
+                memo.get_key(cls, root, scale_type, octave, alt, order, strict),
+                lambda: cls.create_from_root(root=root, scale_type=scale_type, octave=octave, alt=alt, order=order, strict=strict).copy(),
+                shared=shared
+            )
+
+        notes = NoteList.get_notes_from_root(root=root, note_list_type=scale_type, octave=octave, alt=alt, cache=cache)
 
         return cls(
             *notes,
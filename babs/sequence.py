@@ -0,0 +1,271 @@
+from __future__ import division
+
+from babs import NoteList
+
+
+class _Node(object):
+    """
+    Node of a centered interval tree
+    """
+
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+
+class Sequence(object):
+    """
+    Events (Note, Rest, Chord) positioned in time by integer tick onsets
+    """
+
+    DEFAULT_TICKS_PER_BEAT = 480
+
+    def __init__(self, events=None, ticks_per_beat=DEFAULT_TICKS_PER_BEAT):
+        """
+        :param events: iterable of events appended one after another
+        :param ticks_per_beat: number of ticks of a quarter note
+        """
+        self.ticks_per_beat = ticks_per_beat
+        self._events = []
+        self._onsets = []
+        self._lengths = []
+        self._end = 0
+        self._tree = None
+
+        if events is not None:
+            self.extend(events)
+
+    def __len__(self):
+        return len(self._events)
+
+    def __iter__(self):
+        return iter(zip(self._onsets, self._events))
+
+    def __getitem__(self, key):
+        return self._onsets[key], self._events[key]
+
+    def __eq__(self, other):
+        return isinstance(other, Sequence) and list(self) == list(other) and self._lengths == other.lengths
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __add__(self, other):
+        sequence = self.copy()
+        sequence.extend(other)
+
+        return sequence
+
+    def __iadd__(self, other):
+        self.extend(other)
+
+        return self
+
+    def __repr__(self):
+        return 'Sequence({}, ticks_per_beat={})'.format(
+            ','.join('{}@{}'.format(repr(event), onset) for onset, event in self), self.ticks_per_beat
+        )
+
+    @property
+    def events(self):
+        return self._events
+
+    @property
+    def onsets(self):
+        return self._onsets
+
+    @property
+    def lengths(self):
+        return self._lengths
+
+    @property
+    def end(self):
+        """
+        :return: tick where the next appended event starts
+        """
+        return self._end
+
+    def get_ticks(self, duration):
+        """
+        :param duration: relative duration (4/4 is a whole note)
+        :return: number of ticks
+        """
+        return int(round(duration * 4 * self.ticks_per_beat))
+
+    def get_length(self, event):
+        """
+        :param event: Note, Rest or NoteList, notes of a NoteList sound together
+        :return: number of ticks of event
+        """
+        if isinstance(event, NoteList):
+            return max([self.get_ticks(n.duration) for n in event.notes] or [0])
+
+        return self.get_ticks(event.duration)
+
+    def add(self, event, onset):
+        """
+        Add event at onset, it could overlap other events. end is moved if the event ends after it
+        :param event: Note, Rest or NoteList
+        :param onset: tick where event starts
+        :return: None
+        """
+        length = self.get_length(event)
+
+        self._events.append(event)
+        self._onsets.append(onset)
+        self._lengths.append(length)
+        self._end = max(self._end, onset + length)
+        self._tree = None
+
+    def append(self, event):
+        """
+        Add event at end
+        :param event: Note, Rest or NoteList
+        :return: None
+        """
+        self.add(event, self._end)
+
+    def extend(self, events):
+        """
+        Add events one after another at end. Events of a Sequence keep their relative onsets
+        :param events: Sequence or iterable of events
+        :return: None
+        """
+        if isinstance(events, Sequence):
+            offset = self._end
+            factor = self.ticks_per_beat / events.ticks_per_beat
+            # lists are built before extending, events could be this sequence (e.g s += s)
+            seq_events = list(events.events)
+            onsets = [offset + int(round(onset * factor)) for onset in events.onsets]
+            lengths = [int(round(length * factor)) for length in events.lengths]
+            end = offset + int(round(events.end * factor))
+
+            self._events.extend(seq_events)
+            self._onsets.extend(onsets)
+            self._lengths.extend(lengths)
+            self._end = max(self._end, end)
+            self._tree = None
+        else:
+            for event in events:
+                self.append(event)
+
+    def copy(self):
+        """
+        :return: shallow copy of the sequence, events are shared
+        """
+        sequence = type(self)(ticks_per_beat=self.ticks_per_beat)
+        sequence.extend(self)
+
+        return sequence
+
+    def at(self, tick):
+        """
+        :param tick: time in ticks
+        :return: list of (onset, event) of events sounding at tick, sorted by onset
+        """
+        positions = []
+        node = self._get_tree()
+
+        while node is not None:
+            if tick < node.center:
+                for start, end, position in node.by_start:
+                    if start > tick:
+                        break
+                    positions.append(position)
+                node = node.left
+            elif tick > node.center:
+                for start, end, position in node.by_end:
+                    if end <= tick:
+                        break
+                    positions.append(position)
+                node = node.right
+            else:
+                positions.extend(position for start, end, position in node.by_start)
+                break
+
+        return self._get_items(positions)
+
+    def overlap(self, start, end):
+        """
+        :param start: first tick of the window
+        :param end: tick after the last one of the window
+        :return: list of (onset, event) of events sounding in [start, end), sorted by onset
+        """
+        positions = []
+        nodes = [self._get_tree()]
+
+        while len(nodes) > 0:
+            node = nodes.pop()
+            if node is None or start >= end:
+                continue
+
+            if end <= node.center:
+                for interval_start, interval_end, position in node.by_start:
+                    if interval_start >= end:
+                        break
+                    positions.append(position)
+                nodes.append(node.left)
+            elif start > node.center:
+                for interval_start, interval_end, position in node.by_end:
+                    if interval_end <= start:
+                        break
+                    positions.append(position)
+                nodes.append(node.right)
+            else:
+                positions.extend(position for interval_start, interval_end, position in node.by_start)
+                nodes.append(node.left)
+                nodes.append(node.right)
+
+        return self._get_items(positions)
+
+    def _get_items(self, positions):
+        positions.sort(key=lambda p: (self._onsets[p], p))
+
+        return [(self._onsets[p], self._events[p]) for p in positions]
+
+    def _get_tree(self):
+        """
+        Centered interval tree of events with length greater than 0, built when needed and kept until events are added
+        :return: root node
+        """
+        if self._tree is None:
+            intervals = [
+                (onset, onset + length, position)
+                for position, (onset, length) in enumerate(zip(self._onsets, self._lengths)) if length > 0
+            ]
+            intervals.sort()
+            self._tree = self._build(intervals)
+
+        return self._tree
+
+    @classmethod
+    def _build(cls, intervals):
+        """
+        :param intervals: list of (start, end, position) sorted by start
+        :return: _Node or None
+        """
+        if len(intervals) == 0:
+            return None
+
+        center = intervals[len(intervals) // 2][0]
+        left, here, right = [], [], []
+        for interval in intervals:
+            if interval[1] <= center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+
+        return _Node(
+            center,
+            here,
+            sorted(here, key=lambda interval: -interval[1]),
+            cls._build(left),
+            cls._build(right)
+        )
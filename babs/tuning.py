@@ -0,0 +1,207 @@
+from __future__ import division
+
+from abc import ABC, abstractmethod
+from fractions import Fraction
+
+from babs.note import Note
+from babs.pitch_table import PitchTable
+from babs.exceptions import TuningException
+
+
+class Tuning(ABC):
+    """
+    Mapping from pitch numbers (MIDI convention, A4 = 69) to frequencies, compiled to a PitchTable when needed
+    """
+
+    def __init__(self):
+        self._table = None
+
+    @abstractmethod
+    def get_freq(self, pitch):
+        """
+        :param pitch: pitch number
+        :return: frequency of the pitch, not rounded
+        """
+        pass
+
+    def get_table(self):
+        """
+        :return: PitchTable with the frequency of every pitch from PitchTable.MIN_PITCH to PitchTable.MAX_PITCH,
+                 rounded as Note does
+        """
+        if self._table is None:
+            self._table = PitchTable([round(self.get_freq(p), 2) for p in range(PitchTable.MIN_PITCH, PitchTable.MAX_PITCH + 1)])
+
+        return self._table
+
+    def get_rounded_freq(self, pitch):
+        """
+        :param pitch: pitch number
+        :return: frequency of the pitch rounded as Note does
+        """
+        freq = self.get_table().get_freq(pitch)
+
+        return round(self.get_freq(pitch), 2) if freq is None else freq
+
+    def retune_note(self, note):
+        """
+        :param note: Note
+        :return: new note with the same pitch, name and octave and the frequency of this tuning
+        """
+        return note._from_values(self.get_rounded_freq(note.pitch), note.name, note.octave, note.alt, note.pitch, note.duration)
+
+    def retune(self, notes):
+        """
+        :param notes: iterable of notes
+        :return: list of retuned notes, items that are not notes are kept
+        """
+        return [self.retune_note(n) if isinstance(n, Note) else n for n in notes]
+
+
+class EqualTemperament(Tuning):
+    """
+    Twelve tone equal temperament with any reference pitch and frequency
+    """
+
+    def __init__(self, reference_frequency=440, reference_pitch=PitchTable.A_PITCH):
+        """
+        :param reference_frequency: frequency of the reference pitch
+        :param reference_pitch: pitch number of the reference, default A4
+        """
+        super().__init__()
+        self.reference_frequency = reference_frequency
+        self.reference_pitch = reference_pitch
+
+    def get_freq(self, pitch):
+        return self.reference_frequency * 2 ** ((pitch - self.reference_pitch) / len(Note.NOTES))
+
+
+class RatioTuning(Tuning):
+    """
+    Tuning defined by the ratios of the degrees from the tonic, repeated every period (e.g octave)
+    """
+
+    def __init__(self, ratios, tonic=60, tonic_frequency=None, period=2):
+        """
+        :param ratios: ratio of every degree from the tonic, starting from 1
+        :param tonic: pitch number of the tonic
+        :param tonic_frequency: frequency of the tonic, default its frequency in equal temperament with A4 = 440Hz
+        :param period: ratio after which degrees repeat
+        """
+        super().__init__()
+
+        if len(ratios) < 1:
+            raise TuningException('Invalid ratios.')
+
+        self.ratios = [float(r) for r in ratios]
+        self.tonic = tonic
+        self.tonic_frequency = EqualTemperament().get_freq(tonic) if tonic_frequency is None else tonic_frequency
+        self.period = float(period)
+
+    def get_freq(self, pitch):
+        periods, degree = divmod(pitch - self.tonic, len(self.ratios))
+
+        return self.tonic_frequency * (self.period ** periods) * self.ratios[degree]
+
+
+class JustIntonation(RatioTuning):
+    """
+    Five limit just intonation relative to a tonic
+    """
+
+    RATIOS = [
+        Fraction(1), Fraction(16, 15), Fraction(9, 8), Fraction(6, 5), Fraction(5, 4), Fraction(4, 3),
+        Fraction(45, 32), Fraction(3, 2), Fraction(8, 5), Fraction(5, 3), Fraction(9, 5), Fraction(15, 8)
+    ]
+
+    def __init__(self, tonic=60, tonic_frequency=None):
+        """
+        :param tonic: pitch number of the tonic
+        :param tonic_frequency: frequency of the tonic, default its frequency in equal temperament with A4 = 440Hz
+        """
+        super().__init__(self.RATIOS, tonic=tonic, tonic_frequency=tonic_frequency)
+
+
+class Pythagorean(RatioTuning):
+    """
+    Pythagorean tuning relative to a tonic, built from pure fifths (3/2)
+    """
+
+    RATIOS = [
+        Fraction(1), Fraction(256, 243), Fraction(9, 8), Fraction(32, 27), Fraction(81, 64), Fraction(4, 3),
+        Fraction(729, 512), Fraction(3, 2), Fraction(128, 81), Fraction(27, 16), Fraction(16, 9), Fraction(243, 128)
+    ]
+
+    def __init__(self, tonic=60, tonic_frequency=None):
+        """
+        :param tonic: pitch number of the tonic
+        :param tonic_frequency: frequency of the tonic, default its frequency in equal temperament with A4 = 440Hz
+        """
+        super().__init__(self.RATIOS, tonic=tonic, tonic_frequency=tonic_frequency)
+
+
+class ScalaTuning(RatioTuning):
+    """
+    Tuning read from a Scala (.scl) file, every degree is mapped to a pitch number starting from the tonic
+    """
+
+    def __init__(self, ratios, period=2, description='', tonic=60, tonic_frequency=None):
+        """
+        :param ratios: ratio of every degree from the tonic, starting from 1
+        :param period: ratio after which degrees repeat, last pitch of the Scala file
+        :param description: description of the scale
+        :param tonic: pitch number of the tonic
+        :param tonic_frequency: frequency of the tonic, default its frequency in equal temperament with A4 = 440Hz
+        """
+        super().__init__(ratios, tonic=tonic, tonic_frequency=tonic_frequency, period=period)
+        self.description = description
+
+    @staticmethod
+    def _parse_value(value):
+        """
+        :param value: ratio (e.g 3/2 or 2) or cents if it contains a dot (e.g 701.955)
+        :return: ratio
+        """
+        value = value.split()[0]
+        if '.' in value:
+            return 2 ** (float(value) / 1200)
+
+        ratio = Fraction(value)
+        if ratio <= 0:
+            raise ValueError('Invalid ratio.')
+
+        return ratio
+
+    @classmethod
+    def parse(cls, text, tonic=60, tonic_frequency=None):
+        """
+        :param text: content of a Scala file
+        :param tonic: pitch number of the tonic
+        :param tonic_frequency: frequency of the tonic, default its frequency in equal temperament with A4 = 440Hz
+        :return: ScalaTuning
+        """
+        lines = [line.strip() for line in text.splitlines() if not line.startswith('!')]
+        if len(lines) < 2:
+            raise TuningException('Invalid Scala file.')
+
+        try:
+            count = int(lines[1].split()[0])
+            values = [cls._parse_value(line) for line in lines[2:2 + count]]
+        except (ValueError, IndexError, ZeroDivisionError):
+            raise TuningException('Invalid Scala file.')
+
+        if count < 1 or len(values) != count:
+            raise TuningException('Invalid Scala file.')
+
+        return cls([1] + values[:-1], period=values[-1], description=lines[0], tonic=tonic, tonic_frequency=tonic_frequency)
+
+    @classmethod
+    def from_file(cls, path, tonic=60, tonic_frequency=None):
+        """
+        :param path: path of the Scala file
+        :param tonic: pitch number of the tonic
+        :param tonic_frequency: frequency of the tonic, default its frequency in equal temperament with A4 = 440Hz
+        :return: ScalaTuning
+        """
+        with open(path, encoding='latin-1') as f:
+            return cls.parse(f.read(), tonic=tonic, tonic_frequency=tonic_frequency)
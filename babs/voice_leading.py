@@ -0,0 +1,124 @@
+from __future__ import division
+
+from collections import namedtuple
+
+import numpy as np
+
+from babs import Note, Chord
+from babs.cache import LRUCache
+
+
+VoiceLeading = namedtuple('VoiceLeading', ['pitches', 'cost'])
+
+
+class VoiceLeader(object):
+    """
+    Choose voicings of a chord progression that minimize the total movement of voices.
+    Every chord has a set of candidate voicings in the pitch range and
+    the best path through them is found with dynamic programming
+    """
+
+    def __init__(self, low=48, high=79, voices=None, max_span=24, max_candidates=256, alt=None, cache_size=1024):
+        """
+        :param low: lowest pitch of voices (MIDI convention, C3 = 48)
+        :param high: highest pitch of voices
+        :param voices: number of voices, default max number of pitch classes of chords in progression
+        :param max_span: max distance in half steps between lowest and highest voice
+        :param max_candidates: max number of voicings considered for every chord, closest voicings first
+        :param alt: note alteration 'sharp' or 'flat' used for note names
+        :param cache_size: max number of candidate sets kept in cache
+        """
+        if low > high:
+            raise ValueError('low must be lower than high.')
+
+        self.low = low
+        self.high = high
+        self.voices = voices
+        self.max_span = max_span
+        self.max_candidates = max_candidates
+        self.alt = alt
+        self._candidates = LRUCache(maxsize=cache_size)
+
+    def candidates(self, pitch_class_set, voices):
+        """
+        :param pitch_class_set: PitchClassSet of the chord
+        :param voices: number of voices
+        :return: array of shape (candidates, voices) with ascending pitches of every voicing,
+                 every pitch class is used at least once. Candidates are cached by pitch classes and voices
+        """
+        return self._candidates.get_or_create(
+            (pitch_class_set.mask, voices),
+            lambda: self._create_candidates(pitch_class_set, voices)
+        )
+
+    def _create_candidates(self, pitch_class_set, voices):
+        if len(pitch_class_set) > voices:
+            raise ValueError('Chord has more pitch classes than voices.')
+
+        voicings = Chord.generate_voicings(pitch_class_set, self.low, self.high, voices, max_span=self.max_span)
+        candidates = np.array(list(voicings), dtype=np.int64).reshape(-1, voices)
+        if len(candidates) == 0:
+            raise ValueError('No voicing of {} in range.'.format(pitch_class_set))
+
+        center = (self.low + self.high) / 2
+        spread = candidates[:, -1] - candidates[:, 0]
+        distance = np.abs(candidates.mean(axis=1) - center)
+        order = np.lexsort((distance, spread))[:self.max_candidates]
+
+        return candidates[order]
+
+    @staticmethod
+    def costs(source, target):
+        """
+        :param source: array of shape (n, voices)
+        :param target: array of shape (m, voices)
+        :return: array of shape (n, m) with the total movement in half steps from every source to every target voicing
+        """
+        return np.abs(source[:, None, :] - target[None, :, :]).sum(axis=2)
+
+    def solve(self, chords):
+        """
+        :param chords: iterable of Chord
+        :return: VoiceLeading(pitches, cost), pitches is an array of shape (chords, voices)
+        """
+        pitch_class_sets = [c.pitch_class_set for c in chords]
+        voices = self.voices
+        if voices is None:
+            voices = max([len(pcs) for pcs in pitch_class_sets] or [0])
+
+        if len(pitch_class_sets) == 0:
+            return VoiceLeading(np.zeros((0, voices), dtype=np.int64), 0)
+
+        candidates = [self.candidates(pcs, voices) for pcs in pitch_class_sets]
+        total = np.zeros(len(candidates[0]), dtype=np.int64)
+        back = []
+
+        for source, target in zip(candidates, candidates[1:]):
+            paths = total[:, None] + self.costs(source, target)
+            best = np.argmin(paths, axis=0)
+            back.append(best)
+            total = paths[best, np.arange(len(target))]
+
+        idx = int(np.argmin(total))
+        cost = int(total[idx])
+        path = [idx]
+        for best in reversed(back):
+            idx = int(best[idx])
+            path.append(idx)
+
+        path.reverse()
+
+        return VoiceLeading(np.array([c[i] for c, i in zip(candidates, path)]), cost)
+
+    def lead(self, chords):
+        """
+        :param chords: iterable of Chord
+        :return: list of Chord with the chosen voicings, notes last as the longest note of the original chord
+        """
+        chords = list(chords)
+        pitches = self.solve(chords).pitches
+
+        return [
+            Chord(*[Note.from_pitch(int(p), alt=self.alt, duration=max(n.duration for n in c.notes)) for p in voicing], strict=False)
+            for c, voicing in zip(chords, pitches)
+        ]
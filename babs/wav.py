@@ -0,0 +1,317 @@
+from __future__ import division
+
+import struct
+import wave
+from multiprocessing import Pool
+
+import numpy as np
+
+from babs.renderer import Renderer
+
+
+HEADER_FORMAT = '<4sI4s4sIHHIIHH4sI'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+SAMPLE_TYPES = {2: '<i2', 4: '<i4'}
+
+
+def get_header(data_size, sample_rate=44100, channels=1, sample_width=2):
+    """
+    :param data_size: size in bytes of the samples
+    :param sample_rate: number of frames per second
+    :param channels: number of channels
+    :param sample_width: size in bytes of a sample, 2 or 4
+    :return: bytes of the PCM WAV header
+    """
+    block_align = channels * sample_width
+
+    return struct.pack(
+        HEADER_FORMAT,
+        b'RIFF', HEADER_SIZE - 8 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sample_width * 8,
+        b'data', data_size
+    )
+
+
+def _get_sample_type(sample_width):
+    try:
+        return np.dtype(SAMPLE_TYPES[sample_width])
+    except KeyError:
+        raise ValueError('sample_width must be one of {}.'.format(sorted(SAMPLE_TYPES)))
+
+
+def _to_pcm(samples, out, scratch):
+    """
+    Convert float samples between -1 and 1 into out, using scratch as float buffer of the same size
+    """
+    np.clip(samples, -1, 1, out=scratch)
+    np.multiply(scratch, np.iinfo(out.dtype).max, out=scratch)
+    np.rint(scratch, out=scratch)
+    out[:] = scratch
+
+
+class WavWriter(object):
+    """
+    Streaming PCM WAV writer.
+    Float samples are converted through fixed buffers and written as they come,
+    sizes in the header are written on close
+    """
+
+    def __init__(self, path, sample_rate=44100, channels=1, sample_width=2, buffer_size=4096):
+        """
+        :param path: path of the file
+        :param sample_rate: number of frames per second
+        :param channels: number of channels
+        :param sample_width: size in bytes of a sample, 2 or 4
+        :param buffer_size: number of samples converted at a time
+        """
+        self.path = path
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_width = sample_width
+        self.frames = 0
+
+        self._buffer = np.zeros(buffer_size, dtype=_get_sample_type(sample_width))
+        self._scratch = np.zeros(buffer_size)
+        self._file = open(path, 'wb')
+        self._file.write(get_header(0, sample_rate, channels, sample_width))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def write(self, samples):
+        """
+        :param samples: float samples between -1 and 1, shape (frames,) or (frames, channels)
+        :return: None
+        """
+        samples = np.asarray(samples).reshape(-1)
+        if len(samples) % self.channels != 0:
+            raise ValueError('Number of samples must be a multiple of channels.')
+
+        size = len(self._buffer)
+        for start in range(0, len(samples), size):
+            chunk = samples[start:start + size]
+            count = len(chunk)
+            _to_pcm(chunk, self._buffer[:count], self._scratch[:count])
+            self._file.write(memoryview(self._buffer[:count]).cast('B'))
+
+        self.frames += len(samples) // self.channels
+
+    def write_blocks(self, blocks):
+        """
+        :param blocks: iterable of float samples blocks (e.g Renderer.stream)
+        :return: None
+        """
+        for block in blocks:
+            self.write(block)
+
+    def close(self):
+        """
+        Write sizes in header and close the file
+        :return: None
+        """
+        if self._file.closed:
+            return
+
+        self._file.seek(0)
+        self._file.write(get_header(self.frames * self.channels * self.sample_width, self.sample_rate, self.channels, self.sample_width))
+        self._file.close()
+
+
+class WavReader(object):
+    """
+    Streaming PCM WAV reader, integer samples are converted to float samples between -1 and 1 block by block
+    """
+
+    def __init__(self, path):
+        """
+        :param path: path of the file
+        """
+        self.path = path
+        self._file = wave.open(path, 'rb')
+
+        try:
+            self.sample_rate = self._file.getframerate()
+            self.channels = self._file.getnchannels()
+            self.sample_width = self._file.getsampwidth()
+            self.frames = self._file.getnframes()
+            self._sample_type = _get_sample_type(self.sample_width)
+        except ValueError:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def read(self, frames):
+        """
+        :param frames: max number of frames
+        :return: float samples of shape (frames, channels), empty at end of file
+        """
+        data = np.frombuffer(self._file.readframes(frames), dtype=self._sample_type)
+
+        return (data / np.iinfo(self._sample_type).max).reshape(-1, self.channels)
+
+    def blocks(self, block_size=4096, mono=True):
+        """
+        :param block_size: number of frames of every block, the last one could be shorter
+        :param mono: mix channels down to shape (frames,)
+        :return: generator of float samples blocks
+        """
+        while True:
+            block = self.read(block_size)
+            if len(block) == 0:
+                return
+
+            yield block.mean(axis=1) if mono else block
+
+    def close(self):
+        """
+        :return: None
+        """
+        self._file.close()
+
+
+def write_memmap(path, blocks, frames, sample_rate=44100, channels=1, sample_width=2):
+    """
+    Write a WAV file of known length by filling a memory-mapped file block by block
+    :param path: path of the file
+    :param blocks: iterable of float samples blocks, shape (n,) or (n, channels)
+    :param frames: total number of frames
+    :param sample_rate: number of frames per second
+    :param channels: number of channels
+    :param sample_width: size in bytes of a sample, 2 or 4
+    :return: None
+    """
+    sample_type = _get_sample_type(sample_width)
+    data_size = frames * channels * sample_width
+
+    with open(path, 'wb') as f:
+        f.write(get_header(data_size, sample_rate, channels, sample_width))
+        f.truncate(HEADER_SIZE + data_size)
+
+    if data_size == 0:
+        return
+
+    data = np.memmap(path, dtype=sample_type, mode='r+', offset=HEADER_SIZE, shape=(frames * channels,))
+    scratch = None
+    position = 0
+
+    for block in blocks:
+        block = np.asarray(block).reshape(-1)
+        count = min(len(block), len(data) - position)
+        if scratch is None or len(scratch) < count:
+            scratch = np.zeros(count)
+
+        _to_pcm(block[:count], data[position:position + count], scratch[:count])
+        position += count
+
+    data.flush()
+    del data
+
+
+def write(path, samples, sample_rate=44100, sample_width=2):
+    """
+    :param path: path of the file
+    :param samples: float samples between -1 and 1, shape (frames,) or (frames, channels)
+    :param sample_rate: number of frames per second
+    :param sample_width: size in bytes of a sample, 2 or 4
+    :return: None
+    """
+    samples = np.asarray(samples)
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+
+    with WavWriter(path, sample_rate=sample_rate, channels=channels, sample_width=sample_width) as w:
+        w.write(samples)
+
+
+def read(path, mono=False):
+    """
+    :param path: path of the file
+    :param mono: mix channels down to shape (frames,)
+    :return: tuple (samples, sample_rate), float samples of shape (frames, channels)
+    """
+    with WavReader(path) as r:
+        samples = r.read(r.frames)
+
+    return (samples.mean(axis=1) if mono else samples), r.sample_rate
+
+
+def write_events(path, events, renderer=None, sample_width=2, block_size=4096, memmap=False):
+    """
+    Render events and write them block by block, the whole signal is never kept in memory
+    :param path: path of the file
+    :param events: Note, Rest, NoteList or iterable of them
+    :param renderer: Renderer, default Renderer()
+    :param sample_width: size in bytes of a sample, 2 or 4
+    :param block_size: number of samples rendered at a time
+    :param memmap: write into a memory-mapped file instead of a stream
+    :return: path
+    """
+    if renderer is None:
+        renderer = Renderer()
+
+    if memmap:
+        events = list(renderer.flatten(events))
+        write_memmap(
+            path, renderer.stream(events, block_size=block_size), renderer.get_length(events),
+            sample_rate=renderer.sample_rate, sample_width=sample_width
+        )
+    else:
+        with WavWriter(path, sample_rate=renderer.sample_rate, sample_width=sample_width, buffer_size=block_size) as w:
+            w.write_blocks(renderer.stream(events, block_size=block_size))
+
+    return path
+
+
+_renderer = None
+
+
+def _init_worker(renderer):
+    global _renderer
+
+    _renderer = renderer
+
+
+def _write_job(args):
+    path, events, sample_width, block_size, memmap = args
+
+    return write_events(path, events, renderer=_renderer, sample_width=sample_width, block_size=block_size, memmap=memmap)
+
+
+def export_many(jobs, renderer=None, sample_width=2, block_size=4096, memmap=False, processes=None):
+    """
+    Render and write many files in parallel
+    :param jobs: iterable of (path, events)
+    :param renderer: Renderer used by every process, default Renderer(). It is sent once to every process, without its cache
+    :param sample_width: size in bytes of a sample, 2 or 4
+    :param block_size: number of samples rendered at a time
+    :param memmap: write into memory-mapped files instead of streams
+    :param processes: number of processes, default number of CPUs. 1 writes in the current process
+    :return: list of written paths
+    """
+    if renderer is None:
+        renderer = Renderer()
+
+    _get_sample_type(sample_width)
+
+    if processes == 1:
+        return [write_events(path, events, renderer, sample_width, block_size, memmap) for path, events in jobs]
+
+    args = [(path, events, sample_width, block_size, memmap) for path, events in jobs]
+    pool = Pool(processes, initializer=_init_worker, initargs=(renderer,))
+    try:
+        return pool.map(_write_job, args)
+    finally:
+        pool.close()
+        pool.join()
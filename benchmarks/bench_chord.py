@@ -0,0 +1,40 @@
+from babs import Note, Chord
+from babs.cache import NoteListCache
+
+from benchmarks.runner import benchmark
+
+
+ROOTS = [Note(name=names[0]) for names in Note.NOTE_NAMES]
+
+
+@benchmark(params=[Chord.OCTAVE_TYPE_ROOT, Chord.OCTAVE_TYPE_FROM_ROOT])
+def create_from_root_all_types(octave):
+    types = list(Chord.get_types().values())
+
+    return lambda: [
+        Chord.create_from_root(root=root, chord_type=chord_type, octave=octave) for root in ROOTS for chord_type in types
+    ]
+
+
+@benchmark()
+def create_from_root_all_types_memo():
+    types = list(Chord.get_types().values())
+    memo = NoteListCache(maxsize=len(ROOTS) * len(types))
+
+    return lambda: [
+        Chord.create_from_root(root=root, chord_type=chord_type, memo=memo, shared=True) for root in ROOTS for chord_type in types
+    ]
+
+
+@benchmark(params=[3, 4, 8])
+def create(size):
+    notes = [Note.from_pitch(60 + i * 4) for i in range(size)]
+
+    return lambda: Chord(*notes)
+
+
+@benchmark()
+def identify_all_types():
+    chords = [Chord.create_from_root(root=root, chord_type=t) for root in ROOTS for t in Chord.get_types().values()]
+
+    return lambda: [c.identify() for c in chords]
@@ -0,0 +1,60 @@
+from babs import Note
+
+from benchmarks.runner import benchmark
+
+
+SIZES = [12, 120, 1200]
+
+
+def get_names(size):
+    return [Note.NOTE_NAMES[i % len(Note.NOTE_NAMES)][0] for i in range(size)]
+
+
+@benchmark(params=SIZES)
+def create_by_name(size):
+    names = get_names(size)
+
+    return lambda: [Note(name=name, octave=4) for name in names]
+
+
+@benchmark(params=SIZES)
+def create_by_freq(size):
+    freqs = [Note.get_pitch_table().get_freq(48 + i % 36) for i in range(size)]
+
+    return lambda: [Note(freq=freq) for freq in freqs]
+
+
+@benchmark(params=SIZES)
+def create_by_freq_off_table(size):
+    freqs = [200 + i * 0.37 for i in range(size)]
+
+    return lambda: [Note(freq=freq) for freq in freqs]
+
+
+@benchmark(params=[1, 7, 12, 24])
+def pitch_shift(value):
+    note = Note(name='C')
+
+    def shift():
+        note.pitch_shift(value, half_step=True)
+        note.pitch_shift(-value, half_step=True)
+
+    return shift
+
+
+@benchmark()
+def pitch_shift_octave():
+    note = Note(name='C')
+
+    def shift():
+        note.pitch_shift(1, octave=True)
+        note.pitch_shift(-1, octave=True)
+
+    return shift
+
+
+@benchmark(params=SIZES)
+def get_note_index(size):
+    notes = [Note(name=name) for name in get_names(size)]
+
+    return lambda: [n.get_note_index() for n in notes]
@@ -0,0 +1,40 @@
+from babs import Note, NoteList
+
+from benchmarks.runner import benchmark
+
+
+SIZES = [100, 1000, 10000]
+
+
+def get_notes(size):
+    return [Note(freq=100 + i * 0.25) for i in range(size)]
+
+
+@benchmark(params=SIZES)
+def remove_note(size):
+    """
+    Remove a note from the middle of the list by note and add it back, so every call works on the same list
+    """
+    notes = get_notes(size)
+    note_list = NoteList(*notes)
+    note = notes[size // 2]
+
+    def remove():
+        note_list.remove_note(note=note)
+        note_list.add_note(note)
+
+    return remove
+
+
+@benchmark(params=SIZES)
+def create(size):
+    notes = get_notes(size)
+
+    return lambda: NoteList(*notes)
+
+
+@benchmark(params=SIZES)
+def is_valid(size):
+    notes = get_notes(size)
+
+    return lambda: NoteList(*notes, strict=False).is_valid()
@@ -0,0 +1,33 @@
+from babs import Note, Scale
+
+from benchmarks.runner import benchmark
+
+
+ROOTS = [Note(name=names[0]) for names in Note.NOTE_NAMES]
+
+
+@benchmark(params=[Scale.OCTAVE_TYPE_ROOT, Scale.OCTAVE_TYPE_FROM_ROOT])
+def create_from_root_all_types(octave):
+    types = list(Scale.get_types().values())
+
+    return lambda: [
+        Scale.create_from_root(root=root, scale_type=scale_type, octave=octave) for root in ROOTS for scale_type in types
+    ]
+
+
+@benchmark(params=[1, 10, 100])
+def create_with_duplicates(copies):
+    """
+    Scale removes duplicated notes on creation
+    """
+    notes = [Note(name=names[0]) for names in Note.NOTE_NAMES] * copies
+
+    return lambda: Scale(*notes)
+
+
+@benchmark(params=[12, 120])
+def add_note_duplicate(size):
+    scale = Scale(*[Note.from_pitch(24 + i) for i in range(size)])
+    note = Note.from_pitch(24 + size // 2)
+
+    return lambda: scale.add_note(note, strict=False)
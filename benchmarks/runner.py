@@ -0,0 +1,194 @@
+from __future__ import division
+
+import argparse
+import fnmatch
+import importlib
+import json
+import os
+import platform
+import sys
+import timeit
+from collections import namedtuple
+
+
+Benchmark = namedtuple('Benchmark', ['name', 'setup', 'params'])
+Result = namedtuple('Result', ['name', 'best', 'median', 'number'])
+Change = namedtuple('Change', ['name', 'baseline', 'current', 'ratio'])
+
+MODULES = ['bench_note', 'bench_note_list', 'bench_chord', 'bench_scale']
+
+BENCHMARKS = []
+
+
+def benchmark(params=None):
+    """
+    Register a benchmark. The decorated function receives a param and returns the callable that is timed,
+    so setup is not measured
+    :param params: list of params (e.g sizes), the benchmark runs once for every param. None for no param
+    :return: decorator
+    """
+    def decorator(setup):
+        name = '{}.{}'.format(setup.__module__.rsplit('.', 1)[-1].replace('bench_', '', 1), setup.__name__)
+        BENCHMARKS.append(Benchmark(name, setup, params))
+
+        return setup
+
+    return decorator
+
+
+def load(modules=None):
+    """
+    Import benchmark modules, registering their benchmarks
+    :param modules: names of modules in this package, default MODULES
+    :return: list of registered Benchmark
+    """
+    for module in MODULES if modules is None else modules:
+        importlib.import_module('{}.{}'.format(__package__, module))
+
+    return BENCHMARKS
+
+
+def get_cases(benchmarks, pattern=None):
+    """
+    :param benchmarks: list of Benchmark
+    :param pattern: shell-style pattern of case names (e.g 'note.*'), None for all cases
+    :return: list of (case name, setup, param)
+    """
+    cases = []
+    for b in benchmarks:
+        for param in [None] if b.params is None else b.params:
+            name = b.name if b.params is None else '{}[{}]'.format(b.name, param)
+            if pattern is None or fnmatch.fnmatch(name, pattern):
+                cases.append((name, b.setup, param))
+
+    return cases
+
+
+def measure(function, repeat=5, min_time=0.2):
+    """
+    :param function: callable without arguments
+    :param repeat: number of timings
+    :param min_time: min duration in seconds of a timing, the number of calls is chosen to reach it
+    :return: tuple (best, median, number), best and median are seconds per call
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+
+    timings = sorted(t / number for t in timer.repeat(repeat, number))
+
+    return timings[0], timings[len(timings) // 2], number
+
+
+def run(cases, repeat=5, min_time=0.2, output=None):
+    """
+    :param cases: list of (case name, setup, param)
+    :param repeat: number of timings of every case
+    :param min_time: min duration in seconds of a timing
+    :param output: file where a line is written after every case, None for no output
+    :return: list of Result
+    """
+    results = []
+    for name, setup, param in cases:
+        function = setup() if param is None else setup(param)
+        result = Result(name, *measure(function, repeat=repeat, min_time=min_time))
+        results.append(result)
+
+        if output is not None:
+            output.write('{:<50} {:>12.3f} us {:>12.3f} us {:>10}\n'.format(name, result.best * 1e6, result.median * 1e6, result.number))
+            output.flush()
+
+    return results
+
+
+def save(path, results):
+    """
+    Write results and environment into a JSON baseline
+    :param path: path of the file
+    :param results: list of Result
+    :return: None
+    """
+    data = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {r.name: {'best': r.best, 'median': r.median, 'number': r.number} for r in results}
+    }
+
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_baseline(path):
+    """
+    :param path: path of a JSON baseline
+    :return: dict case name => best seconds per call
+    """
+    with open(path) as f:
+        data = json.load(f)
+
+    return {name: values['best'] for name, values in data['results'].items()}
+
+
+def compare(results, baseline, tolerance=0.2):
+    """
+    :param results: list of Result
+    :param baseline: dict case name => best seconds per call
+    :param tolerance: max relative slowdown that is not a regression
+    :return: tuple (regressions, improvements), lists of Change of cases in both results and baseline
+    """
+    regressions, improvements = [], []
+    for r in results:
+        if r.name not in baseline or baseline[r.name] <= 0:
+            continue
+
+        change = Change(r.name, baseline[r.name], r.best, r.best / baseline[r.name])
+        if change.ratio > 1 + tolerance:
+            regressions.append(change)
+        elif change.ratio < 1 / (1 + tolerance):
+            improvements.append(change)
+
+    return regressions, improvements
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run babs benchmarks.')
+    parser.add_argument('-k', dest='pattern', help="shell-style pattern of case names, e.g. 'chord.*'")
+    parser.add_argument('--repeat', type=int, default=5, help='number of timings of every case')
+    parser.add_argument('--min-time', type=float, default=0.2, help='min duration in seconds of a timing')
+    parser.add_argument('--save', help='write results into a JSON baseline')
+    parser.add_argument('--compare', help='compare results with a JSON baseline, exit with 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='max relative slowdown that is not a regression')
+    parser.add_argument('--list', action='store_true', help='list cases without running them')
+    args = parser.parse_args(argv)
+
+    cases = get_cases(load(), pattern=args.pattern)
+
+    if args.list:
+        for name, setup, param in cases:
+            print(name)
+        return 0
+
+    print('{:<50} {:>15} {:>15} {:>10}'.format('case', 'best', 'median', 'calls'))
+    results = run(cases, repeat=args.repeat, min_time=args.min_time, output=sys.stdout)
+
+    if args.save:
+        directory = os.path.dirname(args.save)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        save(args.save, results)
+
+    if args.compare:
+        regressions, improvements = compare(results, load_baseline(args.compare), tolerance=args.tolerance)
+        for title, changes in [('Improvements', improvements), ('Regressions', regressions)]:
+            if len(changes) > 0:
+                print('\n{}:'.format(title))
+            for c in changes:
+                print('{:<50} {:>12.3f} us -> {:>12.3f} us ({:.2f}x)'.format(c.name, c.baseline * 1e6, c.current * 1e6, c.ratio))
+
+        if len(regressions) > 0:
+            return 1
+
+    return 0
@@ -3,7 +3,10 @@ from setuptools import find_packages, setup
 setup(
     name='babs',
     version='1.0.0',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     include_package_data=True,
-    zip_safe=False
+    zip_safe=False,
+    extras_require={
+        'numpy': ['numpy']
+    }
 )
@@ -0,0 +1,218 @@
+from __future__ import division
+
+import copy
+
+import pytest
+
+from babs import Note, Chord, Scale
+from babs.cache import LRUCache, NoteCache, NoteListCache, SharedNote
+from babs.exceptions import NoteException, ChordException
+
+
+def test_lru_cache():
+    c = LRUCache(maxsize=2)
+    assert c.get('a') is None
+    assert c.get('a', 1) == 1
+
+    c.put('a', 1)
+    c.put('b', 2)
+    assert c.get('a') == 1
+    c.put('c', 3)
+
+    assert len(c) == 2
+    assert 'a' in c
+    assert 'b' not in c
+    assert 'c' in c
+    assert c.info() == {'hits': 1, 'misses': 2, 'size': 2, 'maxsize': 2}
+
+    c.clear()
+    assert len(c) == 0
+    assert c.info() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2}
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_lru_cache_unbounded():
+    c = LRUCache(maxsize=None)
+    for i in range(5000):
+        c.put(i, i)
+
+    assert len(c) == 5000
+
+
+def test_get_or_create():
+    c = LRUCache(maxsize=2)
+    assert c.get_or_create('a', lambda: 1) == 1
+    assert c.get_or_create('a', lambda: 2) == 1
+    assert c.hits == 1
+    assert c.misses == 1
+
+
+def test_note_cache():
+    c = NoteCache(maxsize=2)
+    n = c.get_note(name='A')
+    assert n == Note(name='A')
+    assert c.get_note(name='A') is n
+    assert c.get_note(name='A', duration=1/8) is not n
+    assert c.get_note(name='A', duration=1/8).duration == 1/8
+    assert c.info() == {'hits': 2, 'misses': 2, 'size': 2, 'maxsize': 2}
+
+    c.get_note(freq=440)
+    assert c.get_note(name='A') is not n
+
+    with pytest.raises(NoteException):
+        c.get_note(name='S')
+
+
+def test_interned():
+    n = Note.interned(name='C', octave=5)
+    assert n == Note(name='C', octave=5)
+    assert Note.interned(name='C', octave=5) is n
+    assert Note.get_cache().hits >= 1
+
+
+def test_interned_is_immutable():
+    n = Note.interned(name='C')
+    assert isinstance(n, SharedNote)
+
+    with pytest.raises(AttributeError):
+        n.pitch_shift(1, half_step=True)
+
+    with pytest.raises(AttributeError):
+        n.duration = 1/2
+
+    with pytest.raises(AttributeError):
+        n.freq = 300
+
+    assert str(Note.interned(name='C')) == 'C4'
+    assert Note.interned(name='C').freq == 261.63
+
+    m = n.transposed(1)
+    assert str(m) == 'C#4'
+    assert type(m) is Note
+    assert type(copy.copy(n)) is Note
+    m.pitch_shift(1, half_step=True)
+    assert str(n) == 'C4'
+
+
+def test_interned_tuning():
+    n = Note.interned(name='A')
+    try:
+        Note.A_FREQUENCY = 432
+        assert Note.interned(name='A').freq == 432
+        assert Note.interned(name='A').freq == Note(name='A').freq
+    finally:
+        Note.A_FREQUENCY = 440
+
+    assert Note.interned(name='A') is n
+
+
+def test_get_notes_from_root_with_cache():
+    c = NoteCache()
+    c1 = Chord.create_from_root(root=Note(name='C'), cache=c)
+    c2 = Chord.create_from_root(root=Note(name='C'), cache=c)
+    assert c1 == c2
+    assert c1.notes[1] is c2.notes[1]
+    assert c1.notes[2] is c2.notes[2]
+    assert c.hits == 2
+    assert c.misses == 2
+
+    s = Scale.create_from_root(root=Note(name='C'), cache=c)
+    assert s == Scale.create_from_root(root=Note(name='C'))
+    assert c.hits == 4
+
+
+def test_create_chord_from_root_with_memo():
+    memo = NoteListCache(maxsize=8)
+    c1 = Chord.create_from_root(root=Note(name='C'), memo=memo)
+    c2 = Chord.create_from_root(root=Note(name='C'), memo=memo)
+
+    assert memo.info()['misses'] == 1
+    assert memo.info()['hits'] == 1
+    assert c1 == c2 == Chord.create_from_root(root=Note(name='C'))
+    assert c1 is not c2
+    assert all(n1 is not n2 for n1, n2 in zip(c1.notes, c2.notes))
+
+    c1.add_note(Note(name='B'))
+    c1.notes[0].freq = 100
+    assert Chord.create_from_root(root=Note(name='C'), memo=memo) == c2
+    assert len(c2.notes) == 3
+    assert Note(name='B') not in c2
+
+    Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MINOR_TYPE, memo=memo)
+    Chord.create_from_root(root=Note(name='C', duration=1/2), memo=memo)
+    Chord.create_from_root(root=Note(name='C'), octave=Chord.OCTAVE_TYPE_FROM_ROOT, memo=memo)
+    Chord.create_from_root(root=Note(name='C'), alt=Note.FLAT, memo=memo)
+    assert memo.info()['misses'] == 5
+
+
+def test_create_from_root_with_memo_shared():
+    memo = NoteListCache()
+    c1 = Chord.create_from_root(root=Note(name='D'), memo=memo, shared=True)
+    c2 = Chord.create_from_root(root=Note(name='D'), memo=memo, shared=True)
+    assert c1 is c2
+
+    root = Note(name='D')
+    s1 = Scale.create_from_root(root=root, memo=memo, shared=True)
+    root.freq = 100
+    assert 100 not in [n.freq for n in s1.notes]
+    assert s1 == Scale.create_from_root(root=Note(name='D'))
+    assert Scale.create_from_root(root=Note(name='D'), order=Scale.DESCENDING_SCALE_TYPE, memo=memo) != s1
+
+
+def test_create_from_root_with_memo_bypass():
+    memo = NoteListCache()
+    Chord.create_from_root(root=Note(name='C'), octave=lambda root_octave, i, distance: root_octave + 1, memo=memo)
+    Chord.create_from_root(root=Note(name='C'), cache=NoteCache(), memo=memo)
+    assert len(memo) == 0
+
+    with pytest.raises(ChordException):
+        Chord.create_from_root(root=Note(name='C'), chord_type=[], memo=memo)
+
+    assert len(memo) == 0
+
+
+def test_memo_tuning():
+    memo = NoteListCache()
+    root = Note(freq=440)
+    c = Chord.create_from_root(root=root, memo=memo)
+
+    try:
+        Note.A_FREQUENCY = 432
+        cached = Chord.create_from_root(root=root, memo=memo)
+        assert [n.freq for n in cached.notes] == [n.freq for n in Chord.create_from_root(root=root).notes]
+        assert cached != c
+    finally:
+        Note.A_FREQUENCY = 440
+
+    assert Chord.create_from_root(root=root, memo=memo) == c
+
+
+def test_memo_copy_keeps_indexes():
+    memo = NoteListCache()
+    s = Scale.create_from_root(root=Note(name='C'), memo=memo)
+    s = Scale.create_from_root(root=Note(name='C'), memo=memo)
+
+    assert Note(name='E') in s
+    s.add_note(Note(name='C#'))
+    assert [n.name for n in s.notes][:3] == ['C', 'C#', 'D']
+    s.remove_note(note=Note(name='E'))
+    assert Note(name='E') not in s
+    assert s.select(name='F')[0] == Note(name='F')
+
+
+def test_memo_warm():
+    memo = NoteListCache(maxsize=None)
+    memo.warm(Chord)
+    chord_types = set(tuple(t) for t in Chord.get_types().values())
+    assert len(memo) == 12 * len(chord_types)
+
+    memo.warm(Scale, alt=Note.FLAT)
+    scale_types = set(tuple(t) for t in Scale.get_types().values())
+    assert len(memo) == 12 * (len(chord_types) + len(scale_types))
+
+    misses = memo.info()['misses']
+    Chord.create_from_root(root=Note(name='A'), chord_type=Chord.MINOR_SEVEN_TYPE, memo=memo)
+    Scale.create_from_root(root=Note(name='G#'), scale_type=Scale.DORIAN_TYPE, alt=Note.FLAT, memo=memo)
+    assert memo.info()['misses'] == misses
@@ -1,3 +1,5 @@
+import itertools
+
 import pytest
 
 from babs import Note, Chord
@@ -390,4 +392,133 @@ def test_repr():
     assert c.strict is True
 
     c = eval(repr(Chord(Note(name='C'), Note(name='E'), strict=False)))
-    assert c.strict is False
\ No newline at end of file
+    assert c.strict is False
+
+
+def test_add_note_after_note_changed_in_place():
+    c = Chord(Note(name='C'), Note(name='E'), Note(name='G'))
+    c.notes[0].pitch_shift(12, half_step=True)
+
+    c.add_note(Note(name='D'))
+    assert [str(n) for n in c.notes] == ['D4', 'E4', 'G4', 'C5']
+    assert Note(name='C', octave=5) in c
+
+    c.notes[0].pitch_shift(-2, half_step=True)
+    c.remove_note(note=Note(name='E'))
+    assert [str(n) for n in c.notes] == ['C4', 'G4', 'C5']
+
+
+def test_identify():
+    assert Chord.create_from_root(root=Note(name='C')).identify() == [('C', 'MAJOR_TYPE', 0)]
+    assert Chord.create_from_root(root=Note(name='D'), chord_type=Chord.MINOR_SEVEN_TYPE).identify() == \
+        [('F', 'MAJOR_SIXTH_TYPE', 2), ('D', 'MINOR_SEVEN_TYPE', 3)]
+    assert Chord.create_from_root(root=Note(name='D'), chord_type=Chord.MINOR_SEVEN_TYPE, octave=Chord.OCTAVE_TYPE_FROM_ROOT).identify() == \
+        [('D', 'MINOR_SEVEN_TYPE', 0), ('F', 'MAJOR_SIXTH_TYPE', 3)]
+
+    c = Chord(Note(name='E', octave=3), Note(name='G'), Note(name='C'))
+    assert c.identify() == [('C', 'MAJOR_TYPE', 1)]
+
+    c = Chord(Note(name='G', octave=3), Note(name='C'), Note(name='E'), Note(name='C', octave=5))
+    assert c.identify() == [('C', 'MAJOR_TYPE', 2)]
+
+    c = Chord(Note(name='A', octave=3), Note(name='C'), Note(name='E'), Note(name='G'))
+    assert c.identify() == [('A', 'MINOR_SEVEN_TYPE', 0), ('C', 'MAJOR_SIXTH_TYPE', 3)]
+
+    c = Chord.create_from_root(root=Note(name='C'), chord_type=Chord.AUGMENTED_TYPE)
+    assert c.identify(alt=Note.FLAT) == [('C', 'AUGMENTED_TYPE', 0), ('Ab', 'AUGMENTED_TYPE', 1), ('E', 'AUGMENTED_TYPE', 2)]
+
+    assert Chord(Note(name='C'), Note(name='C#'), Note(name='D')).identify() == []
+
+
+def test_identify_all_types():
+    for chord_type, distances in Chord.get_types().items():
+        for root in Note.NOTES:
+            root = root.split('/')[0]
+            identities = Chord.create_from_root(root=Note(name=root), chord_type=distances, octave=Chord.OCTAVE_TYPE_FROM_ROOT).identify()
+            assert (root, chord_type, 0) in identities
+            assert identities[0].inversion == 0
+
+
+def test_identify_many():
+    chords = [
+        Chord.create_from_root(root=Note(name='C')),
+        [Note(name='D'), Note(name='F'), Note(name='A')],
+        Chord(Note(name='C'), Note(name='C#'))
+    ]
+
+    assert Chord.identify_many(chords) == [
+        [('C', 'MAJOR_TYPE', 0)],
+        [('D', 'MINOR_TYPE', 0)],
+        []
+    ]
+    assert Chord.identify_many([]) == []
+    assert Chord.identify_notes([]) == []
+
+
+def test_get_root_index():
+    c = Chord.create_from_root(root=Note(name='A'), chord_type=Chord.MINOR_TYPE)
+    assert c.get_root_index() == 9
+
+    c = Chord(Note(name='C'), Note(name='D'), Note(name='F#'))
+
+
+def test_voicings():
+    c = Chord.create_from_root(root=Note(name='C'), octave=Chord.OCTAVE_TYPE_FROM_ROOT)
+    voicings = list(c.voicings(low=60, high=76, as_pitches=True))
+
+    assert voicings == [(60, 64, 67), (60, 67, 76), (64, 67, 72), (67, 72, 76)]
+
+    chords = list(c.voicings(low=60, high=72, alt=Note.FLAT))
+    assert all(isinstance(v, Chord) for v in chords)
+    assert [n.pitch for n in chords[1].notes] == [64, 67, 72]
+    assert chords[0].notes[0].duration == 1
+
+
+def test_voicings_constraints():
+    c = Chord.create_from_root(root=Note(name='G'), chord_type=Chord.DOMINANT_TYPE, octave=Chord.OCTAVE_TYPE_FROM_ROOT)
+    pitch_classes = {7, 11, 2, 5}
+
+    voicings = list(c.voicings(low=43, high=84, max_span=19, min_spacing=3, as_pitches=True))
+    assert len(voicings) > 0
+    for v in voicings:
+        assert set(p % 12 for p in v) == pitch_classes
+        assert v[-1] - v[0] <= 19
+        assert all(b - a >= 3 for a, b in zip(v, v[1:]))
+
+    # drop 2 voicing of G7 (D F G B -> F D G B) is generated
+    assert (53, 62, 67, 71) in voicings
+
+    voicings = list(c.voicings(low=43, high=72, root_position=True, as_pitches=True))
+    assert all(v[0] % 12 == 7 for v in voicings)
+
+    voicings = list(c.voicings(low=43, high=72, voices=5, doubling='root', as_pitches=True))
+    assert len(voicings) > 0
+    assert all(sorted(p % 12 for p in v).count(7) == 2 for v in voicings)
+
+    voicings = list(c.voicings(low=43, high=72, voices=5, doubling=[2], as_pitches=True))
+    assert all(sorted(p % 12 for p in v).count(2) == 2 for v in voicings)
+
+    assert list(c.voicings(low=60, high=64)) == []
+
+
+def test_voicings_lazy():
+    c = Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MAJOR_SEVEN_TYPE)
+    generator = c.voicings(low=0, high=127, voices=6)
+
+    first = list(itertools.islice(generator, 3))
+    assert len(first) == 3
+    assert all(len(v.notes) == 6 for v in first)
+
+
+def test_transpose():
+    c = Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MAJOR_SEVEN_TYPE)
+    t = c.transposed(-3, alt=Note.FLAT)
+
+    assert [n.name for n in t.notes] == ['A', 'Db', 'E', 'Ab']
+    assert t.identify()[0].root == 'A'
+    assert t.identify()[0].chord_type == 'MAJOR_SEVEN_TYPE'
+    assert [n.name for n in c.notes] == ['C', 'E', 'G', 'B']
+
+    c.transpose(12)
+    assert [n.octave for n in c.notes] == [5, 5, 5, 5]
+    assert Note(name='E', octave=5) in c
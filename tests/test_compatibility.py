@@ -0,0 +1,61 @@
+from babs import Note, Chord, Scale
+from babs.compatibility import CompatibilityMatrix, ChordMatch, ScaleMatch
+from babs.pitch_class_set import PitchClassSet
+
+
+def test_compatible_chords():
+    s = Scale.create_from_root(root=Note(name='C'))
+    chords = s.compatible_chords()
+
+    assert ('C', 'MAJOR_TYPE') in chords
+    assert ('D', 'MINOR_SEVEN_TYPE') in chords
+    assert ('G', 'DOMINANT_TYPE') in chords
+    assert ('B', 'HALF_DIMINISHED_SEVEN_TYPE') in chords
+    assert ('D', 'MAJOR_TYPE') not in chords
+    assert isinstance(chords[0], ChordMatch)
+
+    assert ('Bb', 'MAJOR_TYPE') in Scale.create_from_root(root=Note(name='F')).compatible_chords(alt=Note.FLAT)
+
+
+def test_compatible_scales():
+    c = Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MAJOR_SEVEN_TYPE)
+    scales = c.compatible_scales()
+
+    assert ('C', 'MAJOR_TYPE') in scales
+    assert ('G', 'MAJOR_TYPE') in scales
+    assert ('A', 'MINOR_TYPE') in scales
+    assert ('F', 'MAJOR_TYPE') not in scales
+    assert isinstance(scales[0], ScaleMatch)
+
+
+def test_matrix_is_consistent_with_notes():
+    matrix = CompatibilityMatrix()
+
+    for scale_root in ['C', 'F#', 'A#']:
+        for scale_type, scale_distances in Scale.get_types().items():
+            s = Scale.create_from_root(root=Note(name=scale_root), scale_type=scale_distances)
+            chords = set(matrix.compatible_chords(s.pitch_class_set))
+
+            for chord_root in ['C', 'D', 'D#', 'F#', 'A']:
+                for chord_type, chord_distances in Chord.get_types().items():
+                    c = Chord.create_from_root(root=Note(name=chord_root), chord_type=chord_distances)
+                    expected = all(n.get_note_index() in [sn.get_note_index() for sn in s.notes] for n in c.notes)
+                    assert ((chord_root, chord_type) in chords) == expected
+                    assert ((scale_root, scale_type) in matrix.compatible_scales(c.pitch_class_set)) == expected
+
+
+def test_custom_types_and_masks():
+    matrix = CompatibilityMatrix(scale_types={'TRITONE_TYPE': [6]}, chord_types={'FIFTH_TYPE': [7], 'TRITONE_TYPE': [6]})
+
+    assert matrix.compatible_chords(PitchClassSet(0, 6)) == (('C', 'TRITONE_TYPE'), ('F#', 'TRITONE_TYPE'))
+    assert matrix.compatible_chords(PitchClassSet(0, 7, 2)) == (('C', 'FIFTH_TYPE'), ('G', 'FIFTH_TYPE'))
+    assert matrix.compatible_scales(PitchClassSet(1, 7)) == (('C#', 'TRITONE_TYPE'), ('G', 'TRITONE_TYPE'))
+    assert matrix.compatible_scales(PitchClassSet(0, 7)) == ()
+
+
+def test_default_matrix():
+    assert CompatibilityMatrix.get_default() is CompatibilityMatrix.get_default()
+
+    c = Chord.create_from_root(root=Note(name='C'))
+    matrix = CompatibilityMatrix(scale_types={'MAJOR_TYPE': Scale.MAJOR_TYPE})
+    assert c.compatible_scales(matrix=matrix) == (('C', 'MAJOR_TYPE'), ('F', 'MAJOR_TYPE'), ('G', 'MAJOR_TYPE'))
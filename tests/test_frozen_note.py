@@ -0,0 +1,116 @@
+from __future__ import division
+
+import pickle
+
+import pytest
+
+from babs import Note, FrozenNote
+from babs.cache import NoteCache
+from babs.exceptions import NoteException
+
+
+def test_create():
+    n = FrozenNote(name='A')
+    assert n.name == 'A'
+    assert n.freq == 440
+    assert n.octave == 4
+    assert n.pitch == 69
+    assert n.duration == 4/4
+    assert n.alt is None
+
+    n = FrozenNote(freq=466.16, alt=Note.FLAT, duration=1/8)
+    assert n.name == 'Bb'
+    assert n.octave == 4
+    assert n.pitch == 70
+    assert n.duration == 1/8
+
+    with pytest.raises(NoteException):
+        FrozenNote()
+
+    with pytest.raises(NoteException):
+        FrozenNote(name='S')
+
+
+def test_immutable():
+    n = FrozenNote(name='A')
+
+    with pytest.raises(AttributeError):
+        n.freq = 880
+
+    with pytest.raises(AttributeError):
+        n.duration = 1/8
+
+    with pytest.raises(AttributeError):
+        n._freq = 880
+
+    with pytest.raises(AttributeError):
+        n.other = 1
+
+    with pytest.raises(AttributeError):
+        del n._freq
+
+    assert n.freq == 440
+    assert not hasattr(n, '__dict__')
+
+
+def test_eq_and_hash():
+    assert FrozenNote(name='A') == FrozenNote(freq=440)
+    assert FrozenNote(name='A') != FrozenNote(name='A', duration=1/8)
+    assert not FrozenNote(name='A') != FrozenNote(freq=440)
+    assert FrozenNote(name='A') == Note(name='A')
+    assert Note(name='A') == FrozenNote(name='A')
+
+    assert hash(FrozenNote(name='A')) == hash(FrozenNote(freq=440))
+    assert hash(FrozenNote(name='A')) == hash(Note(name='A'))
+    assert len({FrozenNote(name='A'), FrozenNote(freq=440), FrozenNote(name='A', duration=1/8)}) == 2
+
+    d = {FrozenNote(name='C#'): 'c#'}
+    assert d[FrozenNote(name='Db')] == 'c#'
+
+
+def test_str_and_repr():
+    assert str(FrozenNote(freq=932.32, alt=Note.FLAT)) == 'Bb5'
+
+    n = eval(repr(FrozenNote(freq=932.32, alt=Note.FLAT, duration=1/8)))
+    assert n.freq == 932.32
+    assert n.name == 'Bb'
+    assert n.duration == 1/8
+
+
+def test_pickle():
+    n = pickle.loads(pickle.dumps(FrozenNote(name='Db', octave=3, duration=1/4)))
+    assert n.name == 'Db'
+    assert n.octave == 3
+    assert n.duration == 1/4
+    assert n == FrozenNote(name='Db', octave=3, duration=1/4)
+
+
+def test_conversion():
+    note = Note(name='Db', octave=5, duration=1/4)
+
+    n = FrozenNote.from_note(note)
+    assert n.freq == note.freq
+    assert n.name == 'Db'
+    assert n.octave == 5
+    assert n.pitch == note.pitch
+    assert n.duration == 1/4
+    assert n.get_note_index() == 1
+
+    note = n.to_note()
+    assert isinstance(note, Note)
+    assert note.freq == n.freq
+    assert note.name == 'Db'
+    assert note.octave == 5
+    assert note.pitch == n.pitch
+    assert note.duration == 1/4
+
+    note.pitch_shift(value=1, half_step=True)
+    assert note.name == 'D'
+    assert n.name == 'Db'
+
+
+def test_note_cache():
+    c = NoteCache(note_class=FrozenNote)
+    n = c.get_note(name='A')
+    assert isinstance(n, FrozenNote)
+    assert c.get_note(name='A') is n
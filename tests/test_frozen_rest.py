@@ -0,0 +1,55 @@
+from __future__ import division
+
+import pickle
+
+import pytest
+
+from babs import Rest, FrozenRest
+
+
+def test_create():
+    assert FrozenRest().duration == 4/4
+    assert FrozenRest(duration=1/4).duration == 1/4
+
+
+def test_immutable():
+    r = FrozenRest()
+
+    with pytest.raises(AttributeError):
+        r.duration = 1/8
+
+    with pytest.raises(AttributeError):
+        r._duration = 1/8
+
+    assert r.duration == 4/4
+
+
+def test_repr():
+    assert eval(repr(FrozenRest(duration=3/4))).duration == 3/4
+
+
+def test_comparison():
+    assert FrozenRest() == FrozenRest()
+    assert FrozenRest() == Rest()
+    assert FrozenRest() != FrozenRest(duration=1/8)
+    assert FrozenRest(duration=1/8) < FrozenRest()
+    assert FrozenRest(duration=1/8) <= FrozenRest(duration=1/8)
+    assert FrozenRest() > FrozenRest(duration=1/8)
+    assert FrozenRest(duration=1/8) >= FrozenRest(duration=1/16)
+
+
+def test_hash():
+    assert len({FrozenRest(), FrozenRest(), FrozenRest(duration=1/8)}) == 2
+
+
+def test_pickle():
+    assert pickle.loads(pickle.dumps(FrozenRest(duration=1/8))) == FrozenRest(duration=1/8)
+
+
+def test_conversion():
+    r = FrozenRest.from_rest(Rest(duration=1/8))
+    assert r.duration == 1/8
+
+    rest = r.to_rest()
+    assert isinstance(rest, Rest)
+    assert rest.duration == 1/8
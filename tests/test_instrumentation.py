@@ -0,0 +1,184 @@
+import threading
+
+import pytest
+
+from babs import Note, Chord, Scale, instrumentation
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_by_default():
+    assert instrumentation.is_enabled() is False
+
+    Note(name='C')
+    instrumentation.increment('custom')
+    instrumentation.add_time('custom', 1)
+    with instrumentation.timer('block'):
+        pass
+
+    stats = instrumentation.get_stats()
+    assert stats.counters == {}
+    assert stats.timers == {}
+
+
+def test_enable():
+    instrumentation.enable()
+    assert instrumentation.is_enabled() is True
+
+    Note(name='C')
+    Note(freq=440)
+    Note.from_pitch(60)
+    instrumentation.increment('custom', 5)
+
+    instrumentation.disable()
+    Note(name='D')
+
+    stats = instrumentation.get_stats()
+    assert stats.counters['note.create'] == 3
+    assert stats.counters['custom'] == 5
+
+    instrumentation.reset()
+    assert instrumentation.get_stats().counters == {}
+
+
+def test_timers():
+    instrumentation.enable()
+
+    with instrumentation.timer('block'):
+        pass
+
+    with instrumentation.timer('block'):
+        pass
+
+    @instrumentation.timed('function')
+    def function(value):
+        return value * 2
+
+    assert function(2) == 4
+    assert function.__name__ == 'function'
+
+    timers = instrumentation.get_stats().as_dict()['timers']
+    assert timers['block']['calls'] == 2
+    assert timers['function']['calls'] == 1
+    assert timers['block']['total'] >= timers['block']['max'] >= 0
+
+
+def test_timed_records_exceptions():
+    instrumentation.enable()
+
+    @instrumentation.timed('failing')
+    def failing():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        failing()
+
+    assert instrumentation.get_stats().timers['failing'][0] == 1
+
+
+def test_capture():
+    with instrumentation.capture() as stats:
+        assert instrumentation.is_enabled() is True
+        Chord.create_from_root(root=Note(name='C'))
+
+        with instrumentation.capture() as inner:
+            Scale.create_from_root(root=Note(name='C'))
+
+    assert instrumentation.is_enabled() is False
+
+    assert stats.timers['chord.create_from_root'][0] == 1
+    assert stats.timers['scale.create_from_root'][0] == 1
+    assert stats.timers['note_list.get_notes_from_root'][0] == 2
+    assert stats.timers['ordered_note_list.order'][0] == 2
+    assert stats.timers['note_list.is_valid'][0] >= 2
+    assert stats.counters['note.create'] == 1 + 2 + 1 + 6
+
+    assert 'chord.create_from_root' not in inner.timers
+    assert inner.counters['note.create'] == 1 + 6
+    assert instrumentation.get_stats().counters == stats.counters
+
+
+def test_capture_keeps_enabled():
+    instrumentation.enable()
+    with instrumentation.capture():
+        pass
+
+    assert instrumentation.is_enabled() is True
+
+
+def test_capture_threads():
+    results = {}
+    barrier = threading.Barrier(2)
+
+    def work(name, count):
+        with instrumentation.capture(export=False) as stats:
+            barrier.wait()
+            for i in range(count):
+                Note(name='C')
+            barrier.wait()
+
+        results[name] = stats.counters['note.create']
+
+    threads = [threading.Thread(target=work, args=('a', 3)), threading.Thread(target=work, args=('b', 5))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {'a': 3, 'b': 5}
+    assert instrumentation.get_stats().counters['note.create'] == 8
+    assert instrumentation.is_enabled() is False
+
+
+def test_exporters():
+    exported = []
+    instrumentation.add_exporter(exported.append)
+
+    try:
+        with instrumentation.capture() as stats:
+            Note(name='C')
+
+        with instrumentation.capture(export=False):
+            Note(name='C')
+    finally:
+        instrumentation.remove_exporter(exported.append)
+
+    assert exported == [stats]
+
+    with instrumentation.capture():
+        pass
+
+    assert len(exported) == 1
+
+
+def test_stats():
+    stats = instrumentation.Stats()
+    stats.increment('a')
+    stats.increment('a', 2)
+    stats.add_time('t', 0.5)
+    stats.add_time('t', 0.25)
+
+    other = instrumentation.Stats()
+    other.increment('b')
+    other.add_time('t', 1)
+    other.add_time('u', 2)
+    stats.merge(other)
+
+    assert stats.as_dict() == {
+        'counters': {'a': 3, 'b': 1},
+        'timers': {'t': {'calls': 3, 'total': 1.75, 'max': 1}, 'u': {'calls': 1, 'total': 2, 'max': 2}}
+    }
+
+    report = stats.report().splitlines()
+    assert report[1].startswith('u')
+    assert report[2].startswith('t')
+
+    stats.reset()
+    assert stats.as_dict() == {'counters': {}, 'timers': {}}
@@ -0,0 +1,86 @@
+from __future__ import division
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Rest, Chord, Scale
+from babs.key_detector import KeyDetector, KeyEstimate
+
+
+def test_no_notes():
+    d = KeyDetector()
+    assert d.key() is None
+    assert d.scores().tolist() == [0] * 24
+    assert len(d.keys) == 24
+
+    d.update(Rest())
+    assert d.key() is None
+
+
+def test_major_key():
+    d = KeyDetector()
+    for n in Scale.create_from_root(root=Note(name='G')).notes:
+        d.update(n)
+
+    d.update(Note(name='G', duration=2))
+    d.update(Note(name='D'))
+
+    key = d.key()
+    assert isinstance(key, KeyEstimate)
+    assert key.root == 'G'
+    assert key.scale_type == 'MAJOR_TYPE'
+    assert 0 < key.score <= 1
+
+
+def test_minor_key():
+    d = KeyDetector(alt=Note.FLAT)
+    for n in Scale.create_from_root(root=Note(name='C'), scale_type=Scale.MINOR_TYPE, alt=Note.FLAT).notes:
+        d.update(n)
+
+    d.update(Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MINOR_TYPE))
+    d.update(Note(name='C', duration=2))
+
+    assert d.key()[:2] == ('C', 'MINOR_TYPE')
+    assert d.ranking(limit=2)[1][:2] == ('Eb', 'MAJOR_TYPE')
+    assert len(d.ranking()) == 24
+
+
+def test_decay():
+    d = KeyDetector(half_life=1)
+    d.update(Note(name='C'))
+    assert d.histogram[0] == 1
+
+    d.update(Rest(duration=2))
+    assert d.histogram[0] == 0.25
+
+    d.update(Note(name='D', duration=1/2))
+    assert d.histogram[0] == 0.25 * 0.5 ** 0.5
+    assert d.histogram[2] == 1/2
+
+    d.reset()
+    assert d.key() is None
+
+    with pytest.raises(ValueError):
+        KeyDetector(half_life=0)
+
+
+def test_modulation():
+    d = KeyDetector(half_life=4)
+    c_major = Scale.create_from_root(root=Note(name='C')).notes + [Note(name='C'), Note(name='G'), Note(name='C')]
+    e_major = Scale.create_from_root(root=Note(name='E')).notes + [Note(name='E'), Note(name='B'), Note(name='E')]
+
+    keys = list(d.feed(c_major))
+    assert keys[-1][:2] == ('C', 'MAJOR_TYPE')
+
+    keys = list(d.feed(e_major * 2))
+    assert keys[-1][:2] == ('E', 'MAJOR_TYPE')
+
+
+def test_custom_scale_types():
+    d = KeyDetector(scale_types={'DORIAN_TYPE': Scale.DORIAN_TYPE})
+    assert len(d.keys) == 12
+    d.update(Note(name='D', duration=4))
+    d.update(Note(name='F'))
+    d.update(Note(name='B'))
+    assert d.key()[:2] == ('D', 'DORIAN_TYPE')
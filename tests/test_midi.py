@@ -0,0 +1,215 @@
+from __future__ import division
+
+import struct
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Rest, Chord, Scale
+from babs import midi
+from babs.exceptions import MidiException
+
+
+def smf(*tracks, **kwargs):
+    data = struct.pack('>4sIHHH', b'MThd', 6, 1, len(tracks), kwargs.get('ticks_per_beat', 96))
+    for track in tracks:
+        data += struct.pack('>4sI', b'MTrk', len(track)) + track
+
+    return data
+
+
+def test_decode_running_status_and_velocity_zero():
+    track = bytes([
+        0x00, 0xFF, 0x51, 0x03, 0x07, 0xA1, 0x20,   # tempo 500000 us (120 bpm)
+        0x00, 0xF0, 0x02, 0x01, 0xF7,               # sysex
+        0x00, 0x90, 60, 100,                        # C4 on
+        0x00, 64, 90,                               # E4 on (running status)
+        0x60, 60, 0,                                # C4 off (velocity 0)
+        0x00, 0xC0, 5,                              # program change
+        0x81, 0x40, 0x80, 64, 0,                    # E4 off after 192 ticks
+        0x00, 0xFF, 0x2F, 0x00,
+    ])
+
+    notes = midi.decode(smf(track))
+    assert notes.ticks_per_beat == 96
+    assert notes.tempo == 120
+    assert notes.pitch.tolist() == [60, 64]
+    assert notes.velocity.tolist() == [100, 90]
+    assert notes.onset.tolist() == [0, 0]
+    assert notes.length.tolist() == [96, 288]
+    assert notes.channel.tolist() == [0, 0]
+    assert notes.track.tolist() == [0, 0]
+
+
+def test_decode_overlapping_notes():
+    track = bytes([
+        0x00, 0x91, 60, 100,
+        0x10, 0x91, 60, 100,
+        0x10, 0x81, 60, 0,
+        0x10, 0x81, 60, 0,
+        0x00, 0x91, 62, 100,
+    ])
+
+    notes = midi.decode(smf(track))
+    assert notes.onset.tolist() == [0, 16]
+    assert notes.length.tolist() == [32, 32]
+    assert notes.channel.tolist() == [1, 1]
+    assert notes.tempo == midi.DEFAULT_TEMPO
+
+
+def test_decode_stray_note_off():
+    track = bytes([
+        0x00, 0x90, 60, 100,                        # on at 0
+        0x83, 0x60, 0x80, 60, 0,                    # off at 480
+        0x14, 0x80, 60, 0,                          # stray off at 500
+        0x83, 0x4C, 0x90, 60, 90,                   # on at 960
+        0x83, 0x60, 0x80, 60, 0,                    # off at 1440
+    ])
+
+    notes = midi.decode(smf(track))
+    assert notes.onset.tolist() == [0, 960]
+    assert notes.length.tolist() == [480, 480]
+    assert notes.velocity.tolist() == [100, 90]
+
+
+def test_decode_leading_note_off():
+    track = bytes([
+        0x00, 0x80, 60, 0,                          # stray off at 0
+        0x00, 0x80, 64, 0,                          # stray off of another pitch
+        0x00, 0x90, 60, 100,                        # on at 0
+        0x00, 0x90, 64, 100,                        # on at 0
+        0x83, 0x60, 0x80, 60, 0,                    # off at 480
+        0x00, 0x80, 64, 0,                          # off at 480
+        0x00, 0x90, 67, 100,                        # on without off
+    ])
+
+    notes = midi.decode(smf(track))
+    assert notes.pitch.tolist() == [60, 64]
+    assert notes.onset.tolist() == [0, 0]
+    assert notes.length.tolist() == [480, 480]
+
+
+def test_decode_tracks():
+    first = bytes([0x00, 0x90, 60, 100, 0x60, 0x80, 60, 0])
+    second = bytes([0x30, 0x92, 67, 80, 0x60, 0x82, 67, 0])
+
+    notes = midi.decode(smf(first, second))
+    assert notes.track.tolist() == [0, 1]
+    assert notes.channel.tolist() == [0, 2]
+    assert notes.onset.tolist() == [0, 48]
+
+
+def test_decode_invalid():
+    with pytest.raises(MidiException):
+        midi.decode(b'RIFF0000')
+
+    with pytest.raises(MidiException):
+        midi.decode(smf(bytes([0x00, 60, 100])))
+
+    with pytest.raises(MidiException):
+        midi.decode(smf(bytes([0x00, 0x90, 60])))
+
+    with pytest.raises(MidiException):
+        midi.decode(struct.pack('>4sIHHH', b'MThd', 6, 0, 1, 0xE728))
+
+
+def test_encode_decode():
+    notes = midi.MidiNotes(
+        ticks_per_beat=480,
+        tempo=90,
+        track=np.array([0, 0, 1]),
+        channel=np.array([0, 0, 9]),
+        pitch=np.array([60, 64, 36]),
+        velocity=np.array([100, 80, 127]),
+        onset=np.array([0, 0, 100000]),
+        length=np.array([480, 960, 0])
+    )
+
+    decoded = midi.decode(midi.encode(notes))
+    assert decoded.ticks_per_beat == 480
+    assert decoded.tempo == pytest.approx(90)
+    for field in ('track', 'channel', 'pitch', 'velocity', 'onset', 'length'):
+        assert getattr(decoded, field).tolist() == getattr(notes, field).tolist()
+
+
+def test_from_events_to_events():
+    c = Chord.create_from_root(root=Note(name='C', duration=1/2), chord_type=Chord.MAJOR_TYPE)
+    for n in c.notes:
+        n.duration = 1/2
+
+    events = [Note(name='A', duration=1/4), Rest(duration=1/8), c, Note(name='G', octave=3, duration=1/8)]
+    notes = midi.from_events(events, ticks_per_beat=96)
+
+    assert notes.pitch.tolist() == [69, 60, 64, 67, 55]
+    assert notes.onset.tolist() == [0, 144, 144, 144, 336]
+    assert notes.length.tolist() == [96, 192, 192, 192, 48]
+
+    decoded = midi.to_events(midi.decode(midi.encode(notes)))
+    assert decoded == events
+
+
+def test_out_of_range():
+    with pytest.raises(MidiException) as exc:
+        midi.from_events([Note.from_pitch(140, duration=1/4)])
+
+    assert 'Invalid MIDI pitch, it must be between 0 and 127.' == str(exc.value)
+
+    with pytest.raises(MidiException):
+        midi.from_events([Note(name='C', duration=1/4)], velocity=128)
+
+    with pytest.raises(MidiException):
+        midi.from_events([Note(name='C', duration=1/4)], channel=16)
+
+    notes = midi.from_events([Note(name='C', duration=1/4)])
+    with pytest.raises(MidiException):
+        midi.encode(notes._replace(pitch=np.array([-1])))
+
+    with pytest.raises(MidiException):
+        midi.from_events([Rest(duration=1/4)], channel=16)
+
+
+def test_to_events_shortens_overlapping_notes():
+    notes = midi.MidiNotes(
+        ticks_per_beat=96,
+        tempo=120,
+        track=np.zeros(2, dtype=int),
+        channel=np.zeros(2, dtype=int),
+        pitch=np.array([60, 62]),
+        velocity=np.full(2, 64),
+        onset=np.array([0, 96]),
+        length=np.array([192, 96])
+    )
+
+    assert midi.to_events(notes) == [Note(name='C', duration=1/4), Note(name='D', duration=1/4)]
+
+
+def test_from_scale():
+    s = Scale.create_from_root(root=Note(name='C'))
+    notes = midi.from_events(s, ticks_per_beat=96)
+
+    assert notes.pitch.tolist() == [60, 62, 64, 65, 67, 69, 71]
+    assert notes.onset.tolist() == [i * 384 for i in range(7)]
+
+
+def test_to_note_array():
+    notes = midi.from_events([Note(name='A', duration=1/4), Rest(duration=1/4), Note(name='Eb', duration=1/8, alt=Note.FLAT)])
+    note_array, onsets = midi.to_note_array(notes, alt=Note.FLAT)
+
+    assert note_array.pitch.tolist() == [69, 63]
+    assert note_array.duration.tolist() == [1/4, 1/8]
+    assert note_array.names == ['A', 'Eb']
+    assert onsets.tolist() == [0, 1/2]
+
+
+def test_read_write(tmpdir):
+    path = str(tmpdir.join('a.mid'))
+    events = [Note(name='C', duration=1/4), Rest(duration=1/4), Note(name='D', duration=1/4)]
+
+    midi.write(path, events, tempo=100)
+    assert midi.read(path) == events
+    assert midi.read_notes(path).tempo == pytest.approx(100)
+
+    path = str(tmpdir.join('b.mid'))
+    midi.write_notes(path, midi.from_events(events))
+    assert midi.read(path) == events
@@ -52,6 +52,15 @@ def test_create_with_name():
     assert n.octave == 5
 
 
+def test_create_with_float_octave():
+    n = Note(name='C', octave=4.0)
+    assert n.freq == 261.63
+    assert n.pitch == 60
+
+    n = Note(name='C', octave=4.5)
+    assert n.freq == 369.99
+
+
 def test_create_with_freq():
     n = Note(freq=440)
     assert n.name == 'A'
@@ -258,3 +267,199 @@ def test_get_note_name_by_index():
     assert Note.get_note_name_by_index(1, alt=Note.FLAT) == 'Db'
     assert Note.get_note_name_by_index(12) == 'C'
     assert Note.get_note_name_by_index(26) == 'D'
+
+
+def test_pitch():
+    assert Note(name='A').pitch == 69
+    assert Note(name='C').pitch == 60
+    assert Note(name='C', octave=-1).pitch == 0
+    assert Note(name='B', octave=3).pitch == 59
+    assert Note(freq=440).pitch == 69
+    assert Note(freq=445).pitch == 69
+    assert Note(freq=466.16, alt=Note.FLAT).pitch == 70
+
+    n = Note(freq=440)
+    n.pitch_shift(value=3, half_step=True)
+    assert n.pitch == 72
+
+    n.freq = 220
+    assert n.pitch == 57
+
+
+def test_from_pitch():
+    n = Note.from_pitch(69)
+    assert n.name == 'A'
+    assert n.freq == 440
+    assert n.octave == 4
+
+    n = Note.from_pitch(70, alt=Note.FLAT, duration=1/8)
+    assert n.name == 'Bb'
+    assert n.freq == 466.16
+    assert n.octave == 4
+    assert n.duration == 1/8
+
+    n = Note.from_pitch(140)
+    assert n.name == 'G#'
+    assert n.octave == 10
+    assert n.pitch == 140
+
+
+def test_pitch_table():
+    table = Note.get_pitch_table()
+    assert table.get_freq(69) == 440
+    assert table.get_pitch(440) == 69
+    assert table.get_freq(21) == Note(name='A', octave=0).freq
+    assert table.get_freq(108) == Note(name='C', octave=8).freq
+    assert Note.get_pitch_table() is table
+
+    try:
+        Note.A_FREQUENCY = 432
+        assert Note.get_pitch_table() is not table
+        assert Note(name='A').freq == 432
+        assert Note(freq=432).name == 'A'
+    finally:
+        Note.A_FREQUENCY = 440
+
+    assert Note.get_pitch_table().get_freq(69) == 440
+
+
+def test_pitch_shift_half_step_no_drift():
+    n = Note(name='C')
+    for i in range(12):
+        n.pitch_shift(value=1, half_step=True)
+
+    assert n.freq == Note(name='C', octave=5).freq
+    assert n.name == 'C'
+    assert n.octave == 5
+
+
+def test_get_note_index():
+    assert Note(name='C').get_note_index() == 0
+    assert Note(name='C#').get_note_index() == 1
+    assert Note(name='Db').get_note_index() == 1
+    assert Note(name='B').get_note_index() == 11
+    assert Note(freq=466.16, alt=Note.FLAT).get_note_index() == 10
+
+    for idx, names in enumerate(Note.NOTES):
+        for name in names.split('/'):
+            assert Note.NOTE_INDEXES[name] == idx
+
+
+def test_parse():
+    n = Note.parse('C#4')
+    assert n.name == 'C#'
+    assert n.octave == 4
+    assert n.freq == 277.18
+
+    n = Note.parse('Bb3', duration=1/8)
+    assert n.name == 'Bb'
+    assert n.octave == 3
+    assert n.duration == 1/8
+
+    assert Note.parse('A') == Note(name='A')
+    assert Note.parse('C-1').octave == -1
+
+    for text in ['S4', 'E#4', 'c4', 'C4x', '', 4]:
+        with pytest.raises(NoteException) as exc:
+            Note.parse(text)
+
+        assert 'Invalid note.' == str(exc.value)
+
+
+def test_parse_many():
+    notes = Note.parse_many(['C4', 'E4', 'G4', 'C4'])
+    assert notes == [Note(name='C'), Note(name='E'), Note(name='G'), Note(name='C')]
+    assert notes[0] is not notes[3]
+
+    notes = Note.parse_many('Db4 F4 Ab4', duration=1/4)
+    assert [str(n) for n in notes] == ['Db4', 'F4', 'Ab4']
+    assert all(n.duration == 1/4 for n in notes)
+
+    with pytest.raises(NoteException):
+        Note.parse_many('C4 H4')
+
+
+def test_from_freqs():
+    np = pytest.importorskip('numpy')
+
+    freqs = np.array([440, 466.16, 445, 261.63, 0, -1, np.nan, np.inf])
+    q = Note.from_freqs(freqs)
+
+    assert q.valid.tolist() == [True, True, True, True, False, False, False, False]
+    assert q.pitch.tolist() == [69, 70, 69, 60, 0, 0, 0, 0]
+    assert q.index.tolist() == [9, 10, 9, 0, 0, 0, 0, 0]
+    assert q.octave.tolist() == [4, 4, 4, 4, 0, 0, 0, 0]
+    assert q.names.tolist() == ['A', 'A#', 'A', 'C', '', '', '', '']
+    assert q.cents[0] == 0
+    assert abs(q.cents[2] - 19.56) < 0.01
+    assert abs(q.cents[1]) < 0.1
+
+    assert Note.from_freqs(freqs, alt=Note.FLAT).names.tolist()[:2] == ['A', 'Bb']
+
+    for freq in [27.5, 100, 246.94, 622.25, 1000, 4186.01]:
+        n = Note(freq=freq)
+        q = Note.from_freqs([freq])
+        assert q.pitch[0] == n.pitch
+        assert q.names[0] == n.name
+        assert q.octave[0] == n.octave
+
+    try:
+        Note.A_FREQUENCY = 432
+        assert abs(Note.from_freqs([432]).cents[0]) < 1e-9
+        assert Note.from_freqs([440]).pitch[0] == 69
+        assert Note.from_freqs([440]).cents[0] > 30
+    finally:
+        Note.A_FREQUENCY = 440
+
+
+def test_transposed():
+    n = Note(name='C', octave=4, duration=1/2)
+    t = n.transposed(3)
+
+    assert t is not n
+    assert n.freq == 261.63
+    assert t.freq == 311.13
+    assert t.name == 'D#'
+    assert t.octave == 4
+    assert t.pitch == 63
+    assert t.duration == 1/2
+
+    t = n.transposed(3, alt=Note.FLAT)
+    assert t.name == 'Eb'
+    assert t.alt == Note.FLAT
+
+    t = n.transposed(-13)
+    assert t.name == 'B'
+    assert t.octave == 2
+
+    for i in range(100):
+        n = n.transposed(7).transposed(-7)
+
+    assert n.freq == 261.63
+
+    n = Note(freq=300)
+    t = n.transposed(12)
+    assert t.freq == 600
+    assert t.name == n.name
+
+    n = Note(name='G', octave=9)
+    t = n.transposed(1)
+    assert t.name == 'G#'
+    assert t.octave == 9
+
+
+def test_transposed_numpy_integer():
+    np = pytest.importorskip('numpy')
+
+    n = Note(name='C', octave=1)
+    for i in range(60):
+        n = n.transposed(np.int64(1))
+
+    assert n.freq == Note(name='C', octave=6).freq
+    assert type(n.pitch) is int
+
+    n = Note(name='C', octave=4)
+    n.pitch_shift(np.int64(4), half_step=True)
+    assert n.freq == 329.63
+    assert n.name == 'E'
+    assert type(n.pitch) is int
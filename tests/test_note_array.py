@@ -0,0 +1,147 @@
+from __future__ import division
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Chord, Scale
+from babs.note_array import NoteArray
+
+
+def test_create():
+    a = NoteArray(freq=[440, 466.16, 220])
+    assert len(a) == 3
+    assert a.pitch.tolist() == [69, 70, 57]
+    assert a.octave.tolist() == [4, 4, 3]
+    assert a.pitch_class.tolist() == [9, 10, 9]
+    assert a.duration.tolist() == [1, 1, 1]
+    assert a.names == ['A', 'A#', 'A']
+
+    a = NoteArray(pitch=[60, 61], alt=[0, 2], duration=[1/4, 1/8])
+    assert a.freq.tolist() == [261.63, 277.18]
+    assert a.names == ['C', 'Db']
+    assert a.duration.tolist() == [1/4, 1/8]
+
+    a = NoteArray(pitch=[61], flat=[True])
+    assert a.names == ['Db']
+
+    with pytest.raises(ValueError):
+        NoteArray()
+
+    with pytest.raises(ValueError):
+        NoteArray(pitch=[60, 61], duration=[1])
+
+
+def test_conversion():
+    notes = [
+        Note(name='C'),
+        Note(name='Db', octave=3, duration=1/8),
+        Note(freq=466.16, alt=Note.FLAT),
+        Note(freq=445, alt=Note.SHARP, duration=1/4),
+        Note(name='A', octave=9),
+    ]
+
+    a = NoteArray.from_notes(notes)
+    converted = a.to_notes()
+
+    assert converted == notes
+    for n, c in zip(notes, converted):
+        assert type(c.freq) is float
+        assert c.freq == n.freq
+        assert c.name == n.name
+        assert c.octave == n.octave
+        assert c.alt == n.alt
+        assert c.pitch == n.pitch
+        assert c.duration == n.duration
+
+    assert list(a) == notes
+    assert a[1].name == 'Db'
+    assert a[-1].octave == 9
+    assert str(a) == 'NoteArray(C, Db, Bb, A, A)'
+
+
+def test_note_list_conversion():
+    c = Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MINOR_SEVEN_TYPE, alt=Note.FLAT)
+    a = NoteArray.from_note_list(c)
+    assert a.names == ['C', 'Eb', 'G', 'Bb']
+    assert a.to_note_list(Chord) == c
+
+    s = Scale.create_from_root(root=Note(name='D'), order=Scale.DESCENDING_SCALE_TYPE)
+    assert NoteArray.from_note_list(s).to_note_list(Scale, order=Scale.DESCENDING_SCALE_TYPE) == s
+
+
+def test_getitem():
+    a = NoteArray(pitch=[60, 62, 64, 65])
+
+    assert isinstance(a[0], Note)
+    assert a[0] == Note(name='C')
+    assert a[1:3].names == ['D', 'E']
+    assert a[np.array([3, 0])].names == ['F', 'C']
+    assert a[a.pitch > 62].names == ['E', 'F']
+
+
+def test_transpose():
+    a = NoteArray.from_notes([Note(name='C'), Note(name='E'), Note(freq=445)])
+
+    t = a.transpose(2)
+    assert t.names == ['D', 'F#', 'B']
+    assert t.pitch.tolist() == [62, 66, 71]
+    assert t.freq.tolist()[:2] == [Note(name='D').freq, Note(name='F#').freq]
+    assert t.freq[2] == round(445 * Note.HALF_STEP_INTERVAL ** 2, 2)
+    assert a.names == ['C', 'E', 'A']
+
+    assert a.transpose(1, alt=Note.FLAT).names == ['Db', 'F', 'Bb']
+    assert a.transpose([0, 12, -12]).pitch.tolist() == [60, 76, 57]
+
+    t = a
+    for i in range(12):
+        t = t.transpose(1)
+
+    assert t.freq.tolist()[:2] == [Note(name='C', octave=5).freq, Note(name='E', octave=5).freq]
+
+
+def test_pitch_shift():
+    a = NoteArray(freq=[440, 220])
+
+    assert a.pitch_shift(2, half_step=True).to_notes() == [Note(freq=493.88), Note(freq=246.94)]
+    assert a.pitch_shift(1, octave=True).freq.tolist() == [880, 440]
+    assert a.pitch_shift(53.88).names == ['B', 'C#']
+    assert a.pitch_shift(26.16, alt=Note.FLAT).names == ['Bb', 'B']
+
+    for value, kwargs in [(53.88, {}), (1, {'octave': True}), (0.5, {'half_step': True})]:
+        shifted = a.pitch_shift(value, **kwargs).to_notes()
+        for n, s in zip(a.to_notes(), shifted):
+            n.pitch_shift(value, **kwargs)
+            assert n.freq == s.freq
+            assert n.name == s.name
+            assert n.octave == s.octave
+
+
+def test_filter_and_sort():
+    a = NoteArray(pitch=[64, 60, 67, 60], duration=[1, 1/4, 1/2, 1/8])
+
+    assert a.filter(a.duration < 1).pitch.tolist() == [60, 67, 60]
+    assert a.sort().pitch.tolist() == [60, 60, 64, 67]
+    assert a.sort().duration.tolist() == [1/4, 1/8, 1, 1/2]
+    assert a.sort(reverse=True).pitch.tolist() == [67, 64, 60, 60]
+    assert a.sort(by='duration').pitch.tolist() == [60, 60, 67, 64]
+
+
+def test_copy():
+    a = NoteArray(pitch=[60, 62])
+    b = a.copy()
+    b.pitch[0] = 61
+    assert a.pitch.tolist() == [60, 62]
+
+
+def test_retune():
+    from babs.tuning import EqualTemperament
+
+    t = EqualTemperament(reference_frequency=432)
+    a = NoteArray(pitch=[57, 69, 200], duration=[1/4, 1/2, 1])
+    r = a.retune(t)
+
+    assert r.freq.tolist() == [216, 432, t.get_rounded_freq(200)]
+    assert r.pitch.tolist() == [57, 69, 200]
+    assert r.duration.tolist() == [1/4, 1/2, 1]
+    assert a.freq.tolist()[1] == 440
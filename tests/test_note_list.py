@@ -1,6 +1,7 @@
 import pytest
 
-from babs import NoteList, Note
+from babs import NoteList, Note, Rest
+from babs.pitch_class_set import PitchClassSet
 
 from babs.exceptions import NoteListException
 
@@ -479,6 +480,11 @@ def test_get_notes_from_root_with_callable_octave():
     assert Note(name='Eb', octave=1) in notes
     assert Note(name='G', octave=2) in notes
 
+    notes = Mock.get_notes_from_root(root=Note(name='C', octave=3), note_list_type=[3, 7], octave=lambda root_octave, i, distance: root_octave + 1.0)
+
+    assert Note(name='Eb', octave=4) in notes
+    assert Note(name='G', octave=4) in notes
+
     with pytest.raises(TypeError):
         notes = Mock.get_notes_from_root(root=Note(name='C', octave=3), note_list_type=[3, 7], octave=lambda: 'invalid')
 
@@ -491,3 +497,198 @@ def test_get_notes_from_root_with_invalid_octave():
     assert Note(name='F', octave=4) in notes
     assert Note(name='G', octave=4) in notes
     assert Note(name='Bb', octave=4) in notes
+
+
+def test_get_types():
+    class TypedMock(NoteList):
+        FIRST_TYPE = [1, 2]
+        SECOND_TYPE = [3]
+        ORDER_TYPE = 'asc'
+
+    assert list(TypedMock.get_types().items()) == [('FIRST_TYPE', [1, 2]), ('SECOND_TYPE', [3])]
+    assert Mock.get_types() == {}
+
+
+def test_pitch_class_set():
+    m = Mock(Note(name='C'), Note(name='E'), Note(name='G', octave=3))
+    assert m.pitch_class_set == PitchClassSet(0, 4, 7)
+    assert m.pitch_set == frozenset([60, 64, 55])
+    assert m.pitch_class_set is m.pitch_class_set
+
+    m.add_note(Note(name='Bb'))
+    assert m.pitch_class_set == PitchClassSet(0, 4, 7, 10)
+    assert 70 in m.pitch_set
+
+    m.remove_note(name='C')
+    assert m.pitch_class_set == PitchClassSet(4, 7, 10)
+    assert m.pitch_set == frozenset([64, 55, 70])
+
+    m.remove_note(octave=4, strict=False)
+    assert m.pitch_class_set == PitchClassSet(7)
+
+    with pytest.raises(NoteListException):
+        m.remove_note(octave=3)
+
+    assert m.pitch_class_set == PitchClassSet(7)
+    assert m.pitch_set == frozenset([55])
+
+    m = Mock(Note(name='C'), 'invalid', strict=False)
+    assert m.pitch_class_set == PitchClassSet(0)
+
+
+def test_select():
+    m = Mock(Note(name='C'), Note(name='E'), Note(name='C', octave=5), Note(name='C', duration=1/4), Note(name='G', octave=3))
+
+    assert m.select(name='C') == [Note(name='C'), Note(name='C', octave=5), Note(name='C', duration=1/4)]
+    assert m.select(note=Note(name='C')) == [Note(name='C')]
+    assert m.select(freq=Note(name='E').freq) == [Note(name='E')]
+    assert m.select(octave=3) == [Note(name='G', octave=3)]
+    assert m.select(name='C', octave=4) == [Note(name='C'), Note(name='C', duration=1/4)]
+    assert m.select(name='C', octave=3) == []
+    assert m.select(name='D') == []
+    assert m.select(predicate=lambda n: n.duration < 1) == [Note(name='C', duration=1/4)]
+    assert m.select(name='C', predicate=lambda n: n.octave == 5) == [Note(name='C', octave=5)]
+    assert m.select() == m.notes
+    assert m.select() is not m.notes
+
+    m.add_note(Note(name='C', octave=3))
+    assert m.select(name='C', octave=3) == [Note(name='C', octave=3)]
+
+    m.remove_note(octave=3)
+    assert m.select(octave=3) == []
+    assert m.select(name='E') == [Note(name='E')]
+
+
+def test_remove_notes():
+    m = Mock(Note(name='C'), Note(name='E'), Note(name='C', octave=5), Note(name='G', octave=3))
+
+    assert m.remove_notes(lambda n: n.octave != 4) == 2
+    assert m.notes == [Note(name='C'), Note(name='E')]
+
+    assert m.remove_notes(name='D') == 0
+    assert m.remove_notes() == 0
+    assert len(m.notes) == 2
+
+    with pytest.raises(NoteListException) as exc:
+        m.remove_notes(octave=4)
+
+    assert 'Invalid Mock.' == str(exc.value)
+    assert m.notes == [Note(name='C'), Note(name='E')]
+    assert m.select(name='E') == [Note(name='E')]
+
+    assert m.remove_notes(octave=4, strict=False) == 2
+    assert m.notes == []
+
+
+def test_remove_note_large_list():
+    notes = [Note.from_pitch(p % 88 + 21) for p in range(5000)]
+    m = Mock(*notes)
+
+    m.remove_note(name='C')
+    assert len(m.notes) == 5000 - len([n for n in notes if n.name == 'C'])
+    assert all(n.name != 'C' for n in m.notes)
+
+    m.remove_note(note=Note(name='A'))
+    assert Note(name='A') not in m.notes
+
+
+def test_remove_note_with_items_that_are_not_notes():
+    m = Mock(Note(name='C'), Rest(duration=1/4), Note(name='E'), strict=False)
+
+    m.remove_note(note=Note(name='E'), strict=False)
+    assert m.notes == [Note(name='C'), Rest(duration=1/4)]
+    assert m.select(note=Note(name='C')) == [Note(name='C')]
+
+    m.remove_note(note=Note(name='C', duration=1/4), strict=False)
+    assert m.notes == [Note(name='C')]
+    assert m.select(name='C') == [Note(name='C')]
+
+
+def test_remove_notes_keeps_indexes():
+    notes = [Note.from_pitch(p % 88 + 21) for p in range(500)]
+    m = Mock(*notes)
+    m.select(name='C')
+    m.select(octave=4)
+
+    assert m.remove_notes(name='C') == len([n for n in notes if n.name == 'C'])
+    assert set(m._indexes) == {'name', 'octave'}
+    assert m.select(octave=4) == [n for n in m.notes if n.octave == 4]
+    assert m.select(name='D', octave=5) == [n for n in m.notes if n.name == 'D' and n.octave == 5]
+    assert m.select(name='C') == []
+
+    with pytest.raises(NoteListException):
+        m.remove_notes(predicate=lambda n: True)
+
+    assert m.select(octave=4) == [n for n in m.notes if n.octave == 4]
+
+    m.remove_note(note=Note(name='A'))
+    assert m.select(octave=4) == [n for n in m.notes if n.octave == 4]
+
+
+def test_copy():
+    n = Mock(Note(name='C'), Note(name='E'), strict=True)
+    c = n.copy()
+
+    assert c == n
+    assert c is not n
+    assert c.notes is not n.notes
+    assert all(n1 is not n2 for n1, n2 in zip(c.notes, n.notes))
+    assert c.strict is n.strict
+
+    c.add_note(Note(name='G'))
+    assert len(n.notes) == 2
+
+
+def test_transpose():
+    c, e = Note(name='C'), Note(name='E')
+    n = Mock(c, e)
+    pitch_class_set = n.pitch_class_set
+    n.transpose(2)
+
+    assert [x.name for x in n.notes] == ['D', 'F#']
+    assert c.name == 'C'
+    assert n.pitch_class_set == pitch_class_set.transpose(2)
+    assert n.pitch_set == frozenset([62, 66])
+    assert n.select(name='D')[0].freq == 293.66
+
+    n.transpose(-2, alt=Note.FLAT)
+    assert [x.name for x in n.notes] == ['C', 'E']
+    assert [x.freq for x in n.notes] == [c.freq, e.freq]
+
+    m = n.transposed(1, alt=Note.FLAT)
+    assert [x.name for x in m.notes] == ['Db', 'F']
+    assert [x.name for x in n.notes] == ['C', 'E']
+
+    n = Mock(Note(name='C'), 'invalid', strict=False)
+    n.transpose(12)
+    assert n.notes[0].octave == 5
+    assert n.notes[1] == 'invalid'
+
+
+def test_transpose_numpy_integer():
+    np = pytest.importorskip('numpy')
+
+    n = Mock(Note(name='C'), Note(name='E'))
+    pitch_class_set = n.pitch_class_set
+    for i in range(50):
+        n.transpose(np.int64(5))
+        n.transpose(np.int64(-5))
+
+    assert [x.freq for x in n.notes] == [261.63, 329.63]
+    assert n._pitch_class_set == pitch_class_set
+
+
+def test_nearest():
+    n = Mock(Note(name='C'), Note(name='E'), Note(name='G'))
+
+    m = n.nearest(450)
+    assert m.pitch == 67
+    assert m.freq == 392
+    assert m.cents == pytest.approx(238.89, abs=0.01)
+    assert n.nearest(270).pitch == 60
+    assert n.nearest(0) is None
+
+    n.add_note(Note(name='A'))
+    assert n.nearest(450).pitch == 69
+
+    assert Mock(strict=False).nearest(440) is None
@@ -0,0 +1,142 @@
+from __future__ import division
+
+import random
+
+import pytest
+
+from babs import Note, OrderedNoteList, Chord, Scale
+from babs.exceptions import NoteListException
+
+
+class Mock(OrderedNoteList):
+    def __init__(self, *notes, **kwargs):
+        super().__init__(*notes, **kwargs)
+        self._order()
+
+
+def test_create():
+    m = Mock(Note(name='E'), Note(name='C'), Note(name='D', octave=3))
+    assert [str(n) for n in m.notes] == ['D3', 'C4', 'E4']
+
+    with pytest.raises(NoteListException):
+        Mock()
+
+
+def test_contains():
+    m = Mock(Note(name='E'), Note(name='C'))
+    assert Note(name='C') in m
+    assert Note(freq=329.63) in m
+    assert Note(name='C', duration=1/8) not in m
+    assert Note(name='D') not in m
+    assert 'invalid' not in m
+
+    m.add_note(Note(name='D'))
+    assert Note(name='D') in m
+
+    m.remove_note(note=Note(name='C'))
+    assert Note(name='C') not in m
+
+
+def test_add_note_keeps_order():
+    notes = [Note.from_pitch(random.randint(21, 108), duration=random.choice([1/4, 1/2])) for _ in range(300)]
+    m = Mock(notes[0])
+    for n in notes[1:]:
+        m.add_note(n)
+
+    assert m.notes == sorted(notes, key=lambda n: n.freq)
+
+
+def test_add_note_is_stable():
+    m = Mock(Note(name='C'))
+    m.add_note(Note(name='C', duration=1/4))
+    m.add_note(Note(name='C', duration=1/8))
+    m.add_note(Note(name='C', octave=3))
+
+    assert [n.duration for n in m.notes] == [1, 1, 1/4, 1/8]
+    assert m.notes[0].octave == 3
+
+
+def test_remove_note():
+    m = Mock(Note(name='C'), Note(name='E'), Note(name='C'), Note(name='C', duration=1/4), Note(name='G'))
+    m.remove_note(note=Note(name='C'))
+    assert m.notes == [Note(name='C', duration=1/4), Note(name='E'), Note(name='G')]
+
+    m.remove_note(note=Note(name='A'))
+    assert len(m.notes) == 3
+
+    m.add_note(Note(name='D'))
+    assert m.notes == [Note(name='C', duration=1/4), Note(name='D'), Note(name='E'), Note(name='G')]
+
+    m.remove_note(name='E')
+    m.add_note(Note(name='F'))
+    assert m.notes == [Note(name='C', duration=1/4), Note(name='D'), Note(name='F'), Note(name='G')]
+
+
+def test_remove_note_strict():
+    m = Mock(Note(name='C'), Note(name='C'))
+    with pytest.raises(NoteListException):
+        m.remove_note(note=Note(name='C'))
+
+    assert m.notes == [Note(name='C'), Note(name='C')]
+    assert Note(name='C') in m
+
+    m.remove_note(note=Note(name='C'), strict=False)
+    assert m.notes == []
+    assert Note(name='C') not in m
+
+    m.add_note(Note(name='E'))
+    m.add_note(Note(name='D'))
+    assert m.notes == [Note(name='D'), Note(name='E')]
+
+
+def test_invalid_notes():
+    m = Mock(Note(name='E'), strict=False)
+    m.add_note('invalid', strict=False)
+    m.add_note(Note(name='C'))
+    assert m.notes == [Note(name='E'), 'invalid', Note(name='C')]
+
+    m = Mock(Note(name='E'), strict=False)
+    m.add_note(Note(name='D'))
+    m.add_note(Note(name='C'))
+    assert m.notes == [Note(name='C'), Note(name='D'), Note(name='E')]
+
+
+def test_chord_and_scale():
+    c = Chord(Note(name='G'), Note(name='C'))
+    c.add_note(Note(name='E'))
+    assert str(c) == 'C4,E4,G4'
+    assert Note(name='E') in c
+
+    s = Scale(Note(name='C'), Note(name='E'), order=Scale.DESCENDING_SCALE_TYPE)
+    s.add_note(Note(name='D'))
+    s.add_note(Note(name='B', octave=3))
+    s.add_note(Note(name='F'))
+    assert str(s) == 'F4,E4,D4,C4,B3'
+
+    s.remove_note(note=Note(name='D'))
+    assert str(s) == 'F4,E4,C4,B3'
+    assert Note(name='D') not in s
+
+
+def test_select():
+    m = Mock(Note(name='E'), Note(name='C'))
+    assert m.select(name='C') == [Note(name='C')]
+
+    m.add_note(Note(name='G'))
+    assert m.select(octave=4) == [Note(name='C'), Note(name='E'), Note(name='G')]
+
+    m.add_note(Note(name='D'))
+    assert m.select(octave=4) == [Note(name='C'), Note(name='D'), Note(name='E'), Note(name='G')]
+    assert m.select(name='E') == [Note(name='E')]
+
+    m.remove_note(note=Note(name='D'))
+    assert m.select(name='E') == [Note(name='E')]
+
+    assert m.remove_notes(name='C') == 1
+    assert m.notes == [Note(name='E'), Note(name='G')]
+    assert Note(name='C') not in m
+    assert set(m._indexes) == {'name', 'octave'}
+    assert m.select(octave=4) == [Note(name='E'), Note(name='G')]
+
+    m.add_note(Note(name='F'))
+    assert m.select(octave=4) == [Note(name='E'), Note(name='F'), Note(name='G')]
@@ -0,0 +1,74 @@
+import pickle
+
+import pytest
+
+from babs import Note
+from babs.pitch_class_set import PitchClassSet
+
+
+def test_create():
+    s = PitchClassSet(0, 4, 7)
+    assert s.mask == 0b10010001
+    assert list(s) == [0, 4, 7]
+    assert len(s) == 3
+    assert PitchClassSet(12, 16, -5) == s
+    assert PitchClassSet() == PitchClassSet.from_mask(0)
+    assert len(PitchClassSet()) == 0
+    assert PitchClassSet.from_mask(0b10010001) == s
+    assert PitchClassSet.from_mask(0x1FFF) == PitchClassSet(*range(12))
+
+
+def test_from_notes():
+    s = PitchClassSet.from_notes([Note(name='C'), Note(name='E', octave=5), Note(name='G'), Note(name='C', octave=3)])
+    assert s == PitchClassSet(0, 4, 7)
+    assert PitchClassSet.from_notes([]) == PitchClassSet()
+
+
+def test_contains():
+    s = PitchClassSet(0, 4, 7)
+    assert 4 in s
+    assert 16 in s
+    assert 5 not in s
+    assert Note(name='E', octave=2) in s
+    assert Note(name='Eb') not in s
+
+
+def test_set_operations():
+    c = PitchClassSet(0, 4, 7)
+    am = PitchClassSet(9, 0, 4)
+
+    assert c | am == PitchClassSet(0, 4, 7, 9)
+    assert c.union(am) == c | am
+    assert c & am == PitchClassSet(0, 4)
+    assert c.intersection(am) == c & am
+    assert c - am == PitchClassSet(7)
+    assert c.difference(am) == c - am
+
+    major = PitchClassSet(0, 2, 4, 5, 7, 9, 11)
+    assert c <= major
+    assert c.issubset(major)
+    assert major >= c
+    assert major.issuperset(c)
+    assert not major <= c
+    assert not PitchClassSet(1) <= major
+
+
+def test_transpose():
+    c = PitchClassSet(0, 4, 7)
+    assert c.transpose(2) == PitchClassSet(2, 6, 9)
+    assert c.transpose(7) == PitchClassSet(7, 11, 2)
+    assert c.transpose(-1) == PitchClassSet(11, 3, 6)
+    assert c.transpose(12) == c
+    assert c.transpose(0) == c
+
+
+def test_immutable_and_hashable():
+    s = PitchClassSet(0, 4, 7)
+    with pytest.raises(AttributeError):
+        s._mask = 0
+
+    assert {s: 1}[PitchClassSet(7, 4, 0)] == 1
+    assert s != PitchClassSet(0)
+    assert s != 0b10010001
+    assert pickle.loads(pickle.dumps(s)) == s
+    assert repr(s) == 'PitchClassSet(0, 4, 7)'
@@ -0,0 +1,118 @@
+from __future__ import division
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Rest, Scale
+from babs.renderer import Renderer
+from babs.pitch_detector import PitchDetector, transcribe_file, transcribe_many
+from babs import wav
+
+
+def describe(events):
+    return [(onset, str(event) if isinstance(event, Note) else None, event.duration) for onset, event in events]
+
+
+def assert_events(events, expected, tolerance=0.02):
+    """
+    Time resolution of transcription is a hop, onsets and durations are compared with tolerance
+    """
+    events = describe(events)
+    assert [name for onset, name, duration in events] == [name for onset, name, duration in expected]
+    assert [onset for onset, name, duration in events] == pytest.approx([onset for onset, name, duration in expected], abs=tolerance)
+    assert [duration for onset, name, duration in events] == pytest.approx([duration for onset, name, duration in expected], abs=tolerance)
+
+
+def test_create():
+    with pytest.raises(ValueError):
+        PitchDetector(min_freq=0)
+
+    with pytest.raises(ValueError):
+        PitchDetector(min_freq=100, max_freq=50)
+
+    with pytest.raises(ValueError):
+        PitchDetector(hop_size=0)
+
+    with pytest.raises(ValueError):
+        PitchDetector(frame_size=512, min_freq=50)
+
+
+def test_get_duration():
+    d = PitchDetector(sample_rate=1000, tempo=60)
+    assert d.get_duration(1000) == 1/4
+    assert d.get_duration(4000) == 1
+
+
+def test_estimate():
+    d = PitchDetector(sample_rate=8000, frame_size=1024, batch_size=3)
+    t = np.arange(1024) / 8000
+    frames = np.array([
+        0.5 * np.sin(2 * np.pi * freq * t) for freq in [110, 220, 440, 1000]
+    ] + [np.zeros(1024), 0.001 * np.sin(2 * np.pi * 440 * t), np.random.RandomState(0).uniform(-1, 1, 1024)])
+
+    freqs = d.estimate(frames)
+    assert freqs[:4] == pytest.approx([110, 220, 440, 1000], rel=0.005)
+    assert freqs[4:].tolist() == [0, 0, 0]
+
+
+def test_transcribe():
+    r = Renderer(harmonics=[1, 0.5, 0.25])
+    events = [Note(name='C'), Note(name='E', duration=1/2), Rest(duration=1/2), Note(name='A', octave=2), Note(name='G', octave=5, duration=1/4)]
+    samples = r.render(events)
+
+    d = PitchDetector()
+    result = list(d.transcribe(np.array_split(samples, 17)))
+
+    assert_events(result, [(0, 'C4', 1), (1, 'E4', 0.5), (1.5, None, 0.5), (2, 'A2', 1), (3, 'G5', 0.25)])
+    assert sum(event.duration for onset, event in result) == pytest.approx(d.get_duration(len(samples)))
+    assert list(d.transcribe([samples])) == result
+
+
+def test_feed_and_flush():
+    r = Renderer()
+    samples = r.render([Note(name='A'), Note(name='B')])
+
+    d = PitchDetector()
+    first = d.feed(samples[:30000])
+    assert first == []
+
+    second = d.feed(np.stack([samples[30000:], samples[30000:]], axis=1))
+    assert_events(second, [(0, 'A4', 1)])
+
+    assert_events(d.flush(), [(1, 'B4', 1)])
+    assert d.flush() == []
+
+
+def test_min_frames():
+    samples = np.concatenate([np.sin(2 * np.pi * 440 * np.arange(4000) / 8000), np.zeros(100), np.sin(2 * np.pi * 440 * np.arange(4000) / 8000)])
+
+    d = PitchDetector(sample_rate=8000, frame_size=1024, hop_size=64, min_frames=20)
+    assert_events(d.transcribe([samples]), [(0, 'A4', 0.51)])
+
+
+def test_pitches():
+    r = Renderer()
+    samples = r.render(Note(name='C#'))
+    scale = Scale.create_from_root(root=Note(name='C'), alt=Note.FLAT)
+
+    d = PitchDetector(alt=Note.FLAT)
+    assert_events(d.transcribe([samples]), [(0, 'Db4', 1)])
+
+    d = PitchDetector(pitches=scale.pitch_set)
+    assert describe(d.transcribe([samples]))[0][1] in ['C4', 'D4']
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_transcribe_many(tmpdir, processes):
+    r = Renderer()
+    paths = []
+    for name in ['C', 'E', 'G']:
+        path = str(tmpdir.join('{}.wav'.format(name)))
+        wav.write(path, r.render([Note(name=name, duration=1/2), Rest(duration=1/4)]))
+        paths.append(path)
+
+    result = transcribe_many(paths, processes=processes)
+    for events, name in zip(result, ['C', 'E', 'G']):
+        assert_events(events, [(0, '{}4'.format(name), 0.5), (0.5, None, 0.25)])
+    assert result[0] == transcribe_file(paths[0])
@@ -0,0 +1,121 @@
+import math
+
+import pytest
+
+from babs.pitch_table import PitchTable
+
+
+def test_create():
+    t = PitchTable([100, 200, 300], min_pitch=10)
+    assert len(t) == 3
+    assert t.min_pitch == 10
+    assert t.max_pitch == 12
+    assert 11 in t
+    assert 9 not in t
+    assert 13 not in t
+
+
+def test_get_freq():
+    t = PitchTable([100, 200, 300], min_pitch=10)
+    assert t.get_freq(10) == 100
+    assert t.get_freq(12) == 300
+    assert t.get_freq(9) is None
+    assert t.get_freq(13) is None
+
+
+def test_get_pitch():
+    t = PitchTable([100, 200, 300], min_pitch=10)
+    assert t.get_pitch(200) == 11
+    assert t.get_pitch(250) is None
+
+
+def test_equal_temperament():
+    t = PitchTable.equal_temperament()
+    assert len(t) == 128
+    assert t.get_freq(69) == 440
+    assert t.get_freq(57) == 220
+    assert t.get_freq(60) == 261.63
+    assert t.get_pitch(261.63) == 60
+
+    t = PitchTable.equal_temperament(a_frequency=432, min_pitch=21, max_pitch=108)
+    assert len(t) == 88
+    assert t.get_freq(69) == 432
+    assert t.get_freq(20) is None
+
+
+def test_nearest():
+    t = PitchTable.equal_temperament()
+    m = t.nearest(440)
+    assert m.pitch == 69
+    assert m.freq == 440
+    assert m.cents == 0
+
+    m = t.nearest(450)
+    assert m.pitch == 69
+    assert m.cents == pytest.approx(38.91, abs=0.01)
+
+    m = t.nearest(460)
+    assert m.pitch == 70
+    assert m.cents < 0
+
+    assert t.nearest(1).pitch == 0
+    assert t.nearest(100000).pitch == 127
+    assert t.nearest(0) is None
+    assert t.nearest(-10) is None
+
+
+def test_nearest_geometric_mean():
+    t = PitchTable([100, 200], min_pitch=10)
+    assert t.nearest(141).pitch == 10
+    assert t.nearest(142).pitch == 11
+    assert t.nearest(141).cents == pytest.approx(1200 * math.log(1.41, 2))
+
+
+def test_nearest_with_pitches():
+    t = PitchTable.equal_temperament()
+    assert t.nearest(450, pitches=[60, 64, 67]).pitch == 67
+    assert t.nearest(450, pitches={60, 64, 72}).pitch == 72
+    assert t.nearest(450, pitches=[200, 60]).pitch == 60
+    assert t.nearest(450, pitches=[]) is None
+    assert t.nearest(450, pitches=[None]) is None
+
+
+def test_nearest_brute_force():
+    t = PitchTable.equal_temperament()
+    pitches = [60, 62, 64, 65, 67, 69, 71]
+    for freq in [20, 100.5, 261.63, 270, 300, 415, 430, 500, 20000]:
+        expected = min(pitches, key=lambda p: abs(math.log(freq / t.get_freq(p))))
+        assert t.nearest(freq, pitches=pitches).pitch == expected
+
+
+def test_k_nearest():
+    t = PitchTable.equal_temperament()
+    matches = t.k_nearest(450, 3)
+    assert [m.pitch for m in matches] == [69, 70, 68]
+    assert matches[0] == t.nearest(450)
+
+    assert [m.pitch for m in t.k_nearest(1, 2)] == [0, 1]
+    assert [m.pitch for m in t.k_nearest(450, 5, pitches=[60, 69])] == [69, 60]
+    assert t.k_nearest(450, 0) == []
+    assert t.k_nearest(0, 3) == []
+
+
+def test_nearest_many():
+    np = pytest.importorskip('numpy')
+
+    t = PitchTable.equal_temperament()
+    freqs = [450, 460, 0, 1, 100000, 261.63]
+    pitches, cents = t.nearest_many(freqs)
+    assert pitches.tolist() == [69, 70, -1, 0, 127, 60]
+    assert cents[2] == 0
+    for freq, pitch, c in zip(freqs, pitches, cents):
+        if freq > 0:
+            m = t.nearest(freq)
+            assert m.pitch == pitch
+            assert m.cents == pytest.approx(c)
+
+    pitches, cents = t.nearest_many(np.array([450, 280]), pitches=[60, 62, 64])
+    assert pitches.tolist() == [64, 62]
+
+    pitches, cents = t.nearest_many([450], pitches=[])
+    assert pitches.tolist() == [-1]
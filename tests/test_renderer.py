@@ -0,0 +1,151 @@
+from __future__ import division
+
+import pickle
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Rest, Chord, Scale, NoteList
+from babs.renderer import Renderer
+
+
+def test_get_samples():
+    r = Renderer(sample_rate=1000, tempo=60)
+    assert r.get_samples(1/4) == 1000
+    assert r.get_samples(4/4) == 4000
+    assert r.get_samples(1/8) == 500
+
+    r = Renderer(sample_rate=1000, tempo=120)
+    assert r.get_samples(1/4) == 500
+
+
+def test_render_note():
+    r = Renderer(sample_rate=8000, tempo=60, amplitude=0.5)
+    samples = r.render(Note(name='A', duration=1/4))
+
+    assert samples.dtype == np.float32
+    assert len(samples) == 8000
+    assert samples[0] == 0
+    assert np.abs(samples).max() <= 0.5 + 1e-6
+    assert np.abs(samples).max() > 0.49
+
+    spectrum = np.abs(np.fft.rfft(samples))
+    assert np.argmax(spectrum) == 440
+
+
+def test_render_rest():
+    r = Renderer(sample_rate=1000, tempo=60)
+    samples = r.render(Rest(duration=1/4))
+
+    assert len(samples) == 1000
+    assert not samples.any()
+
+
+def test_render_sequence():
+    r = Renderer(sample_rate=1000, tempo=60)
+    events = [Note(name='A', duration=1/4), Rest(duration=1/2), Note(name='C', duration=1/8)]
+    samples = r.render(events)
+
+    assert len(samples) == 1000 + 2000 + 500
+    assert r.get_length(events) == 3500
+    assert samples[:1000].any()
+    assert not samples[1000:3000].any()
+    assert samples[3000:].any()
+
+
+def test_render_scale_is_sequential():
+    r = Renderer(sample_rate=1000, tempo=60)
+    s = Scale.create_from_root(root=Note(name='C'))
+
+    assert r.get_length(s) == len(s.notes) * 4000
+    assert len(r.render(s)) == len(s.notes) * 4000
+
+
+def test_render_chord_is_simultaneous():
+    r = Renderer(sample_rate=8000, tempo=60)
+    c = Chord(Note(name='A', octave=3, duration=1/4), Note(name='A', octave=4, duration=1/4))
+    samples = r.render(c)
+
+    assert len(samples) == 8000
+    spectrum = np.abs(np.fft.rfft(samples))
+    assert set(np.argsort(spectrum)[-2:]) == {220, 440}
+
+    samples = r.render([c, c])
+    assert len(samples) == 16000
+
+
+def test_render_chord_with_different_durations():
+    r = Renderer(sample_rate=1000, tempo=60)
+    c = Chord(Note(name='C', duration=1/4), Note(name='E', duration=1/2), strict=False)
+    samples = r.render(c)
+
+    assert len(samples) == 2000
+    assert samples[1500:1990].any()
+
+
+def test_harmonics():
+    r = Renderer(sample_rate=8000, tempo=60, harmonics=[1, 0.5])
+    samples = r.render(Note(name='A', octave=3, duration=1/4))
+
+    spectrum = np.abs(np.fft.rfft(samples))
+    assert set(np.argsort(spectrum)[-2:]) == {220, 440}
+
+
+def test_cache():
+    r = Renderer(sample_rate=1000, tempo=60)
+    r.render([Note(name='A', duration=1/4), Note(name='A', duration=1/4), Note(name='C', duration=1/4)])
+
+    info = r._cache.info()
+    assert info['hits'] == 1
+    assert info['misses'] == 2
+
+
+def test_cache_bytes():
+    r = Renderer(sample_rate=1000, tempo=60, cache_bytes=4000)
+    r.render([Note(name='A', duration=1/4), Note(name='C', duration=1/4), Note(name='A', duration=1)])
+
+    info = r._cache.info()
+    assert info['size'] == 1
+    assert info['nbytes'] == 4000
+    assert info['misses'] == 2
+
+
+def test_pickle_without_cache():
+    r = Renderer(sample_rate=1000, tempo=60, cache_size=8, cache_bytes=8000)
+    r.render(Note(name='A', duration=1/4))
+
+    copy = pickle.loads(pickle.dumps(r))
+    assert len(r._cache) == 1
+    assert len(copy._cache) == 0
+    assert copy._cache.info()['maxbytes'] == 8000
+    assert np.array_equal(copy.render(Note(name='A', duration=1/4)), r.render(Note(name='A', duration=1/4)))
+
+
+def test_stream():
+    r = Renderer(sample_rate=1000, tempo=60)
+    events = NoteList(Note(name='A', duration=1/4), Rest(duration=1/8), Note(name='C', duration=1/4), strict=False)
+
+    blocks = list(r.stream(events, block_size=300))
+    assert [len(b) for b in blocks] == [300] * 8 + [100]
+    assert all(b.dtype == np.float32 for b in blocks)
+    assert np.array_equal(np.concatenate(blocks), r.render(events))
+
+
+def test_stream_long_event():
+    r = Renderer(sample_rate=1000, tempo=60, cache_bytes=0)
+    r.SLICE_SIZE = 700
+    events = [Note(name='A', duration=1), Chord(Note(name='C', duration=1/2), Note(name='E', duration=1/4))]
+
+    blocks = list(r.stream(events, block_size=300))
+    assert sum(len(b) for b in blocks) == r.get_length(events) == 6000
+    assert len(r._cache) == 0
+
+    r.SLICE_SIZE = Renderer.SLICE_SIZE
+    assert np.allclose(np.concatenate(blocks), r.render(events), atol=1e-6)
+
+
+def test_stream_empty():
+    r = Renderer()
+    assert list(r.stream([])) == []
+    assert len(r.render([])) == 0
@@ -416,4 +416,33 @@ def test_repr():
     assert s.strict is True
 
     s = eval(repr(Scale.create_from_root(root=Note(name='C'), strict=False)))
-    assert s.strict is False
\ No newline at end of file
+    assert s.strict is False
+
+
+def test_transpose():
+    s = Scale.create_from_root(root=Note(name='C'), octave=Scale.OCTAVE_TYPE_FROM_ROOT)
+    s.transpose(7)
+
+    assert [n.name for n in s.notes] == ['G', 'A', 'B', 'C', 'D', 'E', 'F#']
+    assert s == Scale.create_from_root(root=Note(name='G'), octave=Scale.OCTAVE_TYPE_FROM_ROOT)
+    assert Note(name='F#', octave=5) in s
+    assert Note(name='F', octave=5) not in s
+
+    s.add_note(Note(name='F', octave=5))
+    assert [n.name for n in s.notes][-2:] == ['F', 'F#']
+
+    d = Scale.create_from_root(root=Note(name='C'), order=Scale.DESCENDING_SCALE_TYPE)
+    t = d.transposed(-12)
+    assert [n.octave for n in t.notes] == [3] * 7
+    assert [n.freq for n in t.notes] == sorted([n.freq for n in t.notes], reverse=True)
+    assert [n.octave for n in d.notes] == [4] * 7
+    assert t.notes[0] in t
+    assert t.notes[0] not in d
+
+
+def test_nearest():
+    s = Scale.create_from_root(root=Note(name='C'))
+    assert s.nearest(450).pitch == 69
+    assert s.nearest(280).pitch == 62
+    assert s.nearest(280).cents < 0
+    assert s.nearest(277.18).pitch in [60, 62]
@@ -0,0 +1,127 @@
+from __future__ import division
+
+import random
+
+from babs import Note, Rest, Chord
+from babs.sequence import Sequence
+
+
+def test_create():
+    s = Sequence()
+    assert len(s) == 0
+    assert s.end == 0
+    assert s.at(0) == []
+    assert s.overlap(0, 100) == []
+
+    events = [Note(name='C', duration=1/4), Rest(duration=1/8), Note(name='D', duration=1/2)]
+    s = Sequence(events, ticks_per_beat=96)
+    assert len(s) == 3
+    assert s.events == events
+    assert s.onsets == [0, 96, 144]
+    assert s.lengths == [96, 48, 192]
+    assert s.end == 336
+    assert list(s) == list(zip([0, 96, 144], events))
+    assert s[1] == (96, events[1])
+
+
+def test_chord_length():
+    c = Chord(Note(name='C', duration=1/4), Note(name='E', duration=1/2), strict=False)
+    s = Sequence([c, Note(name='G')], ticks_per_beat=96)
+
+    assert s.lengths == [192, 384]
+    assert s.onsets == [0, 192]
+
+
+def test_add():
+    s = Sequence(ticks_per_beat=96)
+    s.append(Note(name='C', duration=1/4))
+    s.add(Note(name='E', duration=1), 48)
+    s.append(Note(name='G', duration=1/4))
+
+    assert s.onsets == [0, 48, 432]
+    assert s.end == 528
+
+
+def test_at():
+    c, d, e = Note(name='C', duration=1/4), Note(name='D', duration=1/4), Note(name='E', duration=1)
+    s = Sequence([c, d], ticks_per_beat=96)
+    s.add(e, 48)
+
+    assert s.at(0) == [(0, c)]
+    assert s.at(48) == [(0, c), (48, e)]
+    assert s.at(96) == [(48, e), (96, d)]
+    assert s.at(200) == [(48, e)]
+    assert s.at(432) == []
+    assert s.at(-1) == []
+
+
+def test_overlap():
+    c, r, d = Note(name='C', duration=1/4), Rest(duration=1/4), Note(name='D', duration=1/4)
+    s = Sequence([c, r, d], ticks_per_beat=96)
+
+    assert s.overlap(0, 96) == [(0, c)]
+    assert s.overlap(95, 97) == [(0, c), (96, r)]
+    assert s.overlap(0, 1000) == [(0, c), (96, r), (192, d)]
+    assert s.overlap(288, 1000) == []
+    assert s.overlap(50, 50) == []
+
+
+def test_zero_length_events():
+    s = Sequence([Note(name='C', duration=0), Note(name='D', duration=1/4)], ticks_per_beat=96)
+
+    assert s.onsets == [0, 0]
+    assert [e.name for onset, e in s.at(0)] == ['D']
+
+
+def test_extend_and_concatenate():
+    a = Sequence([Note(name='C', duration=1/4)], ticks_per_beat=96)
+    b = Sequence([Note(name='D', duration=1/4)], ticks_per_beat=48)
+    b.add(Note(name='F', duration=1/4), 24)
+
+    c = a + b
+    assert c.onsets == [0, 96, 144]
+    assert c.lengths == [96, 96, 96]
+    assert c.end == 240
+    assert a.onsets == [0]
+
+    a += [Rest(duration=1/4)]
+    a += b
+    assert a.onsets == [0, 96, 192, 240]
+    assert [e.name for onset, e in a.at(250)] == ['D', 'F']
+
+    assert a.copy() == a
+    assert a.copy() is not a
+    assert a != c
+
+
+def test_extend_self():
+    s = Sequence([Note(name='C', duration=1/4), Note(name='D', duration=1/8)], ticks_per_beat=96)
+
+    s += s
+    assert s.onsets == [0, 96, 144, 240]
+    assert s.lengths == [96, 48, 96, 48]
+    assert s.end == 288
+    assert [e.name for e in s.events] == ['C', 'D', 'C', 'D']
+
+    s.extend(s)
+    assert len(s.events) == 8
+    assert s.end == 576
+
+
+def test_queries_match_scan():
+    random.seed(1)
+    s = Sequence(ticks_per_beat=4)
+    for i in range(300):
+        s.add(Note(name='C', duration=random.randint(0, 8) / 16), random.randint(0, 200))
+
+    intervals = [(onset, onset + length, p) for p, (onset, length) in enumerate(zip(s.onsets, s.lengths))]
+
+    def expected(positions):
+        return [(s.onsets[p], s.events[p]) for p in sorted(positions, key=lambda p: (s.onsets[p], p))]
+
+    for t in range(-2, 210):
+        assert s.at(t) == expected([p for start, end, p in intervals if start <= t < end])
+
+    for t0 in range(-2, 210, 7):
+        for t1 in range(t0, 215, 11):
+            assert s.overlap(t0, t1) == expected([p for start, end, p in intervals if start < t1 and end > t0 and start < end and t0 < t1])
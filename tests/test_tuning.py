@@ -0,0 +1,138 @@
+from __future__ import division
+
+import pytest
+
+from babs import Note, Chord, Scale
+from babs.tuning import Tuning, EqualTemperament, RatioTuning, JustIntonation, Pythagorean, ScalaTuning
+from babs.exceptions import TuningException
+
+
+SCALA = """! meantone.scl
+!
+Quarter-comma meantone, 5 notes and a comment
+ 5
+!
+ 193.157
+ 3/2 fifth
+ 5/4
+ 696.578
+ 2/1
+"""
+
+
+def test_equal_temperament():
+    t = EqualTemperament()
+    assert t.get_freq(69) == 440
+    assert t.get_table().freqs == Note.get_pitch_table().freqs
+
+    t = EqualTemperament(reference_frequency=432)
+    assert t.get_rounded_freq(69) == 432
+    assert t.get_rounded_freq(81) == 864
+    assert t.get_rounded_freq(200) == round(432 * 2 ** ((200 - 69) / 12), 2)
+
+    t = EqualTemperament(reference_frequency=256, reference_pitch=60)
+    assert t.get_freq(72) == 512
+
+
+def test_table_is_cached():
+    t = EqualTemperament()
+    assert t.get_table() is t.get_table()
+    assert len(t.get_table()) == 128
+
+
+def test_tuning_is_abstract():
+    with pytest.raises(TypeError):
+        Tuning()
+
+
+def test_just_intonation():
+    t = JustIntonation(tonic=60, tonic_frequency=264)
+    assert t.get_rounded_freq(60) == 264
+    assert t.get_rounded_freq(64) == 330
+    assert t.get_rounded_freq(67) == 396
+    assert t.get_rounded_freq(72) == 528
+    assert t.get_rounded_freq(55) == 198
+    assert t.get_rounded_freq(48) == 132
+
+    t = JustIntonation(tonic=69)
+    assert t.get_rounded_freq(69) == 440
+    assert t.get_rounded_freq(73) == 550
+
+
+def test_pythagorean():
+    t = Pythagorean(tonic=62, tonic_frequency=288)
+    assert t.get_rounded_freq(62) == 288
+    assert t.get_rounded_freq(69) == 432
+    assert t.get_rounded_freq(66) == 364.5
+    assert t.tonic_frequency == 288
+
+
+def test_ratio_tuning():
+    t = RatioTuning([1, 1.5], tonic=60, tonic_frequency=100, period=3)
+    assert [t.get_freq(p) for p in range(58, 64)] == pytest.approx([100 / 3, 50, 100, 150, 300, 450])
+
+    with pytest.raises(TuningException):
+        RatioTuning([])
+
+
+def test_scala():
+    t = ScalaTuning.parse(SCALA, tonic=60, tonic_frequency=100)
+    assert t.description == 'Quarter-comma meantone, 5 notes and a comment'
+    assert len(t.ratios) == 5
+    assert t.period == 2
+    assert t.get_rounded_freq(60) == 100
+    assert t.get_rounded_freq(61) == round(100 * 2 ** (193.157 / 1200), 2)
+    assert t.get_rounded_freq(62) == 150
+    assert t.get_rounded_freq(63) == 125
+    assert t.get_rounded_freq(65) == 200
+    assert t.get_rounded_freq(55) == 50
+
+
+def test_scala_file(tmpdir):
+    path = tmpdir.join('a.scl')
+    path.write(SCALA)
+
+    t = ScalaTuning.from_file(str(path))
+    assert t.get_rounded_freq(60) == Note(name='C').freq
+
+
+@pytest.mark.parametrize('text', ['', 'description', 'a\n3\n1/1\n2/1\n', 'a\nb\n', 'a\n1\n0/1\n', 'a\n1\n1/0\n'])
+def test_invalid_scala(text):
+    with pytest.raises(TuningException):
+        ScalaTuning.parse(text)
+
+
+def test_retune_note():
+    t = JustIntonation(tonic=60)
+    n = Note(name='E', octave=4, alt=Note.FLAT, duration=1/2)
+    r = n.retuned(t)
+
+    assert r is not n
+    assert n.freq == 329.63
+    assert r.freq == t.get_rounded_freq(64) == round(t.tonic_frequency * 5 / 4, 2)
+    assert r.name == 'E'
+    assert r.octave == 4
+    assert r.pitch == 64
+    assert r.alt == Note.FLAT
+    assert r.duration == 1/2
+
+    assert t.retune([n, 'x'])[1] == 'x'
+
+
+def test_retune_note_list():
+    t = EqualTemperament(reference_frequency=432)
+    c = Chord.create_from_root(root=Note(name='A'), octave=Chord.OCTAVE_TYPE_FROM_ROOT)
+    pitch_class_set = c.pitch_class_set
+
+    r = c.retuned(t)
+    assert [n.freq for n in r.notes] == [432, t.get_rounded_freq(73), t.get_rounded_freq(76)]
+    assert [n.name for n in r.notes] == ['A', 'C#', 'E']
+    assert r.pitch_class_set == pitch_class_set
+    assert r.notes[1] in r
+    assert r.notes[1] not in c
+    assert c.notes[0].freq == 440
+
+    s = Scale.create_from_root(root=Note(name='C'))
+    s.retune(JustIntonation(tonic=60))
+    assert [n.name for n in s.notes] == ['C', 'D', 'E', 'F', 'G', 'A', 'B']
+    assert s.select(name='G')[0].freq == round(Note(name='C').freq * 3 / 2, 2)
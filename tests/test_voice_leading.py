@@ -0,0 +1,104 @@
+from __future__ import division
+
+import itertools
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Chord
+from babs.pitch_class_set import PitchClassSet
+from babs.voice_leading import VoiceLeader, VoiceLeading
+
+
+def test_candidates():
+    v = VoiceLeader(low=60, high=72)
+    c = v.candidates(PitchClassSet(0, 4, 7), 3)
+
+    assert c.shape[1] == 3
+    assert all(list(row) == sorted(row) for row in c.tolist())
+    assert all(set(p % 12 for p in row) == {0, 4, 7} for row in c.tolist())
+    assert all(60 <= p <= 72 for p in c.ravel())
+    assert sorted(map(tuple, c.tolist())) == [(60, 64, 67), (64, 67, 72)]
+    assert v.candidates(PitchClassSet(0, 4, 7), 3) is c
+
+    c = v.candidates(PitchClassSet(0, 4, 7), 4)
+    assert (60, 64, 67, 72) in map(tuple, c.tolist())
+
+    with pytest.raises(ValueError):
+        v.candidates(PitchClassSet(0, 4, 7), 2)
+
+    with pytest.raises(ValueError):
+        VoiceLeader(low=60, high=62).candidates(PitchClassSet(0, 4, 7), 3)
+
+    with pytest.raises(ValueError):
+        VoiceLeader(low=60, high=50)
+
+
+def test_candidates_limits():
+    v = VoiceLeader(low=36, high=96, max_span=12, max_candidates=5)
+    c = v.candidates(PitchClassSet(0, 4, 7, 11), 4)
+
+    assert len(c) == 5
+    assert all(row[-1] - row[0] <= 12 for row in c.tolist())
+
+
+def test_costs():
+    a = np.array([[60, 64, 67], [64, 67, 72]])
+    b = np.array([[60, 65, 69]])
+
+    assert VoiceLeader.costs(a, b).tolist() == [[3], [9]]
+
+
+def test_solve_is_optimal():
+    v = VoiceLeader(low=55, high=74)
+    chords = [
+        Chord.create_from_root(root=Note(name='D'), chord_type=Chord.MINOR_SEVEN_TYPE),
+        Chord.create_from_root(root=Note(name='G'), chord_type=Chord.DOMINANT_TYPE),
+        Chord.create_from_root(root=Note(name='C'), chord_type=Chord.MAJOR_SEVEN_TYPE),
+    ]
+
+    result = v.solve(chords)
+    assert isinstance(result, VoiceLeading)
+    assert result.pitches.shape == (3, 4)
+
+    candidates = [v.candidates(c.pitch_class_set, 4) for c in chords]
+    best = min(
+        sum(np.abs(a - b).sum() for a, b in zip(path, path[1:]))
+        for path in itertools.product(*candidates)
+    )
+    assert result.cost == best
+    assert sum(np.abs(a - b).sum() for a, b in zip(result.pitches, result.pitches[1:])) == best
+
+
+def test_lead():
+    v = VoiceLeader(low=48, high=72, alt=Note.FLAT)
+    chords = [
+        Chord.create_from_root(root=Note(name='C')),
+        Chord.create_from_root(root=Note(name='F')),
+        Chord.create_from_root(root=Note(name='G'), chord_type=Chord.DOMINANT_TYPE),
+        Chord.create_from_root(root=Note(name='C')),
+    ]
+    for n in chords[1].notes:
+        n.duration = 1/2
+
+    led = v.lead(iter(chords))
+    assert len(led) == 4
+    assert all(isinstance(c, Chord) for c in led)
+    assert all(len(c.notes) == 4 for c in led)
+    assert [c.pitch_class_set for c in led] == [c.pitch_class_set for c in chords]
+    assert all(n.duration == 1/2 for n in led[1].notes)
+    assert all(48 <= n.pitch <= 72 for c in led for n in c.notes)
+
+    assert v.solve([]).pitches.shape == (0, 0)
+    assert v.lead([]) == []
+
+
+def test_long_progression():
+    v = VoiceLeader(voices=5, max_candidates=64)
+    roots = ['C', 'A', 'D', 'G'] * 250
+    chords = [Chord.create_from_root(root=Note(name=r), chord_type=Chord.MINOR_SEVEN_TYPE) for r in roots]
+
+    result = v.solve(chords)
+    assert result.pitches.shape == (1000, 5)
+    assert v._candidates.info()['size'] == 4
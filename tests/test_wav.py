@@ -0,0 +1,138 @@
+from __future__ import division
+
+import wave
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from babs import Note, Rest, Chord
+from babs.renderer import Renderer
+from babs import wav
+
+
+def read(path):
+    with wave.open(str(path), 'rb') as w:
+        params = (w.getnchannels(), w.getsampwidth(), w.getframerate(), w.getnframes())
+        data = w.readframes(w.getnframes())
+
+    return params, data
+
+
+def test_get_header():
+    header = wav.get_header(100, sample_rate=8000, channels=2, sample_width=2)
+    assert len(header) == wav.HEADER_SIZE == 44
+    assert header[:4] == b'RIFF'
+    assert header[8:16] == b'WAVEfmt '
+    assert header[36:40] == b'data'
+
+
+def test_invalid_sample_width(tmpdir):
+    with pytest.raises(ValueError):
+        wav.WavWriter(str(tmpdir.join('a.wav')), sample_width=3)
+
+
+def test_write(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    samples = np.array([0, 0.5, -0.5, 1, -1, 2, -2])
+    wav.write(path, samples, sample_rate=8000)
+
+    params, data = read(path)
+    assert params == (1, 2, 8000, 7)
+    assert np.frombuffer(data, dtype='<i2').tolist() == [0, 16384, -16384, 32767, -32767, 32767, -32767]
+
+
+def test_write_stereo_32_bit(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    samples = np.array([[0, 1], [0.5, -0.5], [1, 0]])
+    wav.write(path, samples, sample_rate=1000, sample_width=4)
+
+    params, data = read(path)
+    assert params == (2, 4, 1000, 3)
+    assert np.frombuffer(data, dtype='<i4').tolist() == [0, 2147483647, 1073741824, -1073741824, 2147483647, 0]
+
+
+def test_writer_buffers(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    samples = np.linspace(-1, 1, 1000)
+
+    with wav.WavWriter(path, sample_rate=1000, buffer_size=64) as w:
+        w.write(samples[:300])
+        w.write_blocks([samples[300:700], samples[700:]])
+
+    assert w.closed
+    assert w.frames == 1000
+    params, data = read(path)
+    assert params == (1, 2, 1000, 1000)
+    assert np.array_equal(np.frombuffer(data, dtype='<i2'), np.rint(samples * 32767).astype(np.int16))
+
+    with pytest.raises(ValueError):
+        wav.WavWriter(str(tmpdir.join('b.wav')), channels=2).write([0, 1, 0])
+
+
+def test_write_memmap(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    samples = np.linspace(-1, 1, 1000)
+    wav.write_memmap(path, [samples[:400], samples[400:]], 1000, sample_rate=1000)
+
+    params, data = read(path)
+    assert params == (1, 2, 1000, 1000)
+    assert np.array_equal(np.frombuffer(data, dtype='<i2'), np.rint(samples * 32767).astype(np.int16))
+
+    path = str(tmpdir.join('b.wav'))
+    wav.write_memmap(path, [], 0)
+    assert read(path) == ((1, 2, 44100, 0), b'')
+
+
+@pytest.mark.parametrize('memmap', [False, True])
+def test_write_events(tmpdir, memmap):
+    r = Renderer(sample_rate=1000, tempo=60)
+    events = [Note(name='A', duration=1/4), Rest(duration=1/8), Chord.create_from_root(root=Note(name='C', duration=1/4))]
+    path = str(tmpdir.join('a.wav'))
+
+    assert wav.write_events(path, iter(events), renderer=r, block_size=128, memmap=memmap) == path
+
+    params, data = read(path)
+    assert params == (1, 2, 1000, r.get_length(events))
+    assert np.array_equal(np.frombuffer(data, dtype='<i2'), np.rint(r.render(events) * 32767).astype(np.int16))
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_export_many(tmpdir, processes):
+    r = Renderer(sample_rate=1000, tempo=60)
+    jobs = [(str(tmpdir.join('{}.wav'.format(name))), Note(name=name, duration=1/4)) for name in ['C', 'D', 'E']]
+
+    paths = wav.export_many(jobs, renderer=r, processes=processes)
+    assert paths == [path for path, events in jobs]
+
+    for path, events in jobs:
+        params, data = read(path)
+        assert params == (1, 2, 1000, 1000)
+        assert np.array_equal(np.frombuffer(data, dtype='<i2'), np.rint(r.render(events) * 32767).astype(np.int16))
+
+
+def test_read(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    samples = np.array([[0, 1], [0.5, -0.5], [1, 0]])
+    wav.write(path, samples, sample_rate=1000, sample_width=4)
+
+    data, sample_rate = wav.read(path)
+    assert sample_rate == 1000
+    assert data.shape == (3, 2)
+    assert np.allclose(data, samples, atol=1e-9)
+
+    data, sample_rate = wav.read(path, mono=True)
+    assert np.allclose(data, [0.5, 0, 0.5], atol=1e-9)
+
+
+def test_reader_blocks(tmpdir):
+    path = str(tmpdir.join('a.wav'))
+    samples = np.linspace(-1, 1, 1000)
+    wav.write(path, samples, sample_rate=1000)
+
+    with wav.WavReader(path) as r:
+        assert (r.sample_rate, r.channels, r.sample_width, r.frames) == (1000, 1, 2, 1000)
+        blocks = list(r.blocks(block_size=300))
+
+    assert [len(b) for b in blocks] == [300, 300, 300, 100]
+    assert np.allclose(np.concatenate(blocks), samples, atol=1 / 32767)